@@ -0,0 +1,53 @@
+"""
+Compare calling a function that is decorated with ``inject`` with calling the
+same function after ``bind`` and calling it directly.
+
+Run with: ``python -m benchmarks.bench_bind``
+"""
+import time
+from jacked import Container, bind, inject, injectable
+
+
+NUMBER_OF_CALLS = 100000
+
+container = Container()
+
+
+@injectable(container=container, singleton=True)
+class Db:
+    pass
+
+
+@injectable(container=container, singleton=True)
+class Cache:
+    pass
+
+
+def process(record: int, db: Db, cache: Cache):
+    return record
+
+
+def _measure(func) -> float:
+    start = time.perf_counter()
+    for record in range(NUMBER_OF_CALLS):
+        func(record)
+    return time.perf_counter() - start
+
+
+def main():
+    injected = inject(process, container=container)
+    bound = bind(process, container=container)
+    rebound = bind(process, container=container, rebind=True)
+    db, cache = Db(), Cache()
+
+    print('{} calls'.format(NUMBER_OF_CALLS))
+    print('  @inject:            {:.1f} ms'.format(
+        _measure(injected) * 1000))
+    print('  bind:               {:.1f} ms'.format(_measure(bound) * 1000))
+    print('  bind(rebind=True):  {:.1f} ms'.format(_measure(rebound) * 1000))
+    print('  direct:             {:.1f} ms'.format(
+        _measure(lambda record: process(record, db, cache)) * 1000))
+
+
+if __name__ == '__main__':
+    main()
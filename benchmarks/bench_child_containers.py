@@ -0,0 +1,56 @@
+"""
+Measure the time and memory that it takes to create many overlay containers
+of one parent ``Container`` and to inject from them.
+
+Run with: ``python -m benchmarks.bench_child_containers``
+"""
+import time
+import tracemalloc
+from jacked import Container, Injectable
+from jacked._inject import inject_here
+
+
+NUMBER_OF_INJECTABLES = 500
+NUMBER_OF_CHILDREN = 10000
+
+
+class Base:
+    pass
+
+
+def _create_parent() -> Container:
+    parent = Container()
+    for i in range(NUMBER_OF_INJECTABLES):
+        cls = type('Impl{}'.format(i), (Base,), {})
+        parent.register(Injectable(subject=cls, priority=i, singleton=False,
+                                   meta={'name': cls.__name__}))
+    return parent
+
+
+def main():
+    parent = _create_parent()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    children = [Container(parent=parent) for _ in range(NUMBER_OF_CHILDREN)]
+    duration = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('Created {} children of a container with {} injectables'
+          .format(NUMBER_OF_CHILDREN, NUMBER_OF_INJECTABLES))
+    print('  time:   {:.1f} ms ({:.2f} us per child)'
+          .format(duration * 1000, duration * 1e6 / NUMBER_OF_CHILDREN))
+    print('  memory: {:.1f} KiB ({:.0f} bytes per child)'
+          .format(size / 1024, size / NUMBER_OF_CHILDREN))
+
+    start = time.perf_counter()
+    for child in children[:100]:
+        inject_here(Base, container=child)
+    duration = time.perf_counter() - start
+    print('  first injection from 100 children: {:.1f} ms'
+          .format(duration * 1000))
+
+
+if __name__ == '__main__':
+    main()
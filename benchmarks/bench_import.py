@@ -0,0 +1,40 @@
+"""
+Measure how long ``import jacked`` takes in a fresh interpreter and which
+modules take the most time.
+
+Run with: ``python -m benchmarks.bench_import``
+"""
+import subprocess
+import sys
+
+
+RUNS = 10
+
+
+def _import_times() -> list:
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import jacked'],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+    result = []
+    for line in output.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            result.append((int(parts[1]), parts[2].strip()))
+    return result
+
+
+def main():
+    totals = []
+    for _ in range(RUNS):
+        times = dict((module, cumulative)
+                     for cumulative, module in _import_times())
+        totals.append(times['jacked'])
+    print('import jacked: {:.1f} ms (best of {})'
+          .format(min(totals) / 1000, RUNS))
+    print('Slowest modules (cumulative):')
+    for cumulative, module in sorted(_import_times(), reverse=True)[:10]:
+        print('  {:8.1f} ms  {}'.format(cumulative / 1000, module))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Compare creating many instances that get a dependency injected in
+``__init__`` with instances that use an ``injected`` attribute.
+
+Run with: ``python -m benchmarks.bench_injected``
+"""
+import time
+from jacked import Container, inject, injectable, injected
+
+
+NUMBER_OF_INSTANCES = 1000000
+
+container = Container()
+
+
+@injectable(container=container, singleton=True)
+class Db:
+    pass
+
+
+class InitOrder:
+    @inject(container=container)
+    def __init__(self, db: Db):
+        self.db = db
+
+
+class InstanceOrder:
+    db: Db = injected(container=container)
+
+
+class ClassOrder:
+    db: Db = injected(container=container, per_class=True)
+
+
+def _measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _create(cls, access_every: int):
+    for i in range(NUMBER_OF_INSTANCES):
+        instance = cls()
+        if i % access_every == 0:
+            instance.db
+
+
+def main():
+    print('Creating {} instances'.format(NUMBER_OF_INSTANCES))
+    duration = _measure(lambda: _create(InitOrder, 1))
+    print('  @inject __init__:        {:.1f} ms'.format(duration * 1000))
+    for access_every in (NUMBER_OF_INSTANCES, 100, 1):
+        print('  accessing db on 1 in {} instances:'.format(access_every))
+        for name, cls in (('injected()', InstanceOrder),
+                          ('injected(per_class)', ClassOrder)):
+            duration = _measure(lambda: _create(cls, access_every))
+            print('    {:21} {:.1f} ms'.format(name + ':', duration * 1000))
+
+
+if __name__ == '__main__':
+    main()
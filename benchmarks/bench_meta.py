@@ -0,0 +1,55 @@
+"""
+Measure method calls on instances of a class that was injected from two
+containers that registered it with different meta data.
+
+Run with: ``python -m benchmarks.bench_meta``
+"""
+import time
+from jacked import Container, inject_here, injectable
+
+
+NUMBER_OF_INJECTIONS = 100000
+CALLS_PER_INJECTION = 20
+
+
+class Plain:
+    def sound(self):
+        return 'meow'
+
+
+class Cat:
+    def sound(self):
+        return 'meow'
+
+
+container1 = Container()
+container2 = Container()
+injectable(Cat, container=container1, meta={'color': 'black'})
+injectable(Cat, container=container2, meta={'color': 'white'})
+
+
+def _calls(instances):
+    for instance in instances:
+        for _ in range(CALLS_PER_INJECTION):
+            instance.sound()
+
+
+def _measure(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    # Only the method calls are timed; the instances are created beforehand.
+    plain = [Plain() for _ in range(NUMBER_OF_INJECTIONS)]
+    injected = [inject_here(Cat, container=container1 if i % 2 else container2)
+                for i in range(NUMBER_OF_INJECTIONS)]
+    print('{} method calls'.format(NUMBER_OF_INJECTIONS * CALLS_PER_INJECTION))
+    print('  plain class:    {:.1f} ms'.format(_measure(_calls, plain) * 1000))
+    print('  injected class: {:.1f} ms'.format(
+        _measure(_calls, injected) * 1000))
+
+
+if __name__ == '__main__':
+    main()
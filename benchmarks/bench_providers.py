@@ -0,0 +1,59 @@
+"""
+Measure resolving a singleton that is created by a provider function among
+many other injectables, with the candidates indexed per hint against
+scanning all injectables on every resolution.
+
+Run with: ``python -m benchmarks.bench_providers``
+"""
+import time
+from jacked import Container, inject_here, injectable
+from jacked._inject import _find_indexed, _get_matcher
+
+
+NUMBER_OF_INJECTABLES = 500
+NUMBER_OF_LOOKUPS = 20000
+
+
+class Redis:
+    def __init__(self, url: str):
+        self.url = url
+
+
+container = Container()
+for i in range(NUMBER_OF_INJECTABLES):
+    injectable(type('Service{}'.format(i), (), {}), container=container,
+               priority=1)
+
+
+@injectable(container=container, provides=True, singleton=True)
+def create_redis() -> Redis:
+    return Redis('redis://localhost')
+
+
+def _scanned():
+    matcher = _get_matcher(Redis)
+    for _ in range(NUMBER_OF_LOOKUPS):
+        injectables = _find_indexed(Redis, matcher, container)
+        matcher.match(Redis, injectables[0], container)
+
+
+def _indexed():
+    for _ in range(NUMBER_OF_LOOKUPS):
+        inject_here(Redis, container=container)
+
+
+def _measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    print('{} lookups among {} injectables'.format(NUMBER_OF_LOOKUPS,
+                                                   NUMBER_OF_INJECTABLES))
+    print('  scanned: {:.1f} ms'.format(_measure(_scanned) * 1000))
+    print('  indexed: {:.1f} ms'.format(_measure(_indexed) * 1000))
+
+
+if __name__ == '__main__':
+    main()
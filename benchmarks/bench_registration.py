@@ -0,0 +1,52 @@
+"""
+Compare registering many injectables one by one with registering them in
+bulk.
+
+Run with: ``python -m benchmarks.bench_registration``
+"""
+import time
+from jacked import Container, Injectable
+
+
+NUMBER_OF_INJECTABLES = 100000
+
+
+def _create_injectables():
+    return [Injectable(subject=type('Impl{}'.format(i), (), {}), priority=0,
+                       singleton=False, meta={'name': 'Impl{}'.format(i)})
+            for i in range(NUMBER_OF_INJECTABLES)]
+
+
+def _measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    injectables = _create_injectables()
+
+    container = Container()
+
+    def one_by_one():
+        for injectable in injectables:
+            container.register(injectable)
+
+    bulk_container = Container()
+
+    def bulk():
+        bulk_container.register_many(injectables)
+
+    print('Registering {} injectables'.format(NUMBER_OF_INJECTABLES))
+    print('  one by one:    {:.1f} ms'.format(_measure(one_by_one) * 1000))
+    print('  register_many: {:.1f} ms'.format(_measure(bulk) * 1000))
+
+    half = injectables[::2]
+    duration = _measure(lambda: bulk_container.unregister(*half))
+    print('  unregister {}:  {:.1f} ms'.format(len(half), duration * 1000))
+    duration = _measure(lambda: bulk_container.replace(*half))
+    print('  replace {}:     {:.1f} ms'.format(len(half), duration * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Measure resolving singletons that implement many interfaces, each of which is
+requested as a separate hint.
+
+Run with: ``python -m benchmarks.bench_singletons``
+"""
+import time
+import tracemalloc
+from jacked import Container, inject_here, injectable
+
+
+NUMBER_OF_SINGLETONS = 100
+NUMBER_OF_INTERFACES = 20
+ROUNDS = 100
+
+
+def _create_container():
+    # Every singleton implements its own interfaces.
+    container = Container()
+    subjects = []
+    for i in range(NUMBER_OF_SINGLETONS):
+        name = 'Service{}'.format(i)
+        interfaces = tuple(type('{}Interface{}'.format(name, j), (), {})
+                           for j in range(NUMBER_OF_INTERFACES))
+        # Every singleton holds some state to make its footprint visible:
+        subject = type(name, interfaces, {'__init__': _init,
+                                          'constructed': 0})
+        injectable(subject, container=container, singleton=True)
+        subjects.append(subject)
+    return container, subjects
+
+
+def _init(self):
+    type(self).constructed += 1
+    self.state = bytearray(1024)
+
+
+def main():
+    container, subjects = _create_container()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for subject in subjects:
+        inject_here(subject, container=container)
+        for interface in subject.__bases__:
+            inject_here(interface, container=container)
+    first = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for subject in subjects:
+            inject_here(subject, container=container)
+    again = (time.perf_counter() - start) / ROUNDS
+
+    constructed = sum(subject.constructed for subject in subjects)
+    print('{} singletons with {} interfaces each'
+          .format(NUMBER_OF_SINGLETONS, NUMBER_OF_INTERFACES))
+    print('  constructed:        {}'.format(constructed))
+    print('  first resolutions:  {:.1f} ms'.format(first * 1000))
+    print('  peak memory:        {:.0f} KiB'.format(peak / 1024))
+    print('  later resolutions:  {:.2f} ms per round'.format(again * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Measure the start-up of ``spawn`` worker processes that either discover all
+injectables again or load a snapshot of the registry.
+
+Run with: ``python -m benchmarks.bench_snapshot``
+"""
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from jacked import discover
+from jacked._container import DEFAULT_CONTAINER
+
+
+NUMBER_OF_PLUGINS = 200
+NUMBER_OF_OTHER_MODULES = 400
+NUMBER_OF_WORKERS = 4
+RUNS = 3
+
+PLUGIN = '''from jacked import injectable
+
+
+@injectable
+class Plugin{0}:
+{1}
+'''
+OTHER = '''class Helper{0}:
+{1}
+'''
+METHOD = '''    def method{0}(self, x):
+        return x + {0}
+'''
+
+
+def _create_tree(directory: Path):
+    # Create a plugin tree with modules with and without injectables.
+    body = ''.join(METHOD.format(i) for i in range(30))
+    for i in range(NUMBER_OF_PLUGINS):
+        path = directory.joinpath('plugin_{}.py'.format(i))
+        path.write_text(PLUGIN.format(i, body))
+    for i in range(NUMBER_OF_OTHER_MODULES):
+        path = directory.joinpath('other_{}.py'.format(i))
+        path.write_text(OTHER.format(i, body))
+
+
+def _init_discover(directory: str):
+    discover(directory)
+
+
+def _init_snapshot(snapshot):
+    DEFAULT_CONTAINER.load_snapshot(snapshot)
+
+
+def _count() -> int:
+    time.sleep(0.05)  # Make sure that every worker gets a task.
+    return len(DEFAULT_CONTAINER.injectables)
+
+
+def _start_workers(initializer=None, initargs=()) -> float:
+    # Return the time it takes until all workers have completed a task.
+    context = multiprocessing.get_context('spawn')
+    start = time.perf_counter()
+    with ProcessPoolExecutor(NUMBER_OF_WORKERS, mp_context=context,
+                             initializer=initializer,
+                             initargs=initargs) as executor:
+        futures = [executor.submit(_count) for _ in range(NUMBER_OF_WORKERS)]
+        counts = {future.result() for future in futures}
+        duration = time.perf_counter() - start
+    assert initializer is None or counts == {NUMBER_OF_PLUGINS}, counts
+    return duration
+
+
+def _best_of(func) -> float:
+    return min(func() for _ in range(RUNS))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        _create_tree(Path(directory))
+        discover(directory)
+        snapshot = DEFAULT_CONTAINER.snapshot()
+
+        print('Starting {} spawn workers with {} plugins and {} other modules'
+              .format(NUMBER_OF_WORKERS, NUMBER_OF_PLUGINS,
+                      NUMBER_OF_OTHER_MODULES))
+        duration = _best_of(lambda: _start_workers())
+        print('  no initializer: {:.1f} ms'.format(duration * 1000))
+        duration = _best_of(lambda: _start_workers(_init_discover,
+                                                   (directory,)))
+        print('  discover:       {:.1f} ms'.format(duration * 1000))
+        duration = _best_of(lambda: _start_workers(_init_snapshot,
+                                                   (snapshot,)))
+        print('  load_snapshot:  {:.1f} ms'.format(duration * 1000))
+
+
+if __name__ == '__main__':
+    main()
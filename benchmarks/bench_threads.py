@@ -0,0 +1,99 @@
+"""
+Measure the throughput of a mixed workload (``inject_here``, ``inject``,
+``List[...]`` injection and late registrations) from 1 up to 32 threads and
+check that singletons stay unique and that no registrations get lost.
+
+On a free-threaded build of CPython (e.g. ``python3.13t``), the threads run
+in parallel.
+
+Run with: ``python -m benchmarks.bench_threads``
+"""
+import sys
+import threading
+import time
+from typing import List
+from jacked import Container, Injectable, inject, inject_here, injectable
+
+
+OPERATIONS_PER_THREAD = 2000
+REGISTER_EVERY = 100
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+class Animal:
+    pass
+
+
+def _create_container() -> Container:
+    container = Container()
+    injectable(Animal, container=container, name='Animal')
+    for i in range(20):
+        injectable(type('Animal{}'.format(i), (Animal,), {}),
+                   container=container, singleton=i % 2 == 0)
+    return container
+
+
+def _work(container: Container, index: int, seen: set):
+    @inject(container=container)
+    def func(animals: List[Animal]):
+        return animals
+
+    subject0 = container.get_by_name('Animal0').subject
+    for i in range(OPERATIONS_PER_THREAD):
+        operation = i % 4
+        if operation == 0:
+            seen.add(id(inject_here(subject0, container=container)))
+        elif operation == 1:
+            func()
+        elif operation == 2:
+            inject_here(List[Animal], container=container)
+        if i % REGISTER_EVERY == 0:
+            name = 'Late{}_{}'.format(index, i)
+            container.register(Injectable(
+                subject=type(name, (Animal,), {}), priority=0,
+                singleton=False, meta={'name': name}))
+
+
+def _run(number_of_threads: int) -> float:
+    # Return the number of operations per second.
+    container = _create_container()
+    number_of_injectables = len(container.injectables)
+    seen = set()
+    barrier = threading.Barrier(number_of_threads + 1)
+
+    def target(index):
+        barrier.wait()
+        _work(container, index, seen)
+
+    threads = [threading.Thread(target=target, args=(i,))
+               for i in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start
+
+    registrations = (number_of_threads * OPERATIONS_PER_THREAD
+                     // REGISTER_EVERY)
+    assert len(seen) == 1, 'Singleton was created more than once'
+    assert (len(container.injectables)
+            == number_of_injectables + registrations), 'Lost registrations'
+    return number_of_threads * OPERATIONS_PER_THREAD / duration
+
+
+def main():
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python {} (GIL {})'.format(
+        sys.version.split()[0], 'enabled' if is_gil_enabled else 'disabled'))
+    base = None
+    for number_of_threads in THREAD_COUNTS:
+        throughput = _run(number_of_threads)
+        base = base or throughput
+        print('  {:2} threads: {:9.0f} ops/s ({:.2f}x)'
+              .format(number_of_threads, throughput, throughput / base))
+
+
+if __name__ == '__main__':
+    main()
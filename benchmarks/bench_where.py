@@ -0,0 +1,54 @@
+"""
+Measure selecting an injectable by its meta data with ``where`` against
+injecting a list and filtering it in Python.
+
+Run with: ``python -m benchmarks.bench_where``
+"""
+import time
+from jacked import Container, get_candidates, inject_here, injectable
+
+
+NUMBER_OF_INJECTABLES = 200
+NUMBER_OF_LOOKUPS = 2000
+REGIONS = ('eu', 'us', 'asia', 'africa')
+
+
+class Db:
+    pass
+
+
+container = Container()
+for i in range(NUMBER_OF_INJECTABLES):
+    subject = type('Db{}'.format(i), (Db,), {})
+    injectable(subject, container=container, name=subject.__name__,
+               meta={'region': REGIONS[i % len(REGIONS)], 'shard': i})
+
+
+def _filtered():
+    for i in range(NUMBER_OF_LOOKUPS):
+        dbs = get_candidates(Db, container=container)
+        next(db for db in dbs
+             if container.meta_of(db).shard == i % NUMBER_OF_INJECTABLES)
+
+
+def _where():
+    for i in range(NUMBER_OF_LOOKUPS):
+        inject_here(Db, container=container,
+                    where={'shard': i % NUMBER_OF_INJECTABLES})
+
+
+def _measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    print('{} lookups among {} injectables'.format(NUMBER_OF_LOOKUPS,
+                                                   NUMBER_OF_INJECTABLES))
+    print('  filter a list: {:.1f} ms'.format(_measure(_filtered) * 1000))
+    print('  where:         {:.1f} ms'.format(_measure(_where) * 1000))
+
+
+if __name__ == '__main__':
+    main()
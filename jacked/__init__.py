@@ -1,9 +1,13 @@
+import sys
+from importlib import import_module
 import jacked._inject
+import jacked._injected
 import jacked._injectable
 import jacked._container
 import jacked._typing
-import jacked._discover
 import jacked._exceptions
+import jacked._qualifiers
+import jacked._lazy
 
 
 # Types:
@@ -13,13 +17,55 @@ T = jacked._typing.T
 Module = jacked._typing.Module
 NoneType = jacked._typing.NoneType
 AttrDict = jacked._typing.AttrDict
+Named = jacked._qualifiers.Named
+KeyedBy = jacked._qualifiers.KeyedBy
+Where = jacked._qualifiers.Where
+Lazy = jacked._lazy.Lazy
+Provider = jacked._lazy.Provider
 
 # Functions:
 inject = jacked._inject.inject
+bind = jacked._inject.bind
 injectable = jacked._injectable.injectable
-discover = jacked._discover.discover
+inject_here = jacked._inject.inject_here
+injected = jacked._injected.injected
+inject_many = jacked._inject.inject_many
+get_candidates = jacked._inject.get_candidates
+get_candidates_many = jacked._inject.get_candidates_many
 
 # Exceptions:
 JackedError = jacked._exceptions.JackedError
 InvalidUsageError = jacked._exceptions.InvalidUsageError
 InjectionError = jacked._exceptions.InjectionError
+PoolExhaustedError = jacked._exceptions.PoolExhaustedError
+
+# Attributes that are not needed for decorating and that are imported upon
+# their first use (to keep "import jacked" fast):
+_LAZY_ATTRIBUTES = {
+    'Hook': ('jacked._hooks', 'Hook'),
+    'ContainerSnapshot': ('jacked._snapshot', 'ContainerSnapshot'),
+    'discover': ('jacked._discover', 'discover'),
+    'watch': ('jacked._discover', 'watch'),
+    'Watcher': ('jacked._discover', 'Watcher'),
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name, attr = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError('module {!r} has no attribute {!r}'
+                             .format(__name__, name)) from None
+    result = getattr(import_module(module_name), attr)
+    globals()[name] = result
+    return result
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+# Python3.5-3.6: modules do not support __getattr__.
+if sys.version_info < (3, 7):
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
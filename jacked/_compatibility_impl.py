@@ -4,7 +4,9 @@ PRIVATE MODULE: do not import (from) it directly.
 This module contains functionality for supporting the compatibility with
 multiple Python versions.
 """
+import inspect
 import sys
+from types import SimpleNamespace
 from typing import (
     get_type_hints as get_type_hints_,
     Type,
@@ -31,20 +33,50 @@ def get_naked_class(cls: type) -> type:
     return getattr(cls, attr, cls)
 
 
-def get_type_hints(func: callable) -> Dict[str, type]:
+def get_type_hints(
+        func: callable,
+        include_extras: bool = False) -> Dict[str, type]:
     """
     Return the type hints of the parameters of the given callable.
     :param func: the callable of which the type hints are to be returned.
+    :param include_extras: if ``True``, ``Annotated`` hints are kept as is.
     :return: a dict with parameter names and their types.
     """
+    # Python3.5-3.8: get_type_hints has no include_extras.
+    kwargs = {}
+    if include_extras and sys.version_info >= (3, 9):
+        kwargs['include_extras'] = True
     # Python3.5: get_type_hints raises on classes without explicit constructor
     try:
-        result = get_type_hints_(func)
+        result = get_type_hints_(func, **kwargs)
     except AttributeError:
         result = {}
     return result
 
 
+def evaluate_hint(
+        hint: object,
+        func: callable,
+        include_extras: bool = False) -> object:
+    """
+    Evaluate the given hint, which is or contains a string, in the global
+    namespace of the given callable. Unlike ``get_type_hints``, only this one
+    hint is evaluated and a default of ``None`` does not make it ``Optional``.
+    :param hint: the hint that is to be evaluated (e.g. ``'Dog'``).
+    :param func: the callable or class that the hint belongs to.
+    :param include_extras: if ``True``, ``Annotated`` hints are kept as is.
+    :return: the evaluated hint.
+    """
+    if inspect.isclass(func):
+        module = sys.modules.get(func.__module__)
+        globalns = vars(module) if module else {}
+    else:
+        globalns = getattr(inspect.unwrap(func), '__globals__', {})
+    holder = SimpleNamespace(__annotations__={'hint': hint},
+                             __globals__=globalns)
+    return get_type_hints(holder, include_extras)['hint']
+
+
 def get_args_and_return_type(
         hint: Type[Callable]) -> Tuple[Optional[Tuple[type]], Optional[type]]:
     """
@@ -77,3 +109,23 @@ def get_args_and_return_type(
         arg_types = hint.__args__[0:-1]
         return_type = hint.__args__[-1]
     return arg_types, return_type
+
+
+def rename_code(func: callable, origin: callable) -> None:
+    """
+    Give the code object of ``func`` the name and qualified name of
+    ``origin``, so that profilers and tracebacks show ``func`` under the name
+    of ``origin``.
+    :param func: the function of which the code object is renamed.
+    :param origin: the function of which the names are taken.
+    :return: None.
+    """
+    code = func.__code__
+    name = getattr(origin, '__name__', code.co_name)
+    # Python3.5-3.7: code objects cannot be replaced.
+    # Python3.8-3.10: code objects have no qualified name.
+    if hasattr(code, 'co_qualname'):
+        qualname = getattr(origin, '__qualname__', name)
+        func.__code__ = code.replace(co_name=name, co_qualname=qualname)
+    elif hasattr(code, 'replace'):
+        func.__code__ = code.replace(co_name=name)
@@ -1,25 +1,64 @@
 """
 PRIVATE MODULE: do not import (from) it directly.
 
-This module contains the ``StateHolder`` class and the default ``StateHolder``
+This module contains the ``Container`` class and the default ``Container``
 instance.
 """
-from typing import Optional
+import threading
+from bisect import bisect_right
+import time
+import warnings
+from functools import partial
+from typing import (
+    Optional,
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    Callable,
+    Awaitable,
+)
 import jacked
+from jacked._pool import Pool
+from jacked._typing import AttrDict
 
 
 class Container:
     """
     An instance of ``Container`` holds registered injectables and can be used
     to inject from.
+
+    A ``Container`` can be an overlay of a ``parent``. Injectables and
+    instances that are not found in the overlay are taken from the parent,
+    while injectables that are registered to the overlay under the same name
+    override those of the parent. Creating an overlay does not copy anything
+    of the parent.
     """
-    def __init__(self):
+    def __init__(self, parent: Optional['Container'] = None):
         """
         Constructor.
+        :param parent: the ``Container`` that this ``Container`` falls back to.
         """
+        self._parent = parent
         self._injectables = list()
-        self._subjects = set()
+        self._keys = list()
+        self._subjects = dict()
+        self._meta_index = dict()
+        self._modules = dict()
         self._instances = dict()
+        self._dependencies = dict()
+        self._singletons = dict()
+        self._futures = dict()
+        self._pools = dict()
+        self._thread_locals = dict()
+        self._lock = threading.Lock()
+        self._instances_lock = threading.RLock()
+        self._revision = 0
+        self._view = None
+        self._hooks = ()
+        self._cache = dict()
+        self._staging = threading.local()
 
     def register(self, injectable: 'jacked.Injectable'):
         """
@@ -27,17 +66,420 @@ class Container:
         :param injectable: the ``Injectable`` that is to be registered.
         :return: None.
         """
-        if injectable.name not in self._subjects:
-            self._injectables.append(injectable)
-            self._subjects.add(injectable.subject.__name__)
+        staged = getattr(self._staging, 'injectables', None)
+        if staged is not None:
+            staged.append(injectable)
+            return
+        with self._lock:
+            if injectable.name not in self._subjects:
+                # Keep the injectables ordered by priority. Injectables with
+                # equal priorities keep the order of their registration.
+                key = _sort_key(injectable)
+                index = bisect_right(self._keys, key)
+                if index == len(self._injectables):
+                    self._injectables.append(injectable)
+                    self._keys.append(key)
+                else:
+                    # Insert into a copy, so ongoing resolutions do not see
+                    # the injectables shift.
+                    self._injectables = (self._injectables[:index]
+                                         + [injectable]
+                                         + self._injectables[index:])
+                    self._keys.insert(index, key)
+                self._subjects[injectable.name] = injectable
+                _add_to_index(self._meta_index, injectable)
+                _add_to_modules(self._modules, injectable)
+                self._revision += 1
+
+    def register_many(self, injectables: Iterable['jacked.Injectable']):
+        """
+        Register all given ``Injectables`` to this ``Container`` at once.
+        ``Injectables`` with a name that is already registered are ignored,
+        just like with ``register``.
+        :param injectables: the ``Injectables`` that are to be registered.
+        :return: None.
+        """
+        staged = getattr(self._staging, 'injectables', None)
+        if staged is not None:
+            staged.extend(injectables)
+            return
+        with self._lock:
+            subjects = dict(self._subjects)
+            new = []
+            for injectable in injectables:
+                if injectable.name not in subjects:
+                    subjects[injectable.name] = injectable
+                    new.append(injectable)
+            if new:
+                self._commit(self._injectables + new, subjects, [])
+
+    def unregister(self, *injectables: 'jacked.Injectable'):
+        """
+        Remove the given ``Injectables`` from this ``Container``, together
+        with their singleton instances and pools. ``Injectables`` are
+        identified by their name.
+        :param injectables: the ``Injectables`` that are to be removed.
+        :return: None.
+        """
+        names = {injectable.name for injectable in injectables}
+        with self._lock:
+            removed = [self._subjects[name] for name in names
+                       if name in self._subjects]
+            if removed:
+                # Only the entries of the removed injectables are touched;
+                # the remaining injectables are already in order.
+                removed_set = set(removed)
+                kept = [(injectable, key) for injectable, key
+                        in zip(self._injectables, self._keys)
+                        if injectable not in removed_set]
+                self._injectables = [injectable for injectable, _ in kept]
+                self._keys = [key for _, key in kept]
+                for injectable in removed:
+                    del self._subjects[injectable.name]
+                _remove_from_index(self._meta_index, removed_set)
+                _remove_from_modules(self._modules, removed_set)
+                self._forget(removed)
+                self._revision += 1
+
+    def replace(self, *injectables: 'jacked.Injectable'):
+        """
+        Replace the registered ``Injectables`` that have the same names as the
+        given ``Injectables`` by the latter. Given ``Injectables`` that do not
+        replace anything are registered. The replaced ``Injectables`` lose
+        their singleton instances and pools.
+        :param injectables: the ``Injectables`` that replace the existing.
+        :return: None.
+        """
+        by_name = {injectable.name: injectable for injectable in injectables}
+        with self._lock:
+            added = dict(by_name)
+            result = []
+            removed = []
+            for injectable in self._injectables:
+                replacement = added.pop(injectable.name, None)
+                if replacement is None:
+                    result.append(injectable)
+                else:
+                    result.append(replacement)
+                    removed.append(injectable)
+            result.extend(added.values())
+            self._commit(result, {**self._subjects, **by_name}, removed)
+
+    def _stage(self, func: Callable[[], object]) -> List['jacked.Injectable']:
+        # Call `func` and return the injectables that it registered to this
+        # container in the current thread, without registering them.
+        self._staging.injectables = staged = []
+        try:
+            func()
+        finally:
+            del self._staging.injectables
+        return staged
+
+    def _swap(
+            self,
+            old: List['jacked.Injectable'],
+            new: List['jacked.Injectable']):
+        # Replace the registered injectables `old` by `new` in one go, so
+        # ongoing resolutions see either of them. Names of `new` that are
+        # registered by others are ignored, just like with `register`.
+        with self._lock:
+            old = [injectable for injectable in old
+                   if self._subjects.get(injectable.name) is injectable]
+            old_set = set(old)
+            subjects = {name: injectable for name, injectable
+                        in self._subjects.items() if injectable not in old_set}
+            added = []
+            for injectable in new:
+                if injectable.name not in subjects:
+                    subjects[injectable.name] = injectable
+                    added.append(injectable)
+            remaining = [injectable for injectable in self._injectables
+                         if injectable not in old_set]
+            self._commit(remaining + added, subjects, old)
+
+    def _commit(
+            self,
+            injectables: List['jacked.Injectable'],
+            subjects: Dict[str, 'jacked.Injectable'],
+            removed: List['jacked.Injectable']):
+        # Swap in the new registry in one go, so ongoing resolutions keep
+        # iterating over the old, consistent list. Must be called while
+        # holding the lock. The sort is stable, so injectables with equal
+        # priorities keep their order.
+        self._forget(removed)
+        injectables = sorted(injectables, key=_sort_key)
+        self._injectables = injectables
+        self._keys = [_sort_key(injectable) for injectable in injectables]
+        self._subjects = subjects
+        meta_index = dict()
+        modules = dict()
+        for injectable in injectables:
+            _add_to_index(meta_index, injectable)
+            _add_to_modules(modules, injectable)
+        self._meta_index = meta_index
+        self._modules = modules
+        self._revision += 1
+
+    def _forget(self, removed: List['jacked.Injectable']):
+        # Drop the singletons, pools and thread instances of the removed
+        # injectables. Singletons that (indirectly) depend on any of the
+        # dropped instances are dropped too, so they are created again with
+        # the injectables that replace the removed. Must be called while
+        # holding the lock.
+        subjects = {injectable.subject for injectable in removed}
+        stale = set()
+        for injectable in removed:
+            pool = self._pools.pop(injectable, None)
+            if pool is not None:
+                for instance in pool.close(_dispose_quietly):
+                    _dispose_quietly(instance)
+            singleton = self._singletons.pop(injectable, _MISSING)
+            if singleton is not _MISSING:
+                stale.add(id(singleton))
+                self._dependencies.pop(id(singleton), None)
+            self._thread_locals.pop(injectable, None)
+        dropped = True
+        while dropped:
+            dropped = False
+            for injectable, singleton in list(self._singletons.items()):
+                dependencies = self._dependencies.get(id(singleton), ())
+                if any(id(dependency) in stale or type(dependency) in subjects
+                       for dependency in dependencies):
+                    del self._singletons[injectable]
+                    del self._dependencies[id(singleton)]
+                    stale.add(id(singleton))
+                    dropped = True
+
+    def snapshot(self) -> 'jacked.ContainerSnapshot':
+        """
+        Return a picklable copy of the registry of this ``Container``,
+        including the injectables that it inherits from its parents. The
+        subjects are referenced by their qualified names, so they must be
+        importable (e.g. not defined inside a function). Instances are not
+        part of the snapshot.
+        :return: a ``ContainerSnapshot``.
+        """
+        from jacked import _snapshot  # Only needed when taking snapshots.
+
+        return _snapshot.take(self)
+
+    def load_snapshot(self, snapshot: 'jacked.ContainerSnapshot'):
+        """
+        Replace the registry of this ``Container`` by the one of the given
+        snapshot, importing the modules of its subjects. This is meant for
+        worker processes that would otherwise discover all injectables again.
+        :param snapshot: a ``ContainerSnapshot`` taken with ``snapshot``.
+        :return: None.
+        """
+        from jacked import _snapshot  # Only needed when loading snapshots.
+
+        injectables = _snapshot.restore(snapshot, self)
+        subjects = {injectable.name: injectable for injectable in injectables}
+        with self._lock:
+            self._commit(injectables, subjects, list(self._injectables))
+
+    def registered_in(self, module: str) -> List['jacked.Injectable']:
+        """
+        Return the ``Injectables`` that were registered to this ``Container``
+        itself (not to any of its parents) with a subject that is defined in
+        the given module.
+        :param module: the name of the module.
+        :return: a list of ``Injectables``.
+        """
+        return list(self._modules.get(module, ()))
+
+    @property
+    def parent(self) -> Optional['Container']:
+        """
+        Return the ``Container`` that this ``Container`` falls back to.
+        :return: the parent ``Container`` or ``None``.
+        """
+        return self._parent
+
+    @property
+    def revision(self) -> int:
+        """
+        Return a number that changes whenever an ``Injectable`` is registered
+        to this ``Container`` or to any of its parents.
+        :return: the revision number.
+        """
+        if self._parent is None:
+            return self._revision
+        return self._revision + self._parent.revision
 
     @property
     def injectables(self):
         """
-        Return all ``Injectables`` that were registered to this ``Container``.
+        Return all ``Injectables`` that were registered to this ``Container``
+        and those of its parents that were not overridden, ordered by their
+        priority (highest first).
         :return: a list of all ``Injectables``.
         """
-        return self._injectables
+        if self._parent is None:
+            return self._injectables
+        revision = self.revision
+        view = self._view
+        if view is None or view[0] != revision:
+            # The view is only rebuilt after a registration somewhere in the
+            # chain of containers.
+            inherited = [injectable for injectable in self._parent.injectables
+                         if injectable.name not in self._subjects]
+            # On equal priorities, those of this container come first:
+            view = (revision,
+                    sorted(self._injectables + inherited, key=_sort_key))
+            self._view = view
+        return view[1]
+
+    def get_by_name(self, name: str) -> Optional['jacked.Injectable']:
+        """
+        Return the ``Injectable`` that was registered under the given name to
+        this ``Container`` or to any of its parents.
+        :param name: the name of the ``Injectable``.
+        :return: the ``Injectable`` with ``name`` or ``None``.
+        """
+        result = self._subjects.get(name)
+        if result is None and self._parent is not None:
+            result = self._parent.get_by_name(name)
+        return result
+
+    def select(self, where: Dict[str, object]) -> List['jacked.Injectable']:
+        """
+        Return the ``Injectables`` of this ``Container`` and of its parents
+        of which the meta data holds all items of ``where``, ordered by their
+        priority (highest first). Only the injectables that are indexed under
+        the rarest of these items are checked.
+        :param where: the meta data that the injectables must have.
+        :return: a list of the matching ``Injectables``.
+        """
+        if not where:
+            return self.injectables
+        result = self._select_own(where)
+        if self._parent is not None:
+            inherited = [injectable for injectable
+                         in self._parent.select(where)
+                         if injectable.name not in self._subjects]
+            if inherited:
+                # On equal priorities, those of this container come first:
+                result = sorted(result + inherited, key=_sort_key)
+        return result
+
+    def _select_own(
+            self,
+            where: Dict[str, object]) -> List['jacked.Injectable']:
+        # Select from the injectables that were registered to this container.
+        index = self._meta_index
+        smallest = None
+        for key, value in where.items():
+            try:
+                indexed = index.get(key, {}).get(value, ())
+            except TypeError:
+                continue  # Unhashable values are not indexed.
+            if smallest is None or len(indexed) < len(smallest):
+                smallest = indexed
+            if not smallest:
+                return []
+        if smallest is None:
+            smallest = self._injectables
+        return [injectable for injectable in smallest
+                if _has_meta(injectable, where)]
+
+    def meta_of(self, obj: object) -> Optional[AttrDict]:
+        """
+        Return the meta data of the ``Injectable`` in this ``Container`` (or
+        any of its parents) of which the given object is the subject or an
+        instance of the subject. Different containers may hold different meta
+        data for the same subject.
+        :param obj: a subject or an instance that was injected.
+        :return: the meta data or ``None`` if ``obj`` is not known.
+        """
+        by_subject = self.cached(_BY_SUBJECT, self._index_subjects)
+        injectable = by_subject.get(id(obj))
+        if injectable is None:
+            injectable = by_subject.get(id(type(obj)))
+        return injectable.meta if injectable is not None else None
+
+    def _index_subjects(self) -> Dict[int, 'jacked.Injectable']:
+        # Map the ids of all subjects to their injectables; on equal subjects,
+        # the one with the highest priority wins.
+        return {id(injectable.subject): injectable
+                for injectable in reversed(self.injectables)}
+
+    def owner_of(self, injectable: 'jacked.Injectable') -> 'Container':
+        """
+        Return the ``Container`` in the chain of parents in which the given
+        ``Injectable`` was registered.
+        :param injectable: the ``Injectable`` of which the owner is returned.
+        :return: the ``Container`` that owns ``injectable``.
+        """
+        container = self
+        while (container._parent is not None
+               and injectable.name not in container._subjects):
+            container = container._parent
+        return container
+
+    @property
+    def hooks(self) -> Tuple['jacked.Hook', ...]:
+        """
+        Return the hooks of this ``Container`` followed by those of its
+        parents.
+        :return: a tuple of ``Hooks``.
+        """
+        if self._parent is None:
+            return self._hooks
+        return self._hooks + self._parent.hooks
+
+    def add_hook(self, hook: 'jacked.Hook'):
+        """
+        Add a ``Hook`` that observes the resolutions from this ``Container``
+        and its overlays.
+        :param hook: the ``Hook`` that is to be added.
+        :return: None.
+        """
+        with self._lock:
+            self._hooks = self._hooks + (hook,)
+
+    def remove_hook(self, hook: 'jacked.Hook'):
+        """
+        Remove a ``Hook`` that was added with ``add_hook``.
+        :param hook: the ``Hook`` that is to be removed.
+        :return: None.
+        """
+        with self._lock:
+            self._hooks = tuple(h for h in self._hooks if h is not hook)
+
+    def construct(self, injectable: 'jacked.Injectable') -> object:
+        """
+        Create a new instance of the subject of the given ``Injectable`` or
+        call it if it is a provider function.
+        :param injectable: the ``Injectable`` of which an instance is created.
+        :return: the new instance.
+        """
+        hooks = self.hooks
+        if not hooks:
+            return injectable.factory()
+        if (injectable.is_async
+                and injectable.lifetime != jacked._injectable.SCOPED):
+            # The instance is reported once it has been awaited.
+            return self._construct_async(injectable, hooks)
+        start = time.perf_counter()
+        instance = injectable.factory()
+        duration = time.perf_counter() - start
+        for hook in hooks:
+            hook.on_construct(injectable, instance, duration)
+        return instance
+
+    async def _construct_async(
+            self,
+            injectable: 'jacked.Injectable',
+            hooks: Tuple['jacked.Hook', ...]) -> object:
+        # Await the result of the async provider of `injectable` and report
+        # it to `hooks`.
+        start = time.perf_counter()
+        instance = await injectable.factory()
+        duration = time.perf_counter() - start
+        for hook in hooks:
+            hook.on_construct(injectable, instance, duration)
+        return instance
 
     def get_instance(self, hint: object) -> Optional[object]:
         """
@@ -46,8 +488,9 @@ class Container:
         :param hint: a type hint that describes the object.
         :return: an instance for that hint or None.
         """
-
         inst, _ = self._instances.get(hint, (None, None))
+        if inst is None and self._parent is not None:
+            inst = self._parent.get_instance(hint)
         return inst
 
     def set_instance(
@@ -65,9 +508,341 @@ class Container:
         :param priority: the priority of the instance.
         :return: None.
         """
-        _, prio_existing = self._instances.get(hint, (None, -1))
-        if priority > prio_existing:
-            self._instances[hint] = (instance, priority)
+        with self._instances_lock:
+            _, prio_existing = self._instances.get(hint, (None, -1))
+            if priority > prio_existing:
+                self._instances[hint] = (instance, priority)
+
+    def get_or_create_singleton(
+            self,
+            injectable: 'jacked.Injectable',
+            factory: Callable[[], object]) -> object:
+        """
+        Return the singleton instance of the given ``Injectable``. Only if
+        there is none yet, ``factory`` is called to create it. There is one
+        instance per ``Injectable``, regardless of the hints that it is
+        injected for.
+        :param injectable: the ``Injectable`` of which the instance is
+        returned.
+        :param factory: a callable without arguments that creates an instance.
+        :return: the instance of ``injectable``.
+        """
+        try:
+            instance = self._singletons[injectable]
+        except KeyError:
+            # Reentrant, as the factory may inject other singletons. Threads
+            # that wait for the lock get the instance of the first thread.
+            with self._instances_lock:
+                instance = self._singletons.get(injectable, _MISSING)
+                if instance is _MISSING:
+                    instance, dependencies = _create_tracked(factory)
+                    self._dependencies[id(instance)] = dependencies
+                    self._singletons[injectable] = instance
+        _track(instance)
+        return instance
+
+    def get_or_create_thread_instance(
+            self,
+            injectable: 'jacked.Injectable',
+            factory: Callable[[], object]) -> object:
+        """
+        Return the instance of the given ``Injectable`` for the current
+        thread. If this thread has none yet, ``factory`` is called to create
+        it. The instance is released when the thread ends.
+        :param injectable: the ``Injectable`` with the lifetime ``'thread'``.
+        :param factory: a callable without arguments that creates an instance.
+        :return: the instance of ``injectable`` for the current thread.
+        """
+        local = self._thread_locals.get(injectable)
+        if local is None:
+            with self._lock:
+                local = self._thread_locals.setdefault(injectable,
+                                                       threading.local())
+        try:
+            return local.instance
+        except AttributeError:
+            instance = factory()
+            local.instance = instance
+            return instance
+
+    async def get_or_create_async_instance(
+            self,
+            injectable: 'jacked.Injectable',
+            factory: Callable[[], Awaitable[object]]) -> object:
+        """
+        Return the singleton instance of the given async ``Injectable``. If
+        there is none yet, ``factory`` is awaited to create it. Concurrent
+        callers all await the same construction. If the construction fails,
+        the error is raised to all of them and the next call tries again.
+        :param injectable: the ``Injectable`` of which the instance is
+        returned.
+        :param factory: a callable without arguments that returns an
+        awaitable that results in the instance.
+        :return: the instance of ``injectable``.
+        """
+        import asyncio  # Imported here, as asyncio is slow to import.
+
+        if injectable in self._singletons:
+            return self._singletons[injectable]
+        future = self._futures.get(injectable)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._futures[injectable] = future
+            future.add_done_callback(
+                partial(self._on_async_instance_done, injectable))
+        # A cancelled caller must not cancel the construction for the others:
+        return await asyncio.shield(future)
+
+    def _on_async_instance_done(
+            self,
+            injectable: 'jacked.Injectable',
+            future: 'asyncio.Future'):  # noqa: F821 (imported lazily)
+        # Store the constructed instance. This callback runs before those of
+        # the waiting callers, as it was added first.
+        self._futures.pop(injectable, None)
+        if not future.cancelled() and future.exception() is None:
+            self._singletons[injectable] = future.result()
+
+    def cached(self, key: object, factory: Callable[[], object]) -> object:
+        """
+        Return the value that was cached under the given key. The value is
+        created with ``factory`` if there is none yet or if the ``Container``
+        (or any of its parents) changed since it was created.
+        :param key: the key of the value (e.g. a type hint).
+        :param factory: a callable without arguments that creates the value.
+        :return: the cached value.
+        """
+        revision = self.revision
+        entry = self._cache.get(key)
+        if entry is None or entry[0] != revision:
+            entry = (revision, factory())
+            self._cache[key] = entry
+        return entry[1]
+
+    def close(self, timeout: float = 10.0, slow: float = 1.0) -> AttrDict:
+        """
+        Dispose the singletons and the idle pooled instances of this
+        ``Container`` by calling their ``close`` or ``__exit__``. Instances
+        are disposed after the instances that depend on them; independent
+        instances are disposed concurrently. Of the instances with the
+        lifetime ``'thread'``, only those of the current thread are disposed;
+        those of other threads are released when their threads end.
+        :param timeout: the number of seconds that disposing all instances
+        may take; instances that are not disposed by then are reported as
+        pending.
+        :param slow: the number of seconds after which a disposal is reported
+        as slow.
+        :return: a report with the lists ``closed``, ``failed``, ``pending``
+        and ``slow``.
+        """
+        from jacked import _dispose  # Only needed upon shutdown.
+
+        instances, dependencies = self._take_managed()
+        return _dispose.dispose(instances, dependencies, timeout, slow)
+
+    async def aclose(
+            self,
+            timeout: float = 10.0,
+            slow: float = 1.0) -> AttrDict:
+        """
+        Dispose the managed instances like ``close`` does, but await their
+        ``__aexit__`` or ``aclose`` if they have one. Synchronous disposers
+        run in the default executor of the event loop.
+        :param timeout: the number of seconds that disposing all instances
+        may take; instances that are not disposed by then are reported as
+        pending.
+        :param slow: the number of seconds after which a disposal is reported
+        as slow.
+        :return: a report with the lists ``closed``, ``failed``, ``pending``
+        and ``slow``.
+        """
+        from jacked import _dispose  # Only needed upon shutdown.
+
+        instances, dependencies = self._take_managed()
+        return await _dispose.adispose(instances, dependencies, timeout, slow)
+
+    def _take_managed(self) -> Tuple[List[object], Dict[int, List[object]]]:
+        # Remove all managed instances from this container and return them
+        # together with the instances that each of them depends on.
+        with self._lock, self._instances_lock:
+            instances = [value[0] for value in self._instances.values()]
+            instances.extend(self._singletons.values())
+            dependencies = self._dependencies
+            pools = list(self._pools.values())
+            locals_ = list(self._thread_locals.values())
+            self._instances = dict()
+            self._singletons = dict()
+            self._dependencies = dict()
+            self._pools = dict()
+            self._thread_locals = dict()
+        # Pooled instances are disposed after all that may depend on them.
+        pooled = [instance for pool in pools
+                  for instance in pool.close(_dispose_quietly)]
+        if pooled:
+            for instance in instances:
+                dependencies[id(instance)] = (
+                    list(dependencies.get(id(instance), ())) + pooled)
+            instances.extend(pooled)
+        # The instances of the current thread are disposed first. Those of
+        # other threads are released when their threads end.
+        threaded = [local.__dict__.pop('instance') for local in locals_
+                    if 'instance' in local.__dict__]
+        for instance in threaded:
+            dependencies[id(instance)] = (
+                list(dependencies.get(id(instance), ())) + instances)
+        instances.extend(threaded)
+        # Instances can be registered under multiple hints:
+        instances = list({id(instance): instance
+                          for instance in instances}.values())
+        return instances, dependencies
+
+    def get_pool(self, injectable: 'jacked.Injectable') -> Pool:
+        """
+        Return the ``Pool`` that holds the instances of the given pooled
+        ``Injectable``. The pool is created upon the first request.
+        :param injectable: the ``Injectable`` with the lifetime ``'pool'``.
+        :return: the pool of ``injectable``.
+        """
+        owner = self.owner_of(injectable)
+        if owner is not self:
+            # The pool is shared with all overlays of the owner.
+            return owner.get_pool(injectable)
+        pool = self._pools.get(injectable)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(injectable)
+                if pool is None:
+                    min_size, max_size = injectable.pool_size
+                    pool = Pool(partial(self.construct, injectable),
+                                min_size, max_size, injectable.pool_timeout)
+                    self._pools[injectable] = pool
+        return pool
+
+    def pool_metrics(self) -> Dict[str, AttrDict]:
+        """
+        Return the utilisation figures of all pools in this ``Container``.
+        :return: a dict with the names of the pooled injectables and their
+        metrics.
+        """
+        return {injectable.name: pool.metrics
+                for injectable, pool in list(self._pools.items())}
+
+
+def _create_tracked(
+        factory: Callable[[], object]) -> Tuple[object, List[object]]:
+    # Call factory and return its result together with the managed instances
+    # that were injected while it ran (i.e. its dependencies).
+    frames = _TRACKING.__dict__.setdefault('frames', [])
+    dependencies = []
+    frames.append(dependencies)
+    try:
+        instance = factory()
+    finally:
+        frames.pop()
+    return instance, dependencies
+
+
+def _track(instance: object):
+    # Register the given managed instance as a dependency of the instance that
+    # is currently being created in this thread, if any.
+    frames = getattr(_TRACKING, 'frames', None)
+    if frames:
+        frames[-1].append(instance)
+
+
+def _dispose_quietly(instance: object):
+    # Dispose a pooled instance that is no longer managed by a container.
+    # Failures are reported, but must not fail the caller.
+    from jacked import _dispose  # Only needed when disposing.
+
+    try:
+        _dispose._close(instance)
+    except Exception as err:
+        warnings.warn('Could not dispose {!r}: {!r}'.format(instance, err),
+                      RuntimeWarning)
+
+
+def _add_to_index(
+        index: Dict[str, Dict[object, List['jacked.Injectable']]],
+        injectable: 'jacked.Injectable'):
+    # Add `injectable` to the lists of the meta index that belong to its meta
+    # items. If it has the lowest priority, it is appended like with the list
+    # of injectables. Otherwise the list is replaced by a sorted copy, so
+    # ongoing selections do not see the injectables shift.
+    sort_key = _sort_key(injectable)
+    for key, value in injectable._meta.items():
+        by_value = index.setdefault(key, dict())
+        try:
+            indexed = by_value.get(value)
+        except TypeError:
+            continue  # Unhashable values are not indexed.
+        if indexed is None:
+            by_value[value] = [injectable]
+        elif _sort_key(indexed[-1]) <= sort_key:
+            indexed.append(injectable)
+        else:
+            by_value[value] = sorted(indexed + [injectable], key=_sort_key)
+
+
+def _remove_from_index(
+        index: Dict[str, Dict[object, List['jacked.Injectable']]],
+        removed: Set['jacked.Injectable']):
+    # Remove the `removed` injectables from the lists of the meta index that
+    # belong to their meta items. Each affected list is replaced once.
+    affected = dict()
+    for injectable in removed:
+        for key, value in injectable._meta.items():
+            try:
+                affected[key, value] = None
+            except TypeError:
+                continue  # Unhashable values are not indexed.
+    for key, value in affected:
+        by_value = index.get(key, {})
+        indexed = [each for each in by_value.get(value, ())
+                   if each not in removed]
+        if indexed:
+            by_value[value] = indexed
+        else:
+            by_value.pop(value, None)
+
+
+def _add_to_modules(
+        modules: Dict[str, List['jacked.Injectable']],
+        injectable: 'jacked.Injectable'):
+    # Add `injectable` to the list of the module of its subject.
+    module = getattr(injectable.subject, '__module__', None)
+    modules.setdefault(module, []).append(injectable)
+
+
+def _remove_from_modules(
+        modules: Dict[str, List['jacked.Injectable']],
+        removed: Set['jacked.Injectable']):
+    # Remove the `removed` injectables from the lists of the modules of their
+    # subjects. Each affected list is replaced once.
+    affected = {getattr(injectable.subject, '__module__', None)
+                for injectable in removed}
+    for module in affected:
+        indexed = [each for each in modules.get(module, ())
+                   if each not in removed]
+        if indexed:
+            modules[module] = indexed
+        else:
+            modules.pop(module, None)
+
+
+def _has_meta(injectable: 'jacked.Injectable', where: Dict[str, object]):
+    # Return whether the meta data of `injectable` holds all items of `where`.
+    meta = injectable._meta
+    return all(meta.get(key, _MISSING) == value
+               for key, value in where.items())
+
+
+def _sort_key(injectable: 'jacked.Injectable') -> int:
+    # Sorting ascending on this key puts the highest priorities first.
+    return -injectable.priority
 
 
+_MISSING = object()
+_TRACKING = threading.local()
+_BY_SUBJECT = object()  # The key of the cached index of meta_of.
 DEFAULT_CONTAINER = Container()
@@ -1,13 +1,20 @@
 """
 PRIVATE MODULE: do not import (from) it directly.
 
-This module contains the ``discover`` function.
+This module contains the ``discover`` and ``watch`` functions.
 """
 import glob
+import importlib
+import os
 import sys
+import threading
+import warnings
+from functools import partial
 from importlib import import_module
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
+import jacked
+from jacked._container import DEFAULT_CONTAINER
 from jacked._typing import Module
 
 
@@ -21,16 +28,178 @@ def discover(directory: str = '.') -> List[Module]:
     return _import(paths)
 
 
+def watch(
+        directory: str = '.',
+        *,
+        container: 'jacked.Container' = DEFAULT_CONTAINER,
+        interval: Optional[float] = 1.0) -> 'Watcher':
+    """
+    Discover all modules in the given directory like ``discover`` does and
+    keep watching them: modules that change are reloaded and their
+    injectables replace the old ones in ``container``. Changes are detected
+    by polling the modification times of the files.
+
+    Usage example:
+
+        watcher = watch('path/to/your/package')
+        ...
+        watcher.stop()
+
+    :param directory: the directory in which modules are to be discovered.
+    :param container: the ``Container`` in which the injectables of reloaded
+    modules are replaced.
+    :param interval: the number of seconds between two polls, or ``None`` to
+    not poll in the background (call ``Watcher.poll`` instead).
+    :return: a ``Watcher``.
+    """
+    watcher = Watcher(directory, container)
+    if interval is not None:
+        watcher.start(interval)
+    return watcher
+
+
+class Watcher:
+    """
+    Keeps the injectables of the modules in a directory up to date with their
+    files. Only changed modules are reloaded; only the injectables,
+    singletons and pools of those modules are dropped, together with the
+    singletons that depend on them.
+
+    Objects that were already injected, and other modules that imported
+    from a reloaded module, keep referring to the old objects.
+    """
+    def __init__(
+            self,
+            directory: str,
+            container: 'jacked.Container' = DEFAULT_CONTAINER):
+        """
+        Constructor. All modules in ``directory`` are imported.
+        :param directory: the directory in which modules are to be discovered.
+        :param container: the ``Container`` in which the injectables of
+        reloaded modules are replaced.
+        """
+        self._directory = directory
+        self._container = container
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._modules = {}  # type: Dict[Path, Module]
+        self._mtimes = self._get_mtimes()
+        for path in self._mtimes:
+            self._import(path)
+
+    @property
+    def modules(self) -> List[Module]:
+        """
+        Return the modules that are currently watched.
+        :return: a list of modules.
+        """
+        return list(self._modules.values())
+
+    def poll(self) -> List[Module]:
+        """
+        Reload the modules that changed since the last poll, import new
+        modules and drop the injectables of the modules that were deleted.
+        :return: the modules that were (re)loaded.
+        """
+        result = []
+        with self._lock:
+            mtimes = self._get_mtimes()
+            for path in self._mtimes.keys() - mtimes.keys():
+                module = self._modules.pop(path, None)
+                if module:
+                    self._container.unregister(
+                        *self._container.registered_in(module.__name__))
+            for path, mtime in mtimes.items():
+                if self._mtimes.get(path) == mtime:
+                    continue
+                module = self._modules.get(path)
+                # Remember the new mtime first, so a broken module is only
+                # retried after it is changed again.
+                self._mtimes[path] = mtime
+                module = (self._reload(module) if module
+                          else self._import(path))
+                if module:
+                    result.append(module)
+            self._mtimes = mtimes
+        return result
+
+    def start(self, interval: float = 1.0):
+        """
+        Start polling in a background thread.
+        :param interval: the number of seconds between two polls.
+        :return: None.
+        """
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run,
+                                            args=(interval,), daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stop polling in the background.
+        :return: None.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval: float):
+        # Poll until stopped. Errors of broken modules must not end watching.
+        while not self._stopped.wait(interval):
+            try:
+                self.poll()
+            except Exception as err:
+                warnings.warn('Could not reload: {!r}'.format(err),
+                              RuntimeWarning)
+
+    def _get_mtimes(self) -> Dict[Path, int]:
+        result = {}
+        for path in _glob(self._directory, '**/*.py', True):
+            try:
+                result[path] = os.stat(str(path)).st_mtime_ns
+            except OSError:
+                pass  # The file was deleted in the meantime.
+        return result
+
+    def _import(self, path: Path) -> Optional[Module]:
+        module = next(iter(_import([path])), None)
+        if module:
+            self._modules[path] = module
+        return module
+
+    def _reload(self, module: Module) -> Module:
+        # Reload the given module and swap its old injectables for the new
+        # ones in one go, so resolutions never miss them. If it fails, the
+        # old injectables stay registered.
+        old = self._container.registered_in(module.__name__)
+        # The cached bytecode only tracks mtimes in seconds, so a change
+        # within the same second would go unnoticed by reload. Execute the
+        # current source instead, without touching the cache.
+        importlib.invalidate_caches()
+        loader = module.__spec__.loader
+        source = loader.get_data(module.__file__)
+        code = loader.source_to_code(source, module.__file__)
+        new = self._container._stage(partial(exec, code, module.__dict__))
+        self._container._swap(old, new)
+        return module
+
+
 def _find_paths(directory: str, pattern: str, recursive: bool) -> List[Path]:
     # Find all paths in the given directory with the given pattern and return
     # them in a list.
-    path = Path(directory)
-    abspath = str(path.absolute())
+    abspath = str(Path(directory).absolute())
     sys.path.insert(0, abspath)
-    path_to_discover = path.joinpath(pattern)
-    paths = [Path(filename) for filename in
-             glob.iglob(str(path_to_discover), recursive=recursive)]
-    return paths
+    return _glob(directory, pattern, recursive)
+
+
+def _glob(directory: str, pattern: str, recursive: bool) -> List[Path]:
+    # Return all paths in the given directory with the given pattern.
+    path_to_discover = Path(directory).joinpath(pattern)
+    return [Path(filename) for filename in
+            glob.iglob(str(path_to_discover), recursive=recursive)]
 
 
 def _import(paths: List[Path]) -> List[Module]:
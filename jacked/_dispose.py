@@ -0,0 +1,237 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains the functions that dispose the instances that are
+managed by a ``Container``.
+"""
+import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+from jacked._exceptions import InvalidUsageError
+from jacked._typing import AttrDict
+
+
+MAX_WORKERS = 32
+
+
+def dispose(
+        instances: List[object],
+        dependencies: Dict[int, List[object]],
+        timeout: float,
+        slow: float) -> AttrDict:
+    """
+    Dispose the given instances, each after all instances that depend on it.
+    Instances that do not depend on each other are disposed concurrently.
+    :param instances: the instances that are to be disposed.
+    :param dependencies: the instances that each instance (by its id)
+    depends on.
+    :param timeout: the number of seconds that disposing may take in total.
+    :param slow: the number of seconds after which a disposal is slow.
+    :return: a report of the disposal.
+    """
+    report = _Report(instances, slow)
+    if not instances:
+        return report.finish()
+    schedule = _Schedule(instances, dependencies)
+    deadline = time.monotonic() + timeout
+    executor = ThreadPoolExecutor(min(len(instances), MAX_WORKERS))
+    futures = {}
+
+    def submit(instance):
+        futures[executor.submit(_timed, _close, instance)] = instance
+
+    try:
+        for instance in schedule.ready():
+            submit(instance)
+        while futures:
+            remaining = deadline - time.monotonic()
+            done, _ = wait(futures, max(remaining, 0), FIRST_COMPLETED)
+            if not done:
+                break  # Timed out.
+            for future in done:
+                instance = futures.pop(future)
+                report.add(instance, *future.result())
+                for ready in schedule.done(instance):
+                    submit(ready)
+    finally:
+        # Disposers that are still running cannot be interrupted; they are
+        # reported as pending and left to finish in the background.
+        executor.shutdown(wait=False)
+    return report.finish()
+
+
+async def adispose(
+        instances: List[object],
+        dependencies: Dict[int, List[object]],
+        timeout: float,
+        slow: float) -> AttrDict:
+    """
+    Dispose the given instances like ``dispose`` does, but await the
+    asynchronous disposers of instances.
+    :param instances: the instances that are to be disposed.
+    :param dependencies: the instances that each instance (by its id)
+    depends on.
+    :param timeout: the number of seconds that disposing may take in total.
+    :param slow: the number of seconds after which a disposal is slow.
+    :return: a report of the disposal.
+    """
+    import asyncio  # Imported here, as asyncio is slow to import.
+
+    report = _Report(instances, slow)
+    schedule = _Schedule(instances, dependencies)
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    tasks = {}
+
+    def submit(instance):
+        task = asyncio.ensure_future(_atimed(instance))
+        tasks[task] = instance
+
+    for instance in schedule.ready():
+        submit(instance)
+    try:
+        while tasks:
+            remaining = deadline - loop.time()
+            done, _ = await asyncio.wait(tasks, timeout=max(remaining, 0),
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break  # Timed out.
+            for task in done:
+                instance = tasks.pop(task)
+                report.add(instance, *task.result())
+                for ready in schedule.done(instance):
+                    submit(ready)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return report.finish()
+
+
+class _Schedule:
+    # Keeps track of which instances can be disposed, i.e. those of which all
+    # dependents have been disposed.
+    def __init__(
+            self,
+            instances: List[object],
+            dependencies: Dict[int, List[object]]):
+        self._dependencies = dependencies
+        self._dependents = {id(instance): 0 for instance in instances}
+        self._instances = instances
+        for instance in instances:
+            for dependency in self._dependencies_of(instance):
+                self._dependents[id(dependency)] += 1
+
+    def ready(self) -> List[object]:
+        return [instance for instance in self._instances
+                if not self._dependents[id(instance)]]
+
+    def done(self, instance: object) -> List[object]:
+        # Return the instances that became ready by disposing `instance`.
+        result = []
+        for dependency in self._dependencies_of(instance):
+            self._dependents[id(dependency)] -= 1
+            if not self._dependents[id(dependency)]:
+                result.append(dependency)
+        return result
+
+    def _dependencies_of(self, instance: object) -> List[object]:
+        # Only dependencies that are disposed here count; each counts once.
+        return list({id(dependency): dependency for dependency
+                     in self._dependencies.get(id(instance), ())
+                     if id(dependency) in self._dependents
+                     and dependency is not instance}.values())
+
+
+class _Report:
+    # Collects the outcome of the disposal of each instance.
+    def __init__(self, instances: List[object], slow: float):
+        self._pending = {id(instance): instance for instance in instances}
+        self._slow = slow
+        self._start = time.monotonic()
+        self._result = AttrDict(closed=[], failed=[], pending=[], slow=[])
+
+    def add(
+            self,
+            instance: object,
+            disposed: bool,
+            duration: float,
+            error: Optional[BaseException]):
+        del self._pending[id(instance)]
+        if not disposed:
+            return  # The instance has nothing to dispose.
+        entry = AttrDict(name=type(instance).__name__, instance=instance,
+                         duration=duration, error=error)
+        if error is None:
+            self._result.closed.append(entry)
+        else:
+            self._result.failed.append(entry)
+        if duration >= self._slow:
+            self._result.slow.append(entry)
+
+    def finish(self) -> AttrDict:
+        self._result.pending.extend(
+            AttrDict(name=type(instance).__name__, instance=instance)
+            for instance in self._pending.values())
+        self._result.slow.sort(key=lambda entry: -entry.duration)
+        self._result.duration = time.monotonic() - self._start
+        return self._result
+
+
+def _timed(
+        func: Callable[[object], bool],
+        instance: object) -> Tuple[bool, float, Optional[BaseException]]:
+    # Call func with instance and return whether it disposed anything, how
+    # long it took and the error that it raised, if any.
+    start = time.monotonic()
+    try:
+        disposed = func(instance)
+        error = None
+    except Exception as err:
+        disposed = True
+        error = err
+    return disposed, time.monotonic() - start, error
+
+
+async def _atimed(
+        instance: object) -> Tuple[bool, float, Optional[BaseException]]:
+    # Like `_timed`, but for asynchronous disposal.
+    import asyncio
+
+    start = time.monotonic()
+    try:
+        if hasattr(instance, '__aexit__'):
+            await instance.__aexit__(None, None, None)
+            disposed = True
+        elif inspect.iscoroutinefunction(getattr(instance, 'aclose', None)):
+            await instance.aclose()
+            disposed = True
+        elif inspect.iscoroutinefunction(getattr(instance, 'close', None)):
+            await instance.close()
+            disposed = True
+        else:
+            loop = asyncio.get_event_loop()
+            disposed = await loop.run_in_executor(None, _close, instance)
+        error = None
+    except Exception as err:
+        disposed = True
+        error = err
+    return disposed, time.monotonic() - start, error
+
+
+def _close(instance: object) -> bool:
+    # Dispose the given instance and return whether it had anything to
+    # dispose.
+    close = getattr(instance, 'close', None)
+    if inspect.iscoroutinefunction(close) or (
+            not callable(close) and hasattr(instance, '__aexit__')):
+        raise InvalidUsageError('"{}" can only be disposed asynchronously; '
+                                'use aclose() instead.'
+                                .format(type(instance).__name__))
+    if callable(close):
+        close()
+    elif hasattr(instance, '__exit__'):
+        instance.__exit__(None, None, None)
+    else:
+        return False
+    return True
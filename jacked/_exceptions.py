@@ -33,3 +33,9 @@ class InjectionError(JackedError):
         """
         super(InjectionError, self).__init__(msg)
         self.subject = subject
+
+
+class PoolExhaustedError(InjectionError):
+    """
+    Raised when no pooled instance could be checked out in time.
+    """
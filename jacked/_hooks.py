@@ -0,0 +1,62 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains the ``Hook`` class.
+"""
+from typing import Optional
+import jacked
+
+
+class Hook:
+    """
+    Base class for hooks that can be added to a ``Container`` to observe its
+    resolutions (e.g. for tracing). Override the methods of interest; the
+    default implementations do nothing. Durations are in seconds.
+    """
+    def on_resolve_start(self, hint: object):
+        """
+        Called before the candidates for ``hint`` are searched.
+        :param hint: the type hint that is resolved.
+        :return: None.
+        """
+
+    def on_candidate_matched(
+            self,
+            hint: object,
+            injectable: 'jacked.Injectable'):
+        """
+        Called for every ``Injectable`` that matched ``hint``.
+        :param hint: the type hint that is resolved.
+        :param injectable: the ``Injectable`` that matched.
+        :return: None.
+        """
+
+    def on_construct(
+            self,
+            injectable: 'jacked.Injectable',
+            instance: object,
+            duration: float):
+        """
+        Called after a new instance of an ``Injectable`` was created.
+        :param injectable: the ``Injectable`` of which an instance was created.
+        :param instance: the new instance.
+        :param duration: the time it took to create ``instance``.
+        :return: None.
+        """
+
+    def on_resolve_end(
+            self,
+            hint: object,
+            injectable: Optional['jacked.Injectable'],
+            duration: float,
+            error: Optional[BaseException] = None):
+        """
+        Called after ``hint`` was resolved, also if resolving failed.
+        :param hint: the type hint that was resolved.
+        :param injectable: the ``Injectable`` with the highest priority or
+        ``None`` if there were no candidates.
+        :param duration: the time it took to resolve ``hint``, including the
+        construction of instances.
+        :param error: the error that made resolving fail or ``None``.
+        :return: None.
+        """
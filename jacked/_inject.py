@@ -6,23 +6,37 @@ functions.
 """
 import functools
 import inspect
-from collections import ChainMap
+import time
+from contextlib import ExitStack, contextmanager
 from functools import partial, lru_cache
-from pathlib import Path
-from typing import List, Dict, Any, Type, Tuple
-from jacked import _container
+from importlib import import_module
+from typing import (
+    List,
+    Dict,
+    Any,
+    Type,
+    Tuple,
+    Optional,
+    Callable,
+    Sequence,
+)
+import jacked
+from jacked import _container, _scope
+from jacked._compatibility_impl import evaluate_hint, rename_code
 from jacked._container import DEFAULT_CONTAINER
-from jacked._discover import discover
 from jacked._exceptions import InjectionError, InvalidUsageError
-from jacked._injectable import Injectable
-from jacked._typing import T
+from jacked._injectable import Injectable, POOL, SCOPED
+from jacked._lazy import Pending
+from jacked._qualifiers import Named, Where
+from jacked._typing import T, has_forward_refs, split_annotated
 from jacked.matchers._base_matcher import BaseMatcher
 
 
 def inject_here(
         hint: Type[T],
         *,
-        container: _container.Container = _container.DEFAULT_CONTAINER
+        container: _container.Container = _container.DEFAULT_CONTAINER,
+        where: Optional[Dict[str, object]] = None
 ) -> T:
     """
     Usage example:
@@ -32,9 +46,10 @@ def inject_here(
     :param hint: the type that hints what is to be returned.
     :param container: the Container from which the injectable is to be
     returned.
+    :param where: the meta data that the injectable must have.
     :return: an injectable that corresponds to ``hint``.
     """
-    candidates = _get_candidates(hint, container)
+    candidates = _get_candidates(hint, container, True, where)
     if not candidates:
         raise InjectionError('No suitable candidates for "{}".'
                              .format(hint), hint)
@@ -62,24 +77,159 @@ def inject(
     :return: a decorator.
     """
     if decorated:
-        _check_decorated(decorated)
-        return functools.update_wrapper(
-            lambda *args, **kwargs: _wrapper(decorated, container,
-                                             *args, **kwargs), decorated)
+        return _decorator(decorated, container)
     return partial(_decorator, container=container)
 
 
+def bind(
+        func: callable,
+        *,
+        container: _container.Container = _container.DEFAULT_CONTAINER,
+        rebind: bool = False) -> callable:
+    """
+    Resolve the injectable parameters of ``func`` once and return a callable
+    that passes them to ``func`` on every call, like ``functools.partial``
+    does. Parameters that cannot be injected are left to the caller. This
+    avoids the cost of injection in tight loops.
+
+    Usage example:
+
+        process = bind(process_record)
+        for record in records:
+            process(record)
+
+    :param func: the function (optionally decorated with ``inject``) of which
+    the parameters are bound.
+    :param container: the storage that is used that contains all
+    ``Injectables``.
+    :param rebind: if ``True``, the parameters are resolved again when an
+    ``Injectable`` was registered to ``container`` since they were resolved.
+    :return: a callable with the parameters that were not bound.
+    """
+    decorated = getattr(func, '_jacked_decorated', func)
+    _check_decorated(decorated)
+    signature = inspect.signature(decorated)
+    parameters = _get_parameters(decorated, True)
+    # The revision, the bound arguments, the number of leading positional
+    # parameters that are not bound and whether there are results of async
+    # providers to await:
+    state = [None, None, 0, False]
+
+    def _refresh():
+        revision = container.revision
+        arguments = _bind_arguments(parameters, container)
+        state[3] = any(isinstance(value, Pending)
+                       for value in arguments.values())
+        state[2] = _count_free_positionals(parameters, arguments)
+        state[1] = arguments
+        state[0] = revision
+
+    async def _resolve_pending():
+        # Results of async providers are awaited once. They are awaited into
+        # a copy, so concurrent first calls do not change what others read.
+        arguments = state[1]
+        resolved = dict(arguments)
+        await _await_pending(resolved)
+        if state[1] is arguments:
+            state[1] = resolved
+            state[3] = False
+
+    def _call_arguments(args, kwargs_):
+        # Map the given arguments onto the parameters that are not bound.
+        if len(args) <= state[2]:
+            if kwargs_:
+                return args, {**state[1], **kwargs_}
+            return args, state[1]
+        return _merge_arguments(signature, state[1], args, kwargs_)
+
+    _refresh()
+    if inspect.iscoroutinefunction(decorated):
+        async def _bound(*args, **kwargs_):
+            if rebind and container.revision != state[0]:
+                _refresh()
+            if state[3]:
+                await _resolve_pending()
+            args, kwargs_ = _call_arguments(args, kwargs_)
+            return await decorated(*args, **kwargs_)
+    else:
+        def _bound(*args, **kwargs_):
+            if rebind and container.revision != state[0]:
+                _refresh()
+            args, kwargs_ = _call_arguments(args, kwargs_)
+            return decorated(*args, **kwargs_)
+    rename_code(_bound, decorated)
+    result = functools.update_wrapper(_bound, decorated)
+    result.__signature__ = signature.replace(parameters=[
+        param for param in signature.parameters.values()
+        if param.name not in state[1]])
+    return result
+
+
 def get_candidates(
         hint: T,
         *,
-        container: _container.Container = DEFAULT_CONTAINER) -> List[T]:
+        container: _container.Container = DEFAULT_CONTAINER,
+        where: Optional[Dict[str, object]] = None) -> List[T]:
     """
     Return all candidates for the given type ``T`` and return them in a list.
+
+    Usage example:
+
+        eu_dbs = get_candidates(Db, where={'region': 'eu'})
+
     :param hint: the type for which candidates are to be returned.
     :param container: the container from which the injectables are fetched.
+    :param where: the meta data that the candidates must have. Only the
+    injectables with that meta data are matched and created.
     :return: a list of candidates of type ``T``.
     """
-    return [c for c, _ in _get_candidates(hint, container)]
+    return [c for c, _ in _get_candidates(hint, container, False, where)]
+
+
+def inject_many(
+        hints: Sequence[type],
+        *,
+        container: _container.Container = DEFAULT_CONTAINER) -> List[object]:
+    """
+    Return an injectable for each of the given hints, like ``inject_here``
+    does for one hint. The registry is searched only once for all hints.
+
+    Usage example:
+
+        db, cache = inject_many([Db, Cache])
+
+    :param hints: the types that hint what is to be returned.
+    :param container: the Container from which the injectables are to be
+    returned.
+    :return: a list with an injectable for each hint, in the order of
+    ``hints``.
+    """
+    result = []
+    all_candidates = _get_candidates_many(hints, container, True)
+    for hint, candidates in zip(hints, all_candidates):
+        if not candidates:
+            raise InjectionError('No suitable candidates for "{}".'
+                                 .format(hint), hint)
+        result.append(_choose_candidate(candidates))
+    return result
+
+
+def get_candidates_many(
+        hints: Sequence[type],
+        *,
+        container: _container.Container = DEFAULT_CONTAINER
+) -> List[List[object]]:
+    """
+    Return all candidates for each of the given hints, like
+    ``get_candidates`` does for one hint. The registry is searched only once
+    for all hints.
+    :param hints: the types for which candidates are to be returned.
+    :param container: the container from which the injectables are fetched.
+    :return: a list with a list of candidates for each hint, in the order of
+    ``hints``.
+    """
+    return [[c for c, _ in candidates]
+            for candidates in _get_candidates_many(hints, container, False)]
 
 
 def _decorator(
@@ -88,9 +238,7 @@ def _decorator(
     # This function acts as the "actual decorator" if any arguments were passed
     # to `inject`.
     _check_decorated(decorated)
-    return functools.update_wrapper(
-        lambda *args, **kwargs: _wrapper(decorated, container, *args,
-                                         **kwargs), decorated)
+    return _create_wrapper(decorated, container)
 
 
 def _check_decorated(decorated: callable):
@@ -110,45 +258,158 @@ def _check_hint(hint: Any):
     pass  # TODO implement this.
 
 
-def _wrapper(
+def _create_wrapper(
         decorated: callable,
-        container: _container.Container,
-        *args,
-        **kwargs_):
-    # This function is wrapped around the decorated object. It will collect
-    # arguments and inject them to `decorated` by providing these arguments.
-    signature = inspect.signature(decorated)
+        container: _container.Container) -> callable:
+    # This function creates the function that is wrapped around the decorated
+    # object. It will collect arguments and inject them to `decorated` by
+    # providing these arguments. Resources (e.g. pooled instances or entered
+    # context managers) are released when the call is done.
+    # The parameters with evaluated hints, or None until forward references
+    # can be resolved:
+    cell = [_get_parameters(decorated, False)]
+    if inspect.iscoroutinefunction(decorated):
+        async def _wrapper(*args, **kwargs_):
+            parameters = cell[0] or _get_parameters_later(decorated, cell)
+            arguments, stack = _prepare(parameters, container, args, kwargs_,
+                                        True)
+            if stack is None:
+                await _await_pending(arguments)
+                arguments.update(kwargs_)
+                return await decorated(*args, **arguments)
+            if isinstance(stack, ExitStack):
+                # Nothing was entered asynchronously.
+                with stack:
+                    await _await_pending(arguments)
+                    arguments.update(kwargs_)
+                    return await decorated(*args, **arguments)
+            async with stack:
+                await _await_pending(arguments)
+                arguments.update(kwargs_)
+                return await decorated(*args, **arguments)
+    else:
+        def _wrapper(*args, **kwargs_):
+            parameters = cell[0] or _get_parameters_later(decorated, cell)
+            arguments, stack = _prepare(parameters, container, args, kwargs_)
+            arguments.update(kwargs_)
+            if stack is None:
+                return decorated(*args, **arguments)
+            with stack:
+                return decorated(*args, **arguments)
+    # Let profilers attribute the time spent in the wrapper to `decorated`:
+    rename_code(_wrapper, decorated)
+    _wrapper._jacked_decorated = decorated  # Allows `bind` to skip _wrapper.
+    return functools.update_wrapper(_wrapper, decorated)
+
+
+def _create_manager_factory(
+        decorated: callable,
+        container: _container.Container) -> Callable[[], object]:
+    # Return a factory of context managers that run the (async) generator
+    # function `decorated`. Its parameters are injected within the scope of
+    # the call that a manager is entered for, so what it depends on is
+    # released after it.
+    if inspect.isasyncgenfunction(decorated):
+        from contextlib import asynccontextmanager  # Python3.7+.
+
+        manager = asynccontextmanager(decorated)
+    else:
+        manager = contextmanager(decorated)
+    cell = [_get_parameters(decorated, False)]
+
+    def _factory():
+        parameters = cell[0] or _get_parameters_later(decorated, cell)
+        return manager(**_collect_arguments(parameters, {}, container))
+    return _factory
+
+
+def _get_parameters(
+        decorated: callable,
+        final: bool) -> Optional[Tuple[inspect.Parameter, ...]]:
+    # Return the parameters of `decorated`. Hints that are written as strings
+    # are evaluated one by one. If a name is not defined (yet), None is
+    # returned to try again later, unless `final`, in which case the hint is
+    # left as a string; it only fails if it needs to be injected.
+    parameters = tuple(inspect.signature(decorated).parameters.values())
+    result = []
+    for param in parameters:
+        if has_forward_refs(param.annotation):
+            try:
+                hint = evaluate_hint(param.annotation, decorated, True)
+            except (NameError, TypeError):
+                if not final:
+                    return None
+            else:
+                param = param.replace(annotation=hint)
+        result.append(param)
+    return tuple(result)
+
+
+def _get_parameters_later(
+        decorated: callable,
+        cell: list) -> Tuple[inspect.Parameter, ...]:
+    # Return the parameters of `decorated` of which the hints could not be
+    # evaluated upon decoration and store them in `cell`.
+    parameters = cell[0]
+    if parameters is None:
+        parameters = _get_parameters(decorated, True)
+        cell[0] = parameters
+    return parameters
+
+
+async def _await_pending(arguments: Dict[str, object]):
+    # Replace the results of async providers by their awaited values.
+    for name, value in arguments.items():
+        if isinstance(value, Pending):
+            arguments[name] = await value
 
+
+def _prepare(
+        parameters: Tuple[inspect.Parameter, ...],
+        container: _container.Container,
+        args: tuple,
+        kwargs_: Dict[str, object],
+        is_async: bool = False
+) -> Tuple[Dict[str, object], Optional[ExitStack]]:
+    # This function collects the arguments that are to be injected into a call
+    # with `args` and `kwargs_` and returns them together with the resources
+    # that were acquired for this call. If `is_async` and some resources were
+    # entered asynchronously, the resources are in an AsyncExitStack.
     if args:
-        # If there are any ordered parameters given, filter them out of the
-        # signature to prevent the search for injection candidates:
-        filtered_params = list(signature.parameters.values())[len(args):]
-        signature = inspect.Signature(filtered_params)
+        # Parameters that were given positionally are not injected:
+        parameters = parameters[len(args):]
 
     # Collect the arguments for injection:
-    arguments = _collect_arguments(signature, container)
-    kwargs_ = ChainMap(kwargs_, arguments)  # Note: kwargs_ takes precedence.
-
-    # Now all arguments are collected, "inject" them into `decorated`:
-    return decorated(*args, **kwargs_)
+    outer = _scope.begin(is_async)
+    try:
+        arguments = _collect_arguments(parameters, kwargs_, container)
+    except BaseException:
+        _scope.abort(outer)
+        raise
+    stack = _scope.end(outer)
+    return arguments, stack
 
 
 def _collect_arguments(
-        signature: inspect.Signature,
+        parameters: Tuple[inspect.Parameter, ...],
+        given: Dict[str, object],
         container: _container.Container) -> Dict[str, object]:
-    # This function tries to collect arguments for the given signature and
-    # returns a dictionary that corresponds to that signature.
+    # This function tries to collect arguments for the given parameters that
+    # were not `given` and returns them in a dictionary.
     result = {}
-    for param_name in signature.parameters:
-        if param_name in ('self', 'cls'):
+    for param in parameters:
+        param_name = param.name
+        if param_name in given or param_name in ('self', 'cls'):
             continue
-        param = signature.parameters[param_name]
-        hint = param.annotation
-        # Get all candidates that could be injected according to `signature`:
-        candidates = _get_candidates(hint, container)
+        # Get the candidate that is to be injected according to `param`:
+        candidates = _get_candidates(param.annotation, container, True)
         if not candidates:
             result[param_name] = param.default
             if param.default is inspect.Parameter.empty:
+                if has_forward_refs(param.annotation):
+                    raise InjectionError('Could not resolve the hint "{}" of '
+                                         '"{}".'.format(param.annotation,
+                                                        param_name), param)
                 raise InjectionError('No suitable candidates for "{}".'
                                      .format(param_name), param)
         else:
@@ -157,40 +418,347 @@ def _collect_arguments(
     return result
 
 
+def _bind_arguments(
+        parameters: Tuple[inspect.Parameter, ...],
+        container: _container.Container) -> Dict[str, object]:
+    # Resolve the given parameters for `bind`; those without candidates are
+    # skipped. Objects that are bound to the scope of a call (e.g. pooled or
+    # scoped instances) cannot be bound.
+    result = {}
+    outer = _scope.begin()
+    try:
+        for param in parameters:
+            if param.name in ('self', 'cls'):
+                continue
+            candidates = _get_candidates(param.annotation, container, True)
+            if candidates:
+                result[param.name] = _choose_candidate(candidates)
+    finally:
+        stack = _scope.end(outer)
+    if stack is not None:
+        stack.close()
+        raise InvalidUsageError('Parameters that are released after each '
+                                'call (e.g. pooled or scoped instances) '
+                                'cannot be bound.')
+    return result
+
+
+def _count_free_positionals(
+        parameters: Tuple[inspect.Parameter, ...],
+        bound: Dict[str, object]) -> int:
+    # Return the number of leading positional parameters that are not bound;
+    # that many positional arguments can be passed on as they are.
+    result = 0
+    for param in parameters:
+        if (param.kind not in (inspect.Parameter.POSITIONAL_ONLY,
+                               inspect.Parameter.POSITIONAL_OR_KEYWORD)
+                or param.name in bound):
+            break
+        result += 1
+    return result
+
+
+def _merge_arguments(
+        signature: inspect.Signature,
+        bound: Dict[str, object],
+        args: tuple,
+        kwargs_: Dict[str, object]) -> Tuple[tuple, Dict[str, object]]:
+    # Return the arguments for a call with the `bound` arguments and the given
+    # arguments, of which the positional ones fill the parameters that are not
+    # bound. Given keyword arguments override bound ones.
+    free = signature.replace(parameters=[
+        param for param in signature.parameters.values()
+        if param.name not in bound or param.name in kwargs_])
+    given = free.bind_partial(*args, **kwargs_).arguments
+    arguments = {name: given[name] if name in given else bound[name]
+                 for name in signature.parameters
+                 if name in given or name in bound}
+    call = inspect.BoundArguments(signature, arguments)
+    return call.args, call.kwargs
+
+
 def _get_candidates(
         hint: T,
-        container: _container.Container) -> List[Tuple[T, Injectable]]:
+        container: _container.Container,
+        first_only: bool,
+        where: Optional[Dict[str, object]] = None
+) -> List[Tuple[T, Injectable]]:
     # Search in the known injectables in `container` for all matching
-    # candidates. The candidates are returned sorted by their priority.
-    candidates = ((_match(hint, injectable, container), injectable)
-                  for injectable in container.injectables)
-    result = [(c, i) for c, i in candidates if c]
-    result.sort(key=lambda c: c[1].priority, reverse=True)
+    # candidates. The candidates are returned sorted by their priority. If
+    # `first_only`, the search stops at the first match. Only injectables with
+    # the meta data in `where` are considered.
+    hooks = container.hooks
+    if hooks:
+        return _get_candidates_traced(hint, container, hooks, first_only,
+                                      where)
+    return _find_candidates(hint, container, first_only, where)
+
+
+def _get_candidates_traced(
+        hint: T,
+        container: _container.Container,
+        hooks: Tuple['jacked.Hook', ...],
+        first_only: bool,
+        where: Optional[Dict[str, object]] = None
+) -> List[Tuple[T, Injectable]]:
+    # Search the candidates like `_get_candidates` while notifying `hooks`.
+    start = time.perf_counter()
+    for hook in hooks:
+        hook.on_resolve_start(hint)
+    result = None
+    error = None
+    try:
+        result = _find_candidates(hint, container, first_only, where)
+        for _, injectable in result:
+            for hook in hooks:
+                hook.on_candidate_matched(hint, injectable)
+        return result
+    except BaseException as err:
+        error = err
+        raise
+    finally:
+        # Every start gets its end, also when the resolution failed.
+        duration = time.perf_counter() - start
+        chosen = result[0][1] if result else None
+        for hook in hooks:
+            hook.on_resolve_end(hint, chosen, duration, error)
+
+
+def _find_candidates(
+        hint: T,
+        container: _container.Container,
+        first_only: bool,
+        where: Optional[Dict[str, object]] = None
+) -> List[Tuple[T, Injectable]]:
+    # Match `hint` with the injectables in `container`, which are kept in the
+    # order of their priority.
+    hint, qualifiers = split_annotated(hint)
+    matcher = _get_matcher(hint)
+    if not matcher:
+        return []
+    criteria = _get_criteria(qualifiers, where)
+    named = [q for q in qualifiers if isinstance(q, Named)]
+    if named:
+        # Named injectables are looked up directly instead of scanned.
+        injectable = container.get_by_name(named[-1].name)
+        injectables = [injectable] if injectable is not None else []
+        if criteria:
+            injectables = [i for i in injectables
+                           if Where(criteria).accepts(i)]
+    elif criteria:
+        # Only the injectables with the meta data are looked up.
+        injectables = container.select(criteria)
+    elif matcher.is_indexed():
+        injectables = _get_indexed(hint, matcher, container)
+    else:
+        injectables = container.injectables
+    result = []
+    for injectable in injectables:
+        candidate = matcher.match(hint, injectable, container)
+        if candidate:
+            result.append((candidate, injectable))
+            if first_only:
+                break
     return result
 
 
+def _get_indexed(
+        hint: T,
+        matcher: BaseMatcher,
+        container: _container.Container) -> List[Injectable]:
+    # Return the injectables that `matcher` considers candidates for `hint`,
+    # in the order of their priority. They are looked up once per hint and
+    # looked up again after the container changed.
+    try:
+        return container.cached((_BY_TYPE, hint), partial(
+            _find_indexed, hint, matcher, container))
+    except TypeError:
+        # The hint is not hashable.
+        return _find_indexed(hint, matcher, container)
+
+
+def _find_indexed(
+        hint: T,
+        matcher: BaseMatcher,
+        container: _container.Container) -> List[Injectable]:
+    return [injectable for injectable in container.injectables
+            if matcher.is_candidate(hint, injectable, container)]
+
+
+def _get_candidates_many(
+        hints: Sequence[type],
+        container: _container.Container,
+        first_only: bool) -> List[List[Tuple[object, Injectable]]]:
+    # Return the candidates for each hint in `hints` like `_get_candidates`
+    # does. If `first_only`, at most one candidate is created per hint.
+    hooks = container.hooks
+    if hooks:
+        # Resolutions are reported to the hooks per hint.
+        return [_get_candidates_traced(hint, container, hooks, first_only)
+                for hint in hints]
+    plans = _plan_many(hints, container)
+    result = []
+    for hint in hints:
+        hint_, matcher, injectables = plans[_plan_key(hint)]
+        candidates = []
+        for injectable in injectables:
+            candidate = matcher.match(hint_, injectable, container)
+            if candidate:
+                candidates.append((candidate, injectable))
+                if first_only:
+                    break
+        result.append(candidates)
+    return result
+
+
+def _plan_many(
+        hints: Sequence[type],
+        container: _container.Container) -> Dict[object, tuple]:
+    # Determine for every distinct hint in `hints` its matcher and the
+    # injectables that it matches with, in the order of their priority. All
+    # hints are matched in a single pass over the injectables in `container`
+    # without creating anything.
+    result = {}
+    scanned = []
+    for hint in hints:
+        key = _plan_key(hint)
+        if key in result:
+            continue
+        hint_, qualifiers = split_annotated(hint)
+        matcher = _get_matcher(hint_)
+        matches = []
+        result[key] = (hint_, matcher, matches)
+        named = [q for q in qualifiers if isinstance(q, Named)]
+        criteria = _get_criteria(qualifiers, None)
+        if not matcher:
+            continue
+        elif named:
+            # Named injectables are looked up directly instead of scanned.
+            injectable = container.get_by_name(named[-1].name)
+            if (injectable is not None
+                    and _accepts(qualifiers, injectable)
+                    and matcher.is_candidate(hint_, injectable, container)):
+                matches.append(injectable)
+        elif criteria:
+            # Only the injectables with the meta data are looked up.
+            matches.extend(
+                injectable for injectable in container.select(criteria)
+                if matcher.is_candidate(hint_, injectable, container))
+        else:
+            scanned.append((hint_, matcher, qualifiers, matches))
+    if scanned:
+        for injectable in container.injectables:
+            for hint_, matcher, qualifiers, matches in scanned:
+                if (_accepts(qualifiers, injectable)
+                        and matcher.is_candidate(hint_, injectable,
+                                                 container)):
+                    matches.append(injectable)
+    return result
+
+
+def _plan_key(hint: object) -> object:
+    # Return a key that identifies `hint`, even if it is not hashable (e.g.
+    # an Annotated hint with a dict as metadata).
+    try:
+        hash(hint)
+    except TypeError:
+        return id(hint)
+    return hint
+
+
+def _get_criteria(
+        qualifiers: tuple,
+        where: Optional[Dict[str, object]]) -> Dict[str, object]:
+    # Return the meta data of all `Where` qualifiers combined with `where`.
+    result = {}
+    for qualifier in qualifiers:
+        if isinstance(qualifier, Where):
+            result.update(qualifier.criteria)
+    if where:
+        result.update(where)
+    return result
+
+
+def _accepts(qualifiers: tuple, injectable: Injectable) -> bool:
+    # Return whether `injectable` satisfies all the given qualifiers.
+    return all(qualifier.accepts(injectable) for qualifier in qualifiers
+               if hasattr(qualifier, 'accepts'))
+
+
 def _choose_candidate(candidates: List[Tuple[T, Injectable]]) -> T:
     # From a list of candidates, pick and return one:
     return candidates[0][0]  # The first should have the highest priority.
 
 
-def _match(
+def _defer_match(
         hint: type,
         injectable: Injectable,
-        container: _container.Container) -> object:
-    # Check if the given `parameter` matches with the given `injectable`. If
-    # there appears to be a match, return what is to be injected (e.g. an
-    # instance of a class, a class itself, ...). If no match, return `None`.
+        container: _container.Container) -> Optional[Callable[[], object]]:
+    # Check if `hint` matches with `injectable` without creating anything. If
+    # there appears to be a match, return a callable that returns what is to
+    # be injected. If no match, return `None`.
+    hint, qualifiers = split_annotated(hint)
+    if not _accepts(qualifiers, injectable):
+        return None
+    matcher = _get_matcher(hint)
+    if matcher and matcher.is_candidate(hint, injectable, container):
+        factory = partial(matcher.match, hint, injectable, container)
+        if injectable.lifetime in (POOL, SCOPED):
+            factory = _bind_to_scope(factory, injectable)
+        return factory
+
+
+def _bind_to_scope(
+        factory: Callable[[], object],
+        injectable: Injectable) -> Callable[[], object]:
+    # Return a callable that calls `factory` within the scope of the current
+    # call, so that pooled or scoped instances that it creates later on are
+    # released with that call.
+    captured = _scope.capture()
+    if captured is None:
+        return factory  # The matcher raises upon calling it.
+    stack, done = captured
+
+    def _factory():
+        if done:
+            raise InjectionError('The {} injectable "{}" cannot be resolved '
+                                 'after the call that it was injected into '
+                                 'is done.'.format(injectable.lifetime,
+                                                   injectable.name),
+                                 injectable.subject)
+        outer = _scope.resume(stack)
+        try:
+            return factory()
+        finally:
+            _scope.end(outer)
+    return _factory
+
+
+def _get_matcher(hint: type) -> Optional[BaseMatcher]:
+    # Return the matcher with the highest priority that can handle `hint`.
     for matcher in _get_matchers():
         if matcher.can_match(hint):
-            # Match or no match, return anyway:
-            return matcher.match(hint, injectable, container)
+            return matcher
+
+
+# The modules in jacked.matchers that contain the matchers:
+_MATCHER_MODULES = (
+    '_callable',
+    '_dict',
+    '_lazy',
+    '_list',
+    '_object',
+    '_provider',
+    '_type',
+)
 
 
 @lru_cache()
 def _get_matchers() -> List[BaseMatcher]:
-    path_to_matchers = str(Path(__file__).parent.joinpath(Path('matchers')))
-    modules = discover(path_to_matchers)
+    # The matchers are imported upon the first injection rather than when
+    # jacked is imported.
+    modules = [import_module('jacked.matchers.' + name)
+               for name in _MATCHER_MODULES]
 
     public_elements = [getattr(mod, elem) for mod in modules
                        for elem in dir(mod) if not elem.startswith('_')]
@@ -200,3 +768,6 @@ def _get_matchers() -> List[BaseMatcher]:
     matchers.sort(key=lambda m: m.priority(), reverse=True)
 
     return matchers
+
+
+_BY_TYPE = object()  # The key of the cached candidates per hint.
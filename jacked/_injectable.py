@@ -3,10 +3,23 @@ PRIVATE MODULE: do not import (from) it directly.
 
 This module contains the ``Injectable`` class and the ``injectable`` decorator.
 """
+import inspect
 from functools import partial
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple, Callable, Union
+import jacked
 from jacked import _container
-from jacked._typing import AttrDict
+from jacked._compatibility_impl import evaluate_hint
+from jacked._exceptions import InvalidUsageError
+from jacked._typing import AttrDict, NoneType
+
+
+TRANSIENT = 'transient'
+SINGLETON = 'singleton'
+POOL = 'pool'
+THREAD = 'thread'
+SCOPED = 'scoped'
+LIFETIMES = (TRANSIENT, SINGLETON, POOL, THREAD, SCOPED)
+DEFAULT_POOL_SIZE = (1, 10)
 
 
 class Injectable:
@@ -19,7 +32,12 @@ class Injectable:
             subject: object,
             priority: int,
             singleton: bool,
-            meta: Dict[str, Any]):
+            meta: Dict[str, Any],
+            lifetime: Optional[str] = None,
+            pool_size: Tuple[int, int] = DEFAULT_POOL_SIZE,
+            pool_timeout: Optional[float] = None,
+            provides: Optional[type] = None,
+            factory: Optional[Callable[[], object]] = None):
         """
         Constructor.
         :param subject: the thing that is to be injected.
@@ -28,11 +46,28 @@ class Injectable:
         :param singleton: if ``True`` and ``subject`` is a class, then only one
         instance is ever injected.
         :param meta: any meta information.
+        :param lifetime: one of ``LIFETIMES``; overrides ``singleton`` if
+        given.
+        :param pool_size: the minimum and maximum number of instances if the
+        lifetime is ``POOL``.
+        :param pool_timeout: the number of seconds a checkout from the pool
+        may block, or ``None`` to wait indefinitely.
+        :param provides: the type of the objects that ``subject`` returns if
+        ``subject`` is a provider function.
+        :param factory: a callable without arguments that creates what is
+        injected; ``subject`` is called if not given.
         """
         self._subject = subject
-        self._singleton = singleton
+        self._lifetime = lifetime or (SINGLETON if singleton else TRANSIENT)
         self._meta = meta
         self._priority = priority
+        self._pool_size = pool_size
+        self._pool_timeout = pool_timeout
+        self._provides = provides
+        self._factory = factory
+        self._is_async = (inspect.iscoroutinefunction(subject)
+                          or (self._lifetime == SCOPED
+                              and _enters_async(subject)))
 
     @property
     def name(self) -> str:
@@ -44,15 +79,35 @@ class Injectable:
 
     @property
     def subject(self) -> object:
-        # Set the meta data 'just in time' to allow different meta objects in
-        # different Containers.
-        result = self._subject
-        result.__meta__ = self.meta  # Use the property, not the field.
-        return result
+        return self._subject
+
+    @property
+    def factory(self) -> Callable[[], object]:
+        return self._factory or self.subject
+
+    @property
+    def provides(self) -> Optional[type]:
+        return self._provides
+
+    @property
+    def is_async(self) -> bool:
+        return self._is_async
 
     @property
     def singleton(self) -> bool:
-        return self._singleton
+        return self._lifetime == SINGLETON
+
+    @property
+    def lifetime(self) -> str:
+        return self._lifetime
+
+    @property
+    def pool_size(self) -> Tuple[int, int]:
+        return self._pool_size
+
+    @property
+    def pool_timeout(self) -> Optional[float]:
+        return self._pool_timeout
 
     @property
     def priority(self) -> int:
@@ -66,7 +121,11 @@ def injectable(
         priority: int = 0,
         meta: Dict[str, Any] = None,
         singleton: bool = False,
-        container: _container.Container = _container.DEFAULT_CONTAINER
+        container: _container.Container = _container.DEFAULT_CONTAINER,
+        lifetime: Optional[str] = None,
+        pool_size: Tuple[int, int] = DEFAULT_POOL_SIZE,
+        pool_timeout: Optional[float] = None,
+        provides: Union[bool, type] = False
 ):
     """
     A decorator that marks something as injectable.
@@ -87,13 +146,87 @@ def injectable(
     :param singleton: if True and ``decorated`` is a class, then a singleton
     instance will be injected for every injection on from ``container``.
     :param container: the registry that stores the new injectable.
+    :param lifetime: how long an injected instance lives: ``'transient'``
+    (a new instance per injection), ``'singleton'``, ``'pool'`` (an instance
+    is checked out of a pool for the duration of an ``inject`` call),
+    ``'thread'`` (one instance per thread, released when the thread ends) or
+    ``'scoped'`` (a context manager class that is entered for the duration
+    of an ``inject`` call). Generator providers are always scoped.
+    :param pool_size: the minimum and maximum number of pooled instances.
+    :param pool_timeout: the number of seconds a checkout from an exhausted
+    pool may block before failing; ``None`` blocks indefinitely.
+    :param provides: makes a function a provider of objects: the function is
+    called to create the objects that are injected for hints of the type that
+    it returns. If ``True``, that type is taken from the return annotation.
+    A provider may be an (async) generator function that yields the object
+    and cleans it up after the ``inject`` call it was injected into.
     :return: a decorator.
     """
+    args = (name, priority, meta, singleton, container, lifetime, pool_size,
+            pool_timeout, provides)
+    _check_arguments(*args)
     if decorated:
-        result = _decorator(name, priority, meta, singleton,
-                          container, decorated)
+        result = _decorator(*args, decorated)
         return result
-    return partial(_decorator, name, priority, meta, singleton, container)
+    return partial(_decorator, *args)
+
+
+def _check_arguments(
+        name: str,
+        priority: int,
+        meta: Dict[str, Any],
+        singleton: bool,
+        container: _container.Container,
+        lifetime: Optional[str],
+        pool_size: Tuple[int, int],
+        pool_timeout: Optional[float],
+        provides: Union[bool, type]):
+    # This function validates the arguments of the decorator and raises upon
+    # an invalid combination.
+    if lifetime is not None and lifetime not in LIFETIMES:
+        raise InvalidUsageError('Unknown lifetime "{}", expected one of {}.'
+                                .format(lifetime, LIFETIMES))
+    if singleton and lifetime not in (None, SINGLETON):
+        raise InvalidUsageError('An injectable cannot be a singleton and '
+                                'have the lifetime "{}".'.format(lifetime))
+    min_size, max_size = pool_size
+    if not 0 <= min_size <= max_size or max_size < 1:
+        raise InvalidUsageError('Invalid pool size {}: expected (min, max) '
+                                'with 0 <= min <= max and max >= 1.'
+                                .format(pool_size))
+    if not isinstance(provides, bool) and not (
+            inspect.isclass(provides)
+            or getattr(provides, '__origin__', None) is not None):
+        raise InvalidUsageError('Invalid provides {!r}: expected a bool or a '
+                                'type.'.format(provides))
+
+
+def _check_provider(decorated: object, provides: Union[bool, type]):
+    # This function validates the decorated provider function and raises if
+    # the type that it provides cannot be determined.
+    if not provides:
+        return
+    if not inspect.isfunction(decorated):
+        raise InvalidUsageError('Only functions can be providers.')
+    if provides is not True:
+        return
+    result = _get_return_hint(decorated)
+    if result in (None, NoneType):
+        raise InvalidUsageError('The provider "{}" has no return annotation.'
+                                .format(decorated.__name__))
+    if _is_generator(decorated) and not getattr(result, '__args__', None):
+        raise InvalidUsageError('The return annotation of the generator '
+                                'provider "{}" has no yield type.'
+                                .format(decorated.__name__))
+
+
+def _get_return_hint(decorated: Callable) -> Optional[type]:
+    # Evaluate only the return annotation of the decorated provider function;
+    # its parameters may refer to types that are not defined yet.
+    hint = getattr(decorated, '__annotations__', {}).get('return')
+    if hint is None:
+        return None
+    return evaluate_hint(hint, decorated)
 
 
 def _decorator(
@@ -102,15 +235,108 @@ def _decorator(
         meta: Dict[str, Any],
         singleton: bool,
         container: _container.Container,
+        lifetime: Optional[str],
+        pool_size: Tuple[int, int],
+        pool_timeout: Optional[float],
+        provides: Union[bool, type],
         decorated: object) -> callable:
     # This is the actual decorator that registers the decorated object.
     meta = {
         **(meta or {}),
         'name': name or decorated.__name__
     }
+    _check_provider(decorated, provides)
+    provided_type = _get_provided_type(decorated, provides)
+    lifetime = _get_lifetime(decorated, singleton, lifetime, provided_type)
+    factory = create_factory(decorated, provided_type, container)
     injectable_inst = Injectable(subject=decorated,
                                  priority=priority,
                                  singleton=singleton,
-                                 meta=meta)
+                                 meta=meta,
+                                 lifetime=lifetime,
+                                 pool_size=pool_size,
+                                 pool_timeout=pool_timeout,
+                                 provides=provided_type,
+                                 factory=factory)
     container.register(injectable_inst)
     return decorated
+
+
+def create_factory(
+        decorated: object,
+        provided_type: Optional[type],
+        container: _container.Container) -> Optional[Callable[[], object]]:
+    """
+    Return the factory of an ``Injectable`` with the given subject, or
+    ``None`` if the subject itself is the factory.
+    :param decorated: the subject of the ``Injectable``.
+    :param provided_type: the type that ``decorated`` provides, if it is a
+    provider function.
+    :param container: the ``Container`` from which the parameters of a
+    provider function are injected.
+    :return: a callable without arguments or ``None``.
+    """
+    if provided_type and _is_generator(decorated):
+        # The generator is turned into a context manager that is entered upon
+        # injection.
+        return jacked._inject._create_manager_factory(decorated, container)
+    if provided_type and inspect.signature(decorated).parameters:
+        # The parameters of a provider function are injected as well.
+        return jacked._inject.inject(decorated, container=container)
+    return None
+
+
+def _get_lifetime(
+        decorated: object,
+        singleton: bool,
+        lifetime: Optional[str],
+        provided_type: Optional[type]) -> Optional[str]:
+    # Return the lifetime of the decorated object and raise if it does not
+    # fit that object.
+    if provided_type and _is_generator(decorated):
+        if singleton or lifetime not in (None, SCOPED):
+            raise InvalidUsageError('The generator provider "{}" can only '
+                                    'have the lifetime "{}".'
+                                    .format(decorated.__name__, SCOPED))
+        return SCOPED
+    if inspect.iscoroutinefunction(decorated) and lifetime in (POOL, THREAD):
+        raise InvalidUsageError('The async provider "{}" cannot have the '
+                                'lifetime "{}".'.format(decorated.__name__,
+                                                        lifetime))
+    if lifetime == SCOPED and not (
+            provided_type is None and inspect.isclass(decorated)
+            and (hasattr(decorated, '__enter__')
+                 or hasattr(decorated, '__aenter__'))):
+        raise InvalidUsageError('Only context manager classes and generator '
+                                'providers can have the lifetime "{}".'
+                                .format(SCOPED))
+    return lifetime
+
+
+def _is_generator(decorated: object) -> bool:
+    return (inspect.isgeneratorfunction(decorated)
+            or inspect.isasyncgenfunction(decorated))
+
+
+def _enters_async(subject: object) -> bool:
+    # Return whether the scoped `subject` is entered asynchronously.
+    if inspect.isclass(subject):
+        return (hasattr(subject, '__aenter__')
+                and not hasattr(subject, '__enter__'))
+    return inspect.isasyncgenfunction(subject)
+
+
+def _get_provided_type(
+        decorated: object,
+        provides: Union[bool, type]) -> Optional[type]:
+    # Return the type that the decorated provider function returns or None if
+    # `decorated` is not a provider function.
+    if not provides:
+        return None
+    if provides is not True:
+        return provides
+    result = _get_return_hint(decorated)
+    if _is_generator(decorated):
+        # E.g. Iterator[Session] or AsyncGenerator[Session, None].
+        result = result.__args__[0]
+    return result
@@ -0,0 +1,119 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains the ``injected`` function that creates descriptors for
+lazily injected class attributes.
+"""
+import threading
+from typing import Optional
+from jacked import _compatibility_impl, _container
+from jacked._exceptions import InjectionError, InvalidUsageError
+from jacked._inject import inject_here
+
+
+_UNRESOLVED = object()
+
+
+def injected(
+        hint: Optional[type] = None,
+        *,
+        container: _container.Container = _container.DEFAULT_CONTAINER,
+        per_class: bool = False) -> '_Injected':
+    """
+    Create a class attribute that is injected upon its first access. Unlike
+    injecting in ``__init__``, creating an instance costs nothing extra, which
+    helps when many instances are created of which only few use the
+    dependency.
+
+    Usage example:
+
+        class Order:
+            db: Db = injected()
+
+            def save(self):
+                self.db.store(self)  # Db is injected here.
+
+    :param hint: the type that hints what is to be injected. If omitted, the
+    annotation of the attribute is used.
+    :param container: the Container from which the injectable is taken.
+    :param per_class: if ``True``, the injected object is shared by all
+    instances of the class. Otherwise it is stored in the ``__dict__`` of each
+    instance.
+    :return: a descriptor.
+    """
+    return _Injected(hint, container, per_class)
+
+
+class _Injected:
+    # A non-data descriptor: once an injected object is stored in the
+    # __dict__ of an instance, attribute lookups no longer reach __get__.
+    def __init__(
+            self,
+            hint: Optional[type],
+            container: _container.Container,
+            per_class: bool):
+        self._hint = hint
+        self._container = container
+        self._per_class = per_class
+        self._owner = None
+        self._name = None
+        self._value = _UNRESOLVED
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner: type, name: str):
+        self._owner = owner
+        self._name = name
+
+    def __get__(self, instance: object, owner: type = None) -> object:
+        if instance is None:
+            return self
+        if self._per_class:
+            return self._get_shared()
+        try:
+            instance_dict = instance.__dict__
+        except AttributeError:
+            raise InvalidUsageError(
+                'Cannot store injected attribute "{}" on an instance of "{}" '
+                'without __dict__; use per_class=True instead.'
+                .format(self._name, type(instance).__name__)) from None
+        value = self._resolve()
+        instance_dict[self._name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return 'injected({!r})'.format(self._hint)
+
+    def _get_shared(self) -> object:
+        # Resolve the object that is shared by all instances only once.
+        if self._value is _UNRESOLVED:
+            with self._lock:
+                if self._value is _UNRESOLVED:
+                    self._value = self._resolve()
+        return self._value
+
+    def _resolve(self) -> object:
+        if self._hint is None:
+            self._hint = self._get_annotation()
+        return inject_here(self._hint, container=self._container)
+
+    def _get_annotation(self) -> type:
+        # Return the annotation of the attribute; string annotations are
+        # evaluated now, so they may refer to types that are defined later.
+        if not self._owner:
+            raise InvalidUsageError('The injected attribute is not assigned '
+                                    'in a class body.')
+        annotations = self._owner.__dict__.get('__annotations__', {})
+        try:
+            annotation = annotations[self._name]
+        except KeyError:
+            raise InvalidUsageError(
+                'Cannot inject attribute "{}" of "{}" without a hint; add an '
+                'annotation or pass the hint to injected().'
+                .format(self._name, self._owner.__name__)) from None
+        try:
+            return _compatibility_impl.evaluate_hint(annotation, self._owner,
+                                                     True)
+        except NameError as err:
+            raise InjectionError('Could not resolve the hint "{}" of "{}": {}'
+                                 .format(annotation, self._name, err),
+                                 self._owner) from None
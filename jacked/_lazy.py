@@ -0,0 +1,109 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains the ``Lazy``, ``Provider`` and ``Pending`` classes that
+defer the construction of injected objects.
+"""
+from typing import Awaitable, Callable, Generic
+from jacked._typing import T
+
+
+_UNRESOLVED = object()
+
+
+class Lazy(Generic[T]):
+    """
+    A proxy that is injected for ``Lazy[T]`` hints. The actual ``T`` is
+    created upon the first attribute access and is reused afterwards.
+
+    Usage example:
+
+        @inject
+        def func(reporter: Lazy[ErrorReporter]):
+            ...
+            reporter.report(err)  # ErrorReporter is created here.
+
+    """
+    __slots__ = ('_factory', '_instance')
+
+    def __init__(self, factory: Callable[[], T]):
+        """
+        Constructor.
+        :param factory: a callable without arguments that creates the ``T``.
+        """
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_instance', _UNRESOLVED)
+
+    def __getattr__(self, item: str) -> object:
+        return getattr(_resolve(self), item)
+
+    def __setattr__(self, key: str, value: object):
+        setattr(_resolve(self), key, value)
+
+    def __repr__(self) -> str:
+        instance = object.__getattribute__(self, '_instance')
+        if instance is _UNRESOLVED:
+            return 'Lazy(<unresolved>)'
+        return 'Lazy({!r})'.format(instance)
+
+
+class Provider(Generic[T]):
+    """
+    A callable without arguments that is injected for ``Provider[T]`` hints.
+    Every call resolves a ``T``.
+
+    Usage example:
+
+        @inject
+        def func(provider: Provider[Connection]):
+            connection = provider()
+
+    """
+    __slots__ = ('_factory',)
+
+    def __init__(self, factory: Callable[[], T]):
+        """
+        Constructor.
+        :param factory: a callable without arguments that creates the ``T``.
+        """
+        self._factory = factory
+
+    def __call__(self) -> T:
+        return self._factory()
+
+    def __repr__(self) -> str:
+        return 'Provider({!r})'.format(self._factory)
+
+
+class Pending(Generic[T]):
+    """
+    An awaitable that is injected for objects that are created by an async
+    provider function. Functions that are decorated with ``inject`` await it
+    before they are called; ``inject_here`` returns it, so it can be awaited
+    by the caller.
+    """
+    __slots__ = ('_factory',)
+
+    def __init__(self, factory: Callable[[], Awaitable[T]]):
+        """
+        Constructor.
+        :param factory: a callable without arguments that returns an
+        awaitable that results in the ``T``. It is not called until the
+        ``Pending`` is awaited.
+        """
+        self._factory = factory
+
+    def __await__(self):
+        return self._factory().__await__()
+
+    def __repr__(self) -> str:
+        return 'Pending({!r})'.format(self._factory)
+
+
+def _resolve(lazy: Lazy) -> object:
+    # Return the instance of the given lazy proxy, create it if necessary.
+    instance = object.__getattribute__(lazy, '_instance')
+    if instance is _UNRESOLVED:
+        instance = object.__getattribute__(lazy, '_factory')()
+        object.__setattr__(lazy, '_instance', instance)
+    return instance
@@ -0,0 +1,172 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains the ``Pool`` class that holds the instances of pooled
+injectables.
+"""
+import threading
+import time
+from typing import Callable, List, Optional
+from jacked._exceptions import PoolExhaustedError
+from jacked._typing import AttrDict
+
+
+class Pool:
+    """
+    A thread safe pool of instances. Instances are created on demand until
+    ``max_size`` is reached, after which a checkout blocks until another
+    thread returns an instance or until the timeout expires.
+    """
+    def __init__(
+            self,
+            factory: Callable[[], object],
+            min_size: int,
+            max_size: int,
+            timeout: Optional[float] = None):
+        """
+        Constructor.
+        :param factory: a callable without arguments that creates an instance.
+        :param min_size: the number of instances that is created upon the first
+        checkout.
+        :param max_size: the maximum number of instances in this pool.
+        :param timeout: the number of seconds a checkout may block before it
+        fails, or ``None`` to block indefinitely.
+        """
+        self._factory = factory
+        self._min_size = min_size
+        self._max_size = max_size
+        self._timeout = timeout
+        self._condition = threading.Condition()
+        self._idle = []
+        self._size = 0
+        self._filled = False
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._peak_in_use = 0
+        self._dispose = None
+
+    def checkout(self) -> object:
+        """
+        Take an instance from this pool. The instance should be given back
+        using ``checkin`` once it is no longer used.
+        :return: an instance.
+        """
+        if not self._filled:
+            self._fill()
+        deadline = (None if self._timeout is None
+                    else time.monotonic() + self._timeout)
+        with self._condition:
+            if not self._idle and self._size >= self._max_size:
+                self._waits += 1
+            while not self._idle and self._size >= self._max_size:
+                remaining = (None if deadline is None
+                             else deadline - time.monotonic())
+                if remaining is not None and remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolExhaustedError(
+                        'Could not check out an instance within {} seconds; '
+                        'all {} instances are in use.'
+                        .format(self._timeout, self._max_size), self._factory)
+                self._condition.wait(remaining)
+            self._checkouts += 1
+            if self._idle:
+                instance = self._idle.pop()
+                self._update_peak()
+                return instance
+            # Reserve a slot and create the instance outside of the lock.
+            self._size += 1
+            self._update_peak()
+        return self._create()
+
+    def checkin(self, instance: object):
+        """
+        Return an instance that was taken using ``checkout`` to this pool.
+        :param instance: the instance that is given back.
+        :return: None.
+        """
+        with self._condition:
+            dispose = self._dispose
+            if dispose is None:
+                self._idle.append(instance)
+                self._condition.notify()
+                return
+            self._size -= 1
+        dispose(instance)
+
+    def drain(self) -> List[object]:
+        """
+        Remove all idle instances from this pool and return them, e.g. to
+        dispose them. Instances that are in use are not affected.
+        :return: a list of the removed instances.
+        """
+        with self._condition:
+            result, self._idle = self._idle, []
+            self._size -= len(result)
+        return result
+
+    def close(self, dispose: Callable[[object], None]) -> List[object]:
+        """
+        Remove all idle instances from this pool and return them, like
+        ``drain``. Instances that are in use are passed to ``dispose`` when
+        they are checked in, instead of being kept.
+        :param dispose: a callable that disposes a single instance.
+        :return: a list of the removed instances.
+        """
+        with self._condition:
+            self._dispose = dispose
+        return self.drain()
+
+    @property
+    def metrics(self) -> AttrDict:
+        """
+        Return the utilisation figures of this pool.
+        :return: an ``AttrDict`` with the sizes and counters of this pool.
+        """
+        with self._condition:
+            in_use = self._size - len(self._idle)
+            return AttrDict(min_size=self._min_size,
+                            max_size=self._max_size,
+                            size=self._size,
+                            idle=len(self._idle),
+                            in_use=in_use,
+                            peak_in_use=self._peak_in_use,
+                            checkouts=self._checkouts,
+                            waits=self._waits,
+                            timeouts=self._timeouts)
+
+    def _fill(self):
+        # Create instances until the pool holds at least `min_size` of them.
+        with self._condition:
+            missing = max(self._min_size - self._size, 0)
+            self._size += missing
+            self._filled = True
+        remaining = missing
+        try:
+            while remaining:
+                remaining -= 1
+                self.checkin(self._create())
+        finally:
+            if remaining:
+                # A creation failed (and gave back its own slot); give back
+                # the slots that are left unfilled and fill again next time.
+                with self._condition:
+                    self._size -= remaining
+                    self._filled = False
+                    self._condition.notify_all()
+
+    def _create(self) -> object:
+        # Create a new instance for a slot that was already reserved.
+        try:
+            return self._factory()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def _update_peak(self):
+        # Keep track of the highest number of simultaneously used instances.
+        # Must be called while holding the lock.
+        in_use = self._size - len(self._idle)
+        self._peak_in_use = max(self._peak_in_use, in_use)
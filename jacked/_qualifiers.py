@@ -0,0 +1,126 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains the qualifiers that can be used in ``Annotated`` hints to
+narrow down the candidates for injection.
+"""
+from typing import Dict
+import jacked
+
+
+class Named:
+    """
+    A qualifier that selects the injectable with the given name.
+
+    Usage example:
+
+        @inject
+        def func(db: Annotated[Db, Named('replica')]):
+            ...
+
+    """
+    def __init__(self, name: str):
+        """
+        Constructor.
+        :param name: the name of the injectable that is to be injected.
+        """
+        self.name = name
+
+    def accepts(self, injectable: 'jacked.Injectable') -> bool:
+        """
+        Return whether the given ``Injectable`` satisfies this qualifier.
+        :param injectable: the ``Injectable`` that is checked.
+        :return: ``True`` if ``injectable`` has the name of this qualifier.
+        """
+        return injectable.name == self.name
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Named) and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash((Named, self.name))
+
+    def __repr__(self) -> str:
+        return 'Named({!r})'.format(self.name)
+
+
+class KeyedBy:
+    """
+    A qualifier for the value type of a ``Dict[str, T]`` hint that determines
+    the keys of the injected dict: the value of the given meta key of each
+    injectable. Injectables without that meta key are left out.
+
+    Usage example:
+
+        @inject
+        def func(plugins: Dict[str, Annotated[Plugin, KeyedBy('kind')]]):
+            ...
+
+    """
+    def __init__(self, meta_key: str = 'name', *, cache: bool = False):
+        """
+        Constructor.
+        :param meta_key: the meta key of which the values are the keys.
+        :param cache: if ``True``, the dict is created once and reused until
+        the container changes.
+        """
+        self.meta_key = meta_key
+        self.cache = cache
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, KeyedBy)
+                and (other.meta_key, other.cache) == (self.meta_key,
+                                                      self.cache))
+
+    def __hash__(self) -> int:
+        return hash((KeyedBy, self.meta_key, self.cache))
+
+    def __repr__(self) -> str:
+        return 'KeyedBy({!r}, cache={!r})'.format(self.meta_key, self.cache)
+
+
+class Where:
+    """
+    A qualifier that selects the injectables of which the meta data holds all
+    given items. The injectables are looked up in the meta indexes of the
+    container, so only those that match are checked.
+
+    Usage example:
+
+        @inject
+        def func(db: Annotated[Db, Where(region='eu')]):
+            ...
+
+    """
+    def __init__(self, criteria: Dict[str, object] = None, **kwargs):
+        """
+        Constructor.
+        :param criteria: the meta data that the injectables must have.
+        :param kwargs: more meta data that the injectables must have.
+        """
+        self.criteria = {**(criteria or {}), **kwargs}
+
+    def accepts(self, injectable: 'jacked.Injectable') -> bool:
+        """
+        Return whether the given ``Injectable`` satisfies this qualifier.
+        :param injectable: the ``Injectable`` that is checked.
+        :return: ``True`` if the meta data of ``injectable`` holds all items
+        of this qualifier.
+        """
+        meta = injectable._meta
+        return all(key in meta and meta[key] == value
+                   for key, value in self.criteria.items())
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Where) and other.criteria == self.criteria
+
+    def __hash__(self) -> int:
+        try:
+            return hash((Where, frozenset(self.criteria.items())))
+        except TypeError:
+            # Unhashable values (e.g. lists) are left out; equal qualifiers
+            # still have equal hashes.
+            return hash((Where, frozenset(self.criteria)))
+
+    def __repr__(self) -> str:
+        return 'Where({!r})'.format(self.criteria)
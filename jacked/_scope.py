@@ -0,0 +1,163 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module keeps track of the resources that are bound to a single call of a
+function that is decorated with ``inject``.
+"""
+import threading
+from contextlib import ExitStack
+from typing import Callable, ContextManager, Optional, Tuple
+from jacked._lazy import Pending
+
+
+class _State(threading.local):
+    active = False
+    is_async = False
+    stack = None
+    async_stack = None
+
+
+_STATE = _State()
+
+
+def begin(is_async: bool = False) -> tuple:
+    """
+    Start collecting resources for a new call. The returned value must be
+    passed to ``end`` or ``abort``.
+    :param is_async: ``True`` if the call is of a coroutine function, which
+    allows resources to be entered asynchronously.
+    :return: the state of the enclosing scope.
+    """
+    outer = (_STATE.active, _STATE.is_async, _STATE.stack, _STATE.async_stack)
+    _STATE.active = True
+    _STATE.is_async = is_async
+    _STATE.stack = None
+    _STATE.async_stack = None
+    return outer
+
+
+def end(outer: tuple) -> Optional[ExitStack]:
+    """
+    Stop collecting resources and restore the enclosing scope.
+    :param outer: the value that was returned by ``begin``.
+    :return: an ``ExitStack`` with the collected resources or ``None`` if
+    there were none. If resources were entered asynchronously, it is an
+    ``AsyncExitStack`` (Python3.7+) that also holds the other resources.
+    """
+    stack = _STATE.stack
+    async_stack = _STATE.async_stack
+    (_STATE.active, _STATE.is_async, _STATE.stack,
+     _STATE.async_stack) = outer
+    if async_stack is not None:
+        return async_stack
+    return stack
+
+
+def abort(outer: tuple) -> None:
+    """
+    Restore the enclosing scope after collecting resources failed and release
+    the resources that were collected. Resources that are entered
+    asynchronously are not entered before collecting is done, so they need no
+    release.
+    :param outer: the value that was returned by ``begin``.
+    :return: None.
+    """
+    stack = _STATE.stack
+    (_STATE.active, _STATE.is_async, _STATE.stack,
+     _STATE.async_stack) = outer
+    if stack is not None:
+        stack.close()
+
+
+def capture() -> Optional[Tuple[ExitStack, list]]:
+    """
+    Return the resources of the current call, so that more can be added to
+    them after collecting is done (e.g. by an injected ``Provider``).
+    :return: the ``ExitStack`` of the current call and a list that becomes
+    non-empty once that call is done, or ``None`` if there is no active
+    scope.
+    """
+    if not _STATE.active:
+        return None
+    stack = _get_stack()
+    done = []
+    stack.callback(done.append, True)
+    return stack, done
+
+
+def resume(stack: ExitStack) -> tuple:
+    """
+    Start collecting resources into the given ``ExitStack`` of a captured
+    call. The returned value must be passed to ``end``.
+    :param stack: the ``ExitStack`` that was returned by ``capture``.
+    :return: the state of the enclosing scope.
+    """
+    outer = begin()
+    _STATE.stack = stack
+    return outer
+
+
+def is_active() -> bool:
+    """
+    Return whether resources are currently being collected.
+    :return: ``True`` if there is an active scope.
+    """
+    return _STATE.active
+
+
+def is_async() -> bool:
+    """
+    Return whether resources can currently be entered asynchronously.
+    :return: ``True`` if the active scope is of a coroutine function.
+    """
+    return _STATE.active and _STATE.is_async
+
+
+def push(callback: Callable, *args) -> None:
+    """
+    Register a callback that is invoked when the current call is done.
+    :param callback: the callback that releases some resource.
+    :param args: the arguments that are passed to ``callback``.
+    :return: None.
+    """
+    _get_stack().callback(callback, *args)
+
+
+def enter(manager: ContextManager) -> object:
+    """
+    Enter the given context manager now and exit it when the current call is
+    done.
+    :param manager: the context manager that is entered.
+    :return: the result of entering ``manager``.
+    """
+    return _get_stack().enter_context(manager)
+
+
+def enter_async(manager: object) -> Pending:
+    """
+    Return an awaitable that enters the given asynchronous context manager.
+    The manager is exited when the current call is done, before the resources
+    that were collected synchronously are released.
+    :param manager: the asynchronous context manager that is entered.
+    :return: a ``Pending`` with the result of entering ``manager``.
+    """
+    async_stack = _STATE.async_stack
+    if async_stack is None:
+        async_stack = _create_async_stack()
+        async_stack.enter_context(_get_stack())
+        _STATE.async_stack = async_stack
+    return Pending(lambda: async_stack.enter_async_context(manager))
+
+
+def _get_stack() -> ExitStack:
+    if _STATE.stack is None:
+        _STATE.stack = ExitStack()
+    return _STATE.stack
+
+
+def _create_async_stack() -> object:
+    # Imported here, as AsyncExitStack exists as of Python3.7 and is only
+    # needed for asynchronous resources.
+    from contextlib import AsyncExitStack
+
+    return AsyncExitStack()
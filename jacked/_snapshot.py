@@ -0,0 +1,136 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains the ``ContainerSnapshot`` class that allows the registry
+of a ``Container`` to be sent to other processes.
+"""
+import sys
+from importlib import import_module
+from pathlib import Path
+from typing import Iterable, List, Tuple
+import jacked
+from jacked._exceptions import InvalidUsageError
+
+
+class ContainerSnapshot:
+    """
+    A picklable copy of the registry of a ``Container``. Subjects are
+    referenced by the qualified names of their modules and are imported when
+    the snapshot is loaded, so a worker process does not need to discover
+    them again.
+
+    Usage example:
+
+        def init_worker(snapshot):
+            DEFAULT_CONTAINER.load_snapshot(snapshot)
+
+        ProcessPoolExecutor(initializer=init_worker,
+                            initargs=(DEFAULT_CONTAINER.snapshot(),))
+
+    """
+    def __init__(self, entries: Tuple[tuple, ...], paths: Tuple[str, ...]):
+        """
+        Constructor.
+        :param entries: the injectables in the order of their priority, each
+        as a tuple of primitives.
+        :param paths: the directories that must be in ``sys.path`` to import
+        the modules of the subjects.
+        """
+        self.entries = entries
+        self.paths = paths
+
+    @property
+    def modules(self) -> List[str]:
+        """
+        Return the names of the modules that are imported upon loading this
+        snapshot.
+        :return: a list of module names.
+        """
+        return list(dict.fromkeys(entry[0] for entry in self.entries))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return 'ContainerSnapshot(<{} injectables>)'.format(len(self))
+
+
+def take(container: 'jacked.Container') -> ContainerSnapshot:
+    """
+    Create a snapshot of the given ``Container``, including the injectables
+    that it inherits from its parents.
+    :param container: the ``Container`` of which a snapshot is taken.
+    :return: a ``ContainerSnapshot``.
+    """
+    entries = tuple(_to_entry(injectable)
+                    for injectable in container.injectables)
+    modules = (sys.modules.get(entry[0]) for entry in entries)
+    return ContainerSnapshot(entries, tuple(_find_paths(modules)))
+
+
+def restore(
+        snapshot: ContainerSnapshot,
+        container: 'jacked.Container') -> List['jacked.Injectable']:
+    """
+    Import the subjects of the given snapshot and return its injectables.
+    :param snapshot: the ``ContainerSnapshot`` that is to be restored.
+    :param container: the ``Container`` that will hold the injectables; the
+    parameters of provider functions are injected from it.
+    :return: the injectables in the order of their priority.
+    """
+    for path in reversed(snapshot.paths):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    return [_from_entry(entry, container) for entry in snapshot.entries]
+
+
+def _to_entry(injectable: 'jacked.Injectable') -> tuple:
+    # Return the given injectable as a tuple that can be pickled without
+    # pickling its subject.
+    subject = injectable._subject
+    module = getattr(subject, '__module__', None)
+    qualname = getattr(subject, '__qualname__', '')
+    if not module or '<locals>' in qualname:
+        raise InvalidUsageError('Cannot take a snapshot of "{}", as it cannot '
+                                'be imported by its qualified name.'
+                                .format(injectable.name))
+    if injectable._factory is not None and not injectable.provides:
+        raise InvalidUsageError('Cannot take a snapshot of "{}", as it has a '
+                                'custom factory.'.format(injectable.name))
+    return (module, qualname, injectable._meta, injectable.priority,
+            injectable.lifetime, injectable.pool_size,
+            injectable.pool_timeout, injectable.provides)
+
+
+def _from_entry(
+        entry: tuple,
+        container: 'jacked.Container') -> 'jacked.Injectable':
+    # Import the subject of the given entry and return a new Injectable.
+    (module, qualname, meta, priority, lifetime, pool_size, pool_timeout,
+     provides) = entry
+    subject = import_module(module)
+    for attr in qualname.split('.'):
+        subject = getattr(subject, attr)
+    factory = jacked._injectable.create_factory(subject, provides, container)
+    return jacked.Injectable(subject=subject, priority=priority,
+                             singleton=False, meta=dict(meta),
+                             lifetime=lifetime, pool_size=pool_size,
+                             pool_timeout=pool_timeout, provides=provides,
+                             factory=factory)
+
+
+def _find_paths(modules: Iterable[object]) -> List[str]:
+    # Return the directories from which the given modules were imported.
+    result = dict()
+    for module in modules:
+        filename = getattr(module, '__file__', None)
+        if not filename:
+            continue
+        path = Path(filename).resolve().parent
+        depth = module.__name__.count('.')
+        if Path(filename).stem == '__init__':
+            depth += 1
+        for _ in range(depth):
+            path = path.parent
+        result[str(path)] = None
+    return list(result)
@@ -10,6 +10,8 @@ import typing
 T = typing.TypeVar('T')
 Module = type(typing)
 NoneType = type(None)
+# Python3.5-3.6: ForwardRef is private.
+_ForwardRef = getattr(typing, 'ForwardRef', None) or typing._ForwardRef
 
 
 class AttrDict(dict):
@@ -45,6 +47,35 @@ def issubtype(cls: type, clsinfo: type) -> bool:
     return result
 
 
+def split_annotated(hint: object) -> typing.Tuple[object, tuple]:
+    """
+    Split an ``Annotated`` hint into the type that it annotates and its
+    metadata. Any other hint is returned as is with no metadata.
+    :param hint: the (possibly) annotated type hint.
+    :return: a tuple with the bare type hint and the metadata.
+    """
+    metadata = getattr(hint, '__metadata__', None)
+    if metadata is None:
+        return hint, ()
+    return hint.__origin__, metadata
+
+
+def has_forward_refs(hint: object) -> bool:
+    """
+    Return whether the given hint is or contains a reference that is written
+    as a string (e.g. ``'Dog'`` or ``List['Dog']``).
+    :param hint: the type hint.
+    :return: ``True`` if the hint needs to be evaluated before it can be used.
+    """
+    if isinstance(hint, (str, _ForwardRef)):
+        return True
+    hint, _ = split_annotated(hint)
+    args = getattr(hint, '__args__', None)
+    if not isinstance(args, tuple):
+        return False
+    return any(has_forward_refs(arg) for arg in args)
+
+
 def _issubtype_generic(
         cls: type,
         info_generic_type: type,
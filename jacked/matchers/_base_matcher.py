@@ -46,6 +46,31 @@ class BaseMatcher:
         """
         raise NotImplementedError
 
+    def is_candidate(
+            self,
+            hint: object,
+            injectable: Injectable,
+            container: Container) -> bool:
+        """
+        Determine whether ``match`` would return an object for ``hint`` and
+        the ``injectable`` without creating that object. Matchers that create
+        objects in ``match`` should override this method.
+        :param hint: the type hint that is to be matched.
+        :param injectable: the ``Injectable`` that may be a match for ``hint``.
+        :param container: the instance that contains all injectables.
+        :return: ``True`` if ``injectable`` matches ``hint``.
+        """
+        return self.match(hint, injectable, container) is not None
+
+    def is_indexed(self) -> bool:
+        """
+        Determine whether the candidates of this matcher may be indexed per
+        hint. This requires ``is_candidate`` to depend on nothing but the
+        hint and the ``Injectable`` and not to create anything.
+        :return: ``True`` if the candidates may be indexed.
+        """
+        return False
+
     def priority(self) -> int:
         """
         Determine the priority of this matcher; whether ``can_match`` of this
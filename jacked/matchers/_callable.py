@@ -19,7 +19,8 @@ class CallableMatcher(BaseMatcher):
             hint: object,
             injectable: Injectable,
             container: Container):
-        if inspect.isfunction(injectable.subject):
+        if (inspect.isfunction(injectable.subject)
+                and injectable.provides is None):
             params_hint, return_hint = get_args_and_return_type(hint)
             return_hint = (inspect.Signature.empty if return_hint is NoneType
                            else return_hint)
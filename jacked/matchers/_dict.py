@@ -0,0 +1,88 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains the ``DictMatcher``class.
+"""
+from collections.abc import Mapping
+from functools import partial
+from typing import Tuple
+from jacked._compatibility_impl import get_naked_class
+from jacked._inject import _get_candidates
+from jacked._injectable import Injectable, POOL, SCOPED
+from jacked._container import Container
+from jacked._qualifiers import KeyedBy
+from jacked._typing import split_annotated
+from jacked.matchers._base_matcher import BaseMatcher
+
+
+class DictMatcher(BaseMatcher):
+
+    def can_match(self, hint: object) -> bool:
+        # Match a parametrized mapping type with str keys that a dict can be
+        # injected for (e.g. Dict[str, T] but not dict or Dict[int, T]).
+        args = getattr(hint, '__args__', None)
+        if not args or len(args) != 2 or args[0] is not str:
+            return False
+        cls = get_naked_class(hint)
+        try:
+            return issubclass(cls, Mapping) and issubclass(dict, cls)
+        except TypeError:
+            return False
+
+    def match(
+            self,
+            hint: object,
+            injectable: Injectable,
+            container: Container):
+        sub_hint = hint.__args__[-1]
+        _, qualifiers = split_annotated(sub_hint)
+        keyed_by = next((q for q in qualifiers if isinstance(q, KeyedBy)),
+                        KeyedBy())
+        create = partial(self._create, sub_hint, keyed_by.meta_key, container)
+        if keyed_by.cache:
+            created = []
+
+            def create_cached():
+                result, reusable = create()
+                created.append(result)
+                # A dict with instances that are released after the call
+                # (e.g. pooled ones) is not cached; None is cached instead.
+                return result if reusable else None
+
+            result = container.cached(hint, create_cached)
+            if result is not None:
+                return result
+            if created:
+                return created[0]
+        return create()[0]
+
+    def is_candidate(
+            self,
+            hint: object,
+            injectable: Injectable,
+            container: Container) -> bool:
+        # The dict holds the candidates of all injectables, so there is no
+        # need to create it to know whether there is a match.
+        return True
+
+    def _create(
+            self,
+            sub_hint: object,
+            meta_key: str,
+            container: Container) -> Tuple[dict, bool]:
+        # Create the dict in one pass over the candidates. On duplicate keys,
+        # the candidate with the highest priority wins. Also return whether
+        # the dict can be reused for other calls.
+        result = {}
+        reusable = True
+        for candidate, injectable in _get_candidates(sub_hint, container,
+                                                     False):
+            meta = injectable.meta
+            if meta_key in meta and meta[meta_key] not in result:
+                result[meta[meta_key]] = candidate
+                reusable = reusable and injectable.lifetime not in (POOL,
+                                                                    SCOPED)
+        return result, reusable
+
+    def _matching_type(self):
+        return dict
@@ -21,5 +21,14 @@ class ListMatcher(BaseMatcher):
         param = inspect.Parameter(name='_', kind=1, annotation=sub_hint)
         return get_candidates(param.annotation, container=container)
 
+    def is_candidate(
+            self,
+            hint: object,
+            injectable: Injectable,
+            container: Container) -> bool:
+        # The list holds the candidates of all injectables, so there is no
+        # need to create it to know whether there is a match.
+        return True
+
     def _matching_type(self):
         return list
@@ -4,8 +4,13 @@ PRIVATE MODULE: do not import (from) it directly.
 This module contains the ``ObjectMatcher``class.
 """
 import inspect
-from jacked._injectable import Injectable
+from functools import partial
+from jacked import _scope
+from jacked._exceptions import InjectionError
+from jacked._injectable import Injectable, POOL, SCOPED, THREAD
+from jacked._lazy import Pending
 from jacked._container import Container
+from jacked._typing import issubtype
 from jacked.matchers._base_matcher import BaseMatcher
 
 
@@ -17,16 +22,90 @@ class ObjectMatcher(BaseMatcher):
             injectable: Injectable,
             container: Container):
         # The hint is a regular type, so we're expecting to inject an instance.
-        if (inspect.isclass(injectable.subject)
-                and issubclass(injectable.subject, hint)):
-            if injectable.singleton:
-                container.set_instance(hint, injectable.subject(),
-                                       injectable.priority)
+        if self.is_candidate(hint, injectable, container):
+            if injectable.lifetime == SCOPED:
+                result = self._enter(injectable, container)
+            elif injectable.is_async:
+                result = self._defer(injectable, container)
+            elif injectable.singleton:
+                # An instance that was set for the hint explicitly comes
+                # first. Otherwise, the instance is kept per injectable by the
+                # container that owns it, so it is shared with all hints and
+                # overlays.
                 result = container.get_instance(hint)
+                if result is None:
+                    owner = container.owner_of(injectable)
+                    result = owner.get_or_create_singleton(
+                        injectable, partial(container.construct, injectable))
+            elif injectable.lifetime == POOL:
+                result = self._checkout(injectable, container)
+            elif injectable.lifetime == THREAD:
+                # Like singletons, the instances are kept by the owner.
+                owner = container.owner_of(injectable)
+                result = owner.get_or_create_thread_instance(
+                    injectable, partial(container.construct, injectable))
             else:
-                result = injectable.subject()
+                result = container.construct(injectable)
             return result
 
+    def is_candidate(
+            self,
+            hint: object,
+            injectable: Injectable,
+            container: Container) -> bool:
+        if injectable.provides is not None:
+            return issubtype(injectable.provides, hint)
+        subject = injectable.subject
+        return inspect.isclass(subject) and issubclass(subject, hint)
+
+    def _defer(self, injectable: Injectable, container: Container):
+        # Return an awaitable for the result of an async provider. Singletons
+        # are awaited once, by all callers together.
+        factory = partial(container.construct, injectable)
+        if injectable.singleton:
+            owner = container.owner_of(injectable)
+            factory = partial(owner.get_or_create_async_instance,
+                              injectable, factory)
+        return Pending(factory)
+
+    def _checkout(self, injectable: Injectable, container: Container):
+        # Take an instance from the pool and have it returned once the call of
+        # the function that is decorated with `inject` is done.
+        if not _scope.is_active():
+            raise InjectionError('The pooled injectable "{}" can only be '
+                                 'injected into a function that is decorated '
+                                 'with inject.'.format(injectable.name),
+                                 injectable.subject)
+        pool = container.get_pool(injectable)
+        instance = pool.checkout()
+        _scope.push(pool.checkin, instance)
+        return instance
+
+    def is_indexed(self) -> bool:
+        # Classes are indexed by their type and providers by the type they
+        # provide.
+        return True
+
+    def _enter(self, injectable: Injectable, container: Container):
+        # Create a context manager and have it entered now (or when awaited)
+        # and exited once the call of the function that is decorated with
+        # `inject` is done.
+        if not _scope.is_active():
+            raise InjectionError('The scoped injectable "{}" can only be '
+                                 'injected into a function that is decorated '
+                                 'with inject.'.format(injectable.name),
+                                 injectable.subject)
+        if injectable.is_async and not _scope.is_async():
+            raise InjectionError('The scoped injectable "{}" can only be '
+                                 'injected into a coroutine function that is '
+                                 'decorated with inject.'
+                                 .format(injectable.name),
+                                 injectable.subject)
+        manager = container.construct(injectable)
+        if injectable.is_async:
+            return _scope.enter_async(manager)
+        return _scope.enter(manager)
+
     def _matching_type(self):
         return object
 
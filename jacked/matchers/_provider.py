@@ -0,0 +1,29 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains the ``ProviderMatcher``class.
+"""
+from jacked._inject import _defer_match
+from jacked._injectable import Injectable
+from jacked._container import Container
+from jacked._lazy import Provider
+from jacked.matchers._base_matcher import BaseMatcher
+
+
+class ProviderMatcher(BaseMatcher):
+
+    def match(
+            self,
+            hint: object,
+            injectable: Injectable,
+            container: Container):
+        sub_hint = getattr(hint, '__args__', [None])[0]
+        factory = _defer_match(sub_hint, injectable, container)
+        if factory:
+            return Provider(factory)
+
+    def _matching_type(self):
+        return Provider
+
+    def priority(self):
+        return 150  # Before the CallableMatcher, as a Provider is callable.
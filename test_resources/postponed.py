@@ -0,0 +1,30 @@
+from __future__ import annotations
+from typing import List
+from jacked import inject, injectable
+from jacked._container import Container
+
+
+CONTAINER = Container()
+
+
+@injectable(container=CONTAINER)
+class Engine:
+    pass
+
+
+@inject(container=CONTAINER)
+def build(engine: Engine, spares: List[Engine], name: str = None):
+    return engine, spares, name
+
+
+def build_local():
+    # The hint of a class that is defined in a function cannot be resolved
+    # from the module.
+    class Local:
+        pass
+
+    @inject(container=CONTAINER)
+    def func(local: Local, number: int = 3, engine: Engine = None):
+        return local, number, engine
+
+    return func, Local
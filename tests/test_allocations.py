@@ -0,0 +1,105 @@
+import gc
+from array import array
+import tracemalloc
+from typing import List, Tuple
+from unittest import TestCase, skipUnless
+from jacked import inject, injectable
+from jacked._container import Container
+from jacked._inject import inject_here
+
+
+CALLS = 100
+
+# The maximum number of bytes that one call may have allocated at once and
+# the maximum number of blocks that may be left behind by all calls together
+# (including cyclic garbage, as the garbage collector is disabled):
+BUDGETS = {
+    'inject': (1024, 10),
+    'inject_here': (512, 10),
+    'inject_here_singleton': (512, 10),
+    'inject_list': (1280, 10),
+}
+
+CONTAINER = Container()
+
+
+class Animal:
+    pass
+
+
+@injectable(container=CONTAINER)
+class Cat(Animal):
+    pass
+
+
+@injectable(container=CONTAINER)
+class Dog(Animal):
+    pass
+
+
+@injectable(container=CONTAINER, singleton=True)
+class Db:
+    pass
+
+
+@inject(container=CONTAINER)
+def _func(cat: Cat, db: Db):
+    return cat, db
+
+
+@inject(container=CONTAINER)
+def _func_list(animals: List[Animal]):
+    return animals
+
+
+def _measure(func) -> Tuple[int, int]:
+    # Return the highest number of bytes that one call of `func` allocated at
+    # once and the number of blocks that all calls left behind.
+    peaks = array('q', [0] * CALLS)  # Does not allocate per item.
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        for _ in range(CALLS):
+            # Warm up caches and the free lists of the interpreter, which
+            # keep a bounded number of freed blocks allocated.
+            func()
+        before = tracemalloc.take_snapshot()
+        for i in range(CALLS):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks[i] = peak - current
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    blocks = sum(stat.count_diff for stat
+                 in after.compare_to(before, 'filename')
+                 if stat.traceback[0].filename != tracemalloc.__file__)
+    return max(peaks), blocks
+
+
+@skipUnless(hasattr(tracemalloc, 'reset_peak'), 'Requires Python 3.9+')
+class TestAllocations(TestCase):
+    def _assert_within_budget(self, path: str, func):
+        max_bytes, max_blocks = BUDGETS[path]
+        peak, blocks = _measure(func)
+        self.assertLessEqual(peak, max_bytes, 'bytes per call of ' + path)
+        self.assertLessEqual(blocks, max_blocks, 'blocks left by ' + path)
+
+    def test_inject(self):
+        self._assert_within_budget('inject', _func)
+
+    def test_inject_here(self):
+        self._assert_within_budget(
+            'inject_here', lambda: inject_here(Cat, container=CONTAINER))
+
+    def test_inject_here_singleton(self):
+        self._assert_within_budget(
+            'inject_here_singleton',
+            lambda: inject_here(Db, container=CONTAINER))
+
+    def test_inject_list(self):
+        self._assert_within_budget('inject_list', _func_list)
@@ -0,0 +1,175 @@
+import asyncio
+from unittest import TestCase
+from jacked import bind, inject, injectable, Hook
+from jacked._container import Container
+from jacked._exceptions import InvalidUsageError
+from jacked._inject import inject_here
+
+
+class Connection:
+    pass
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsync(TestCase):
+    def test_async_singleton_is_created_once(self):
+        container = Container()
+        calls = []
+
+        @injectable(container=container, provides=True, singleton=True)
+        async def connect() -> Connection:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return Connection()
+
+        @inject(container=container)
+        async def handle(connection: Connection):
+            return connection
+
+        async def burst():
+            return await asyncio.gather(*[handle() for _ in range(50)])
+
+        connections = _run(burst())
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(1, len(set(map(id, connections))))
+        self.assertIsInstance(connections[0], Connection)
+        self.assertIs(connections[0], _run(handle()))
+        self.assertEqual(1, len(calls))
+
+    def test_async_singleton_failure_is_shared_and_retried(self):
+        container = Container()
+        calls = []
+
+        @injectable(container=container, provides=True, singleton=True)
+        async def connect() -> Connection:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise ConnectionError('first attempt fails')
+            return Connection()
+
+        @inject(container=container)
+        async def handle(connection: Connection):
+            return connection
+
+        async def burst():
+            return await asyncio.gather(*[handle() for _ in range(10)],
+                                        return_exceptions=True)
+
+        results = _run(burst())
+
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+        self.assertIsInstance(_run(handle()), Connection)
+        self.assertEqual(2, len(calls))
+
+    def test_cancelled_waiter_does_not_cancel_construction(self):
+        container = Container()
+
+        @injectable(container=container, provides=True, singleton=True)
+        async def connect() -> Connection:
+            await asyncio.sleep(0.01)
+            return Connection()
+
+        @inject(container=container)
+        async def handle(connection: Connection):
+            return connection
+
+        async def scenario():
+            cancelled = asyncio.ensure_future(handle())
+            other = asyncio.ensure_future(handle())
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await other
+
+        self.assertIsInstance(_run(scenario()), Connection)
+
+    def test_async_transient_provider(self):
+        container = Container()
+
+        @injectable(container=container, provides=True)
+        async def connect() -> Connection:
+            return Connection()
+
+        @inject(container=container)
+        async def handle(connection1: Connection, connection2: Connection):
+            return connection1, connection2
+
+        connection1, connection2 = _run(handle())
+
+        self.assertIsInstance(connection1, Connection)
+        self.assertIsNot(connection1, connection2)
+
+    def test_inject_here_returns_awaitable(self):
+        container = Container()
+
+        @injectable(container=container, provides=True, singleton=True)
+        async def connect() -> Connection:
+            return Connection()
+
+        async def scenario():
+            return await inject_here(Connection, container=container)
+
+        self.assertIsInstance(_run(scenario()), Connection)
+
+    def test_pooled_or_thread_async_provider_fails(self):
+        for lifetime in ('pool', 'thread'):
+            with self.assertRaises(InvalidUsageError):
+                @injectable(container=Container(), provides=True,
+                            lifetime=lifetime)
+                async def connect() -> Connection:
+                    return Connection()
+
+    def test_hooks_receive_the_awaited_instance(self):
+        container = Container()
+        constructed = []
+
+        class RecordingHook(Hook):
+            def on_construct(self, injectable, instance, duration):
+                constructed.append((instance, duration))
+
+        container.add_hook(RecordingHook())
+
+        @injectable(container=container, provides=True)
+        async def connect() -> Connection:
+            await asyncio.sleep(0.01)
+            return Connection()
+
+        @inject(container=container)
+        async def handle(connection: Connection):
+            return connection
+
+        connection = _run(handle())
+
+        self.assertIs(connection, constructed[0][0])
+        self.assertGreaterEqual(constructed[0][1], 0.005)
+
+    def test_concurrent_first_calls_of_bound_coroutine(self):
+        container = Container()
+
+        @injectable(container=container, provides=True, singleton=True)
+        async def connect() -> Connection:
+            await asyncio.sleep(0.01)
+            return Connection()
+
+        async def handle(connection: Connection):
+            return connection
+
+        bound = bind(handle, container=container)
+
+        async def scenario():
+            return await asyncio.gather(bound(), bound(), bound())
+
+        connections = _run(scenario())
+
+        self.assertIsInstance(connections[0], Connection)
+        self.assertEqual(1, len({id(c) for c in connections}))
+        self.assertIs(connections[0], _run(bound()))
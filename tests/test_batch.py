@@ -0,0 +1,104 @@
+from typing import List, Type
+from unittest import TestCase
+from jacked import (
+    injectable,
+    inject_many,
+    get_candidates_many,
+    Named,
+    Container,
+    Hook,
+)
+from jacked._exceptions import InjectionError
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+CONTAINER = Container()
+
+
+class Db:
+    pass
+
+
+class Cache:
+    pass
+
+
+@injectable(container=CONTAINER, name='primary', priority=1)
+class PrimaryDb(Db):
+    pass
+
+
+@injectable(container=CONTAINER, name='replica')
+class ReplicaDb(Db):
+    pass
+
+
+@injectable(container=CONTAINER)
+class MemoryCache(Cache):
+    pass
+
+
+class TestBatch(TestCase):
+    def test_inject_many(self):
+        db, cache, replica, db_type, dbs = inject_many(
+            [Db, Cache, Annotated[Db, Named('replica')], Type[Db], List[Db]],
+            container=CONTAINER)
+
+        self.assertIsInstance(db, PrimaryDb)
+        self.assertIsInstance(cache, MemoryCache)
+        self.assertIsInstance(replica, ReplicaDb)
+        self.assertIs(PrimaryDb, db_type)
+        self.assertEqual(2, len(dbs))
+
+    def test_inject_many_creates_an_instance_per_hint(self):
+        db1, db2 = inject_many([Db, Db], container=CONTAINER)
+
+        self.assertIsInstance(db1, PrimaryDb)
+        self.assertIsInstance(db2, PrimaryDb)
+        self.assertIsNot(db1, db2)
+
+    def test_inject_many_fails(self):
+        with self.assertRaises(InjectionError):
+            inject_many([Db, int], container=CONTAINER)
+
+    def test_get_candidates_many(self):
+        dbs, caches, ints = get_candidates_many([Db, Cache, int],
+                                                container=CONTAINER)
+
+        self.assertEqual([PrimaryDb, ReplicaDb], [type(db) for db in dbs])
+        self.assertEqual([MemoryCache], [type(cache) for cache in caches])
+        self.assertEqual([], ints)
+
+    def test_registry_is_scanned_once(self):
+        container = Container(parent=CONTAINER)
+        container.injectables  # Build the view of the parent first.
+        scans = []
+
+        class CountingList(list):
+            def __iter__(self):
+                scans.append(1)
+                return super().__iter__()
+
+        container._view = (container._view[0],
+                           CountingList(container._view[1]))
+
+        inject_many([Db, Cache, Db, Type[Cache]], container=container)
+
+        self.assertEqual(1, len(scans))
+
+    def test_hooks_are_called_per_hint(self):
+        container = Container(parent=CONTAINER)
+        resolved = []
+
+        class RecordingHook(Hook):
+            def on_resolve_end(self, hint, injectable, duration, error):
+                resolved.append(hint)
+
+        container.add_hook(RecordingHook())
+        inject_many([Db, Cache], container=container)
+
+        self.assertEqual([Db, Cache], resolved)
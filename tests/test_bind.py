@@ -0,0 +1,150 @@
+import asyncio
+import inspect
+from unittest import TestCase
+from jacked import bind, inject, injectable
+from jacked._container import Container
+from jacked._exceptions import InvalidUsageError
+
+
+class Db:
+    pass
+
+
+class Record:
+    pass
+
+
+class TestBind(TestCase):
+    def test_bind_resolves_once(self):
+        container = Container()
+        created = []
+
+        @injectable(container=container)
+        class SqlDb(Db):
+            def __init__(self):
+                created.append(self)
+
+        def process(record: Record, db: Db, retries: int = 3):
+            return record, db, retries
+
+        bound = bind(process, container=container)
+        record = Record()
+        result1 = bound(record)
+        result2 = bound(record, retries=1)
+
+        self.assertEqual(1, len(created))
+        self.assertIs(result1[1], result2[1])
+        self.assertEqual((record, 3), (result1[0], result1[2]))
+        self.assertEqual(1, result2[2])
+        self.assertEqual(['record', 'retries'],
+                         list(inspect.signature(bound).parameters))
+        self.assertEqual('process', bound.__name__)
+
+    def test_bind_decorated_function(self):
+        container = Container()
+
+        @injectable(container=container)
+        class SqlDb(Db):
+            pass
+
+        @inject(container=container)
+        def process(db: Db):
+            return db
+
+        bound = bind(process, container=container)
+
+        self.assertIs(bound(), bound())
+        self.assertIsNot(process(), process())
+
+    def test_explicit_arguments_override_bound(self):
+        container = Container()
+
+        @injectable(container=container)
+        class SqlDb(Db):
+            pass
+
+        def process(db: Db):
+            return db
+
+        db = Db()
+
+        self.assertIs(db, bind(process, container=container)(db=db))
+
+    def test_positional_arguments_fill_unbound_parameters(self):
+        container = Container()
+
+        @injectable(container=container)
+        class SqlDb(Db):
+            pass
+
+        def process(db: Db, record: Record, retries: int = 3, *rest):
+            return db, record, retries, rest
+
+        bound = bind(process, container=container)
+        record = Record()
+
+        db, record_, retries, rest = bound(record, 1, 'a', 'b')
+
+        self.assertIsInstance(db, SqlDb)
+        self.assertIs(record, record_)
+        self.assertEqual((1, ('a', 'b')), (retries, rest))
+        self.assertIs(record, bound(record=record)[1])
+        self.assertEqual(['record', 'retries', 'rest'],
+                         list(inspect.signature(bound).parameters))
+
+    def test_rebind(self):
+        container = Container()
+
+        @injectable(container=container)
+        class SqlDb(Db):
+            pass
+
+        def process(db: Db):
+            return db
+
+        bound = bind(process, container=container)
+        rebound = bind(process, container=container, rebind=True)
+        db = rebound()
+        self.assertIs(db, rebound())
+
+        @injectable(container=container, priority=1)
+        class MemoryDb(Db):
+            pass
+
+        self.assertIsInstance(bound(), SqlDb)
+        self.assertIsInstance(rebound(), MemoryDb)
+
+    def test_bind_coroutine(self):
+        container = Container()
+
+        @injectable(container=container, provides=True)
+        async def provide_db() -> Db:
+            return Db()
+
+        async def process(db: Db):
+            return db
+
+        bound = bind(process, container=container)
+        loop = asyncio.new_event_loop()
+        try:
+            db1 = loop.run_until_complete(bound())
+            db2 = loop.run_until_complete(bound())
+        finally:
+            loop.close()
+
+        self.assertIsInstance(db1, Db)
+        self.assertIs(db1, db2)
+
+    def test_bind_pooled_fails(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='pool')
+        class PooledDb(Db):
+            pass
+
+        def process(db: Db):
+            pass
+
+        with self.assertRaises(InvalidUsageError):
+            bind(process, container=container)
+        self.assertEqual(0, container.pool_metrics()['PooledDb'].in_use)
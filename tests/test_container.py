@@ -0,0 +1,204 @@
+from unittest import TestCase
+from jacked import injectable, Injectable
+from jacked._container import Container
+from jacked._inject import inject_here, get_candidates
+
+
+class Db:
+    pass
+
+
+class TestContainer(TestCase):
+    def test_child_falls_back_to_parent(self):
+        parent = Container()
+
+        @injectable(container=parent)
+        class PostgresDb(Db):
+            pass
+
+        child = Container(parent=parent)
+
+        self.assertIs(parent, child.parent)
+        self.assertIsInstance(inject_here(Db, container=child), PostgresDb)
+
+    def test_child_overrides_parent(self):
+        parent = Container()
+        child = Container(parent=parent)
+
+        @injectable(container=parent, name='Db')
+        class PostgresDb(Db):
+            pass
+
+        @injectable(container=child, name='Db')
+        class SqliteDb(Db):
+            pass
+
+        self.assertIsInstance(inject_here(Db, container=child), SqliteDb)
+        self.assertIsInstance(inject_here(Db, container=parent), PostgresDb)
+        self.assertEqual(1, len(get_candidates(Db, container=child)))
+
+    def test_child_adds_to_parent(self):
+        parent = Container()
+        child = Container(parent=parent)
+
+        @injectable(container=parent)
+        class PostgresDb(Db):
+            pass
+
+        @injectable(container=child, priority=1)
+        class SqliteDb(Db):
+            pass
+
+        candidates = get_candidates(Db, container=child)
+
+        self.assertEqual(2, len(candidates))
+        self.assertIsInstance(candidates[0], SqliteDb)
+        self.assertEqual(1, len(get_candidates(Db, container=parent)))
+
+    def test_child_sees_late_registrations_of_parent(self):
+        parent = Container()
+        child = Container(parent=parent)
+        self.assertEqual([], child.injectables)
+
+        @injectable(container=parent)
+        class PostgresDb(Db):
+            pass
+
+        self.assertEqual(1, len(child.injectables))
+
+    def test_singletons_are_shared_with_parent(self):
+        parent = Container()
+
+        @injectable(container=parent, singleton=True)
+        class PostgresDb(Db):
+            pass
+
+        child1 = Container(parent=parent)
+        child2 = Container(parent=child1)
+
+        db = inject_here(Db, container=child2)
+
+        self.assertIs(db, inject_here(Db, container=child1))
+        self.assertIs(db, inject_here(Db, container=parent))
+
+    def test_creating_a_child_does_not_copy(self):
+        parent = Container()
+        for i in range(100):
+            parent.register(_create_injectable('Db{}'.format(i)))
+
+        child = Container(parent=parent)
+
+        self.assertEqual([], child._injectables)
+        self.assertEqual(100, len(child.injectables))
+
+    def test_register_many(self):
+        container = Container()
+        child = Container(parent=container)
+        injectables = [_create_injectable('Db{}'.format(i)) for i in range(3)]
+        injectables.append(_create_injectable('Db0'))
+
+        self.assertEqual(0, len(child.injectables))
+        container.register_many(injectables)
+
+        self.assertEqual(injectables[:3], container.injectables)
+        self.assertEqual(3, len(child.injectables))
+
+    def test_unregister(self):
+        container = Container()
+
+        @injectable(container=container, singleton=True)
+        class PostgresDb(Db):
+            pass
+
+        @injectable(container=container, priority=-1)
+        class SqliteDb(Db):
+            pass
+
+        self.assertIsInstance(inject_here(Db, container=container),
+                              PostgresDb)
+        injectables_before = container.injectables
+
+        container.unregister(container.injectables[0])
+
+        self.assertIsInstance(inject_here(Db, container=container), SqliteDb)
+        self.assertEqual(None, container.get_instance(Db))
+        # A list obtained before the change is not mutated:
+        self.assertEqual(2, len(injectables_before))
+        self.assertEqual([container.injectables[0]],
+                         container.registered_in(__name__))
+
+    def test_replace(self):
+        container = Container()
+
+        @injectable(container=container, name='Db', singleton=True)
+        class PostgresDb(Db):
+            pass
+
+        inject_here(Db, container=container)
+
+        class SqliteDb(Db):
+            pass
+
+        container.replace(_create_injectable('Db', SqliteDb),
+                          _create_injectable('Other'))
+
+        self.assertEqual(2, len(container.injectables))
+        self.assertIsInstance(inject_here(Db, container=container), SqliteDb)
+
+    def test_injectables_are_ordered_by_priority(self):
+        container = Container()
+        container.register(_create_injectable('a', priority=1))
+        container.register(_create_injectable('b', priority=3))
+        container.register(_create_injectable('c', priority=1))
+        container.register_many([_create_injectable('d', priority=2),
+                                 _create_injectable('e', priority=3)])
+        container.register(_create_injectable('f', priority=-1))
+
+        names = [injectable.name for injectable in container.injectables]
+
+        self.assertEqual(['b', 'e', 'd', 'a', 'c', 'f'], names)
+
+        container.replace(_create_injectable('b', priority=0))
+        names = [injectable.name for injectable in container.injectables]
+
+        self.assertEqual(['e', 'd', 'a', 'c', 'b', 'f'], names)
+
+    def test_child_injectables_are_ordered_by_priority(self):
+        parent = Container()
+        child = Container(parent=parent)
+        parent.register(_create_injectable('a', priority=1))
+        parent.register(_create_injectable('b', priority=0))
+        child.register(_create_injectable('c', priority=0))
+        child.register(_create_injectable('d', priority=2))
+
+        names = [injectable.name for injectable in child.injectables]
+
+        self.assertEqual(['d', 'a', 'c', 'b'], names)
+
+    def test_resolution_stops_at_first_match(self):
+        container = Container()
+        created = []
+
+        class Other:
+            pass
+
+        for i in range(10):
+            cls = type('Db{}'.format(i), (Db,), {
+                '__init__': lambda self: created.append(self)})
+            container.register(_create_injectable(cls.__name__, cls, i))
+        container.register(_create_injectable('Other', Other, 100))
+
+        db = inject_here(Db, container=container)
+
+        self.assertEqual('Db9', type(db).__name__)
+        self.assertEqual([db], created)
+        self.assertEqual(10, len(get_candidates(Db, container=container)))
+
+
+def _create_injectable(
+        name: str,
+        subject: type = None,
+        priority: int = 0) -> Injectable:
+    subject = subject or type(name, (Db,), {})
+    return Injectable(subject=subject, priority=priority, singleton=False,
+                      meta={'name': name})
@@ -0,0 +1,135 @@
+from typing import Dict, Mapping
+from unittest import TestCase
+from jacked import inject, injectable, KeyedBy, Named
+from jacked._container import Container
+from jacked._inject import inject_here
+from jacked.matchers._dict import DictMatcher
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+CONTAINER = Container()
+
+
+class Plugin:
+    pass
+
+
+@injectable(container=CONTAINER, meta={'kind': 'csv'}, priority=1)
+class CsvPlugin(Plugin):
+    pass
+
+
+@injectable(container=CONTAINER, meta={'kind': 'json'})
+class JsonPlugin(Plugin):
+    pass
+
+
+@injectable(container=CONTAINER, meta={'kind': 'csv'})
+class LegacyCsvPlugin(Plugin):
+    pass
+
+
+@injectable(container=CONTAINER)
+class UnknownPlugin(Plugin):
+    pass
+
+
+class TestDict(TestCase):
+    def test_inject_dict_by_name(self):
+
+        @inject(container=CONTAINER)
+        def func(plugins: Dict[str, Plugin]):
+            self.assertEqual({'CsvPlugin', 'JsonPlugin', 'LegacyCsvPlugin',
+                              'UnknownPlugin'}, set(plugins))
+            self.assertIsInstance(plugins['JsonPlugin'], JsonPlugin)
+
+        func()
+
+    def test_inject_mapping(self):
+        plugins = inject_here(Mapping[str, Plugin], container=CONTAINER)
+
+        self.assertEqual(4, len(plugins))
+
+    def test_inject_dict_by_meta_key(self):
+        plugins = inject_here(Dict[str, Annotated[Plugin, KeyedBy('kind')]],
+                              container=CONTAINER)
+
+        self.assertEqual({'csv', 'json'}, set(plugins))
+        # On duplicate keys, the highest priority wins:
+        self.assertIsInstance(plugins['csv'], CsvPlugin)
+
+    def test_inject_dict_with_qualifiers(self):
+        hint = Dict[str, Annotated[Plugin, KeyedBy('kind'),
+                                   Named('JsonPlugin')]]
+        plugins = inject_here(hint, container=CONTAINER)
+
+        self.assertEqual(['json'], list(plugins))
+
+    def test_cached_dict(self):
+        container = Container(parent=CONTAINER)
+        hint = Dict[str, Annotated[Plugin, KeyedBy(cache=True)]]
+
+        plugins1 = inject_here(hint, container=container)
+        plugins2 = inject_here(hint, container=container)
+
+        self.assertIs(plugins1, plugins2)
+
+        @injectable(container=container)
+        class XmlPlugin(Plugin):
+            pass
+
+        plugins3 = inject_here(hint, container=container)
+
+        self.assertIsNot(plugins1, plugins3)
+        self.assertIn('XmlPlugin', plugins3)
+
+    def test_uncached_dict(self):
+        plugins1 = inject_here(Dict[str, Plugin], container=CONTAINER)
+        plugins2 = inject_here(Dict[str, Plugin], container=CONTAINER)
+
+        self.assertIsNot(plugins1['CsvPlugin'], plugins2['CsvPlugin'])
+
+    def test_only_str_keyed_dicts_are_matched(self):
+        container = Container()
+
+        @injectable(container=container)
+        class Settings(dict):
+            def __init__(self):
+                super().__init__(debug=True)
+
+        self.assertIsInstance(inject_here(dict, container=container),
+                              Settings)
+        self.assertIsInstance(inject_here(Dict, container=container),
+                              Settings)
+        matcher = DictMatcher()
+        self.assertTrue(matcher.can_match(Dict[str, Plugin]))
+        self.assertTrue(matcher.can_match(Mapping[str, Plugin]))
+        self.assertFalse(matcher.can_match(Dict[int, Plugin]))
+        self.assertFalse(matcher.can_match(Dict))
+        self.assertFalse(matcher.can_match(dict))
+
+    def test_dict_of_pooled_instances_is_not_cached(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='pool', pool_size=(0, 2))
+        class PooledPlugin(Plugin):
+            pass
+
+        @inject(container=container)
+        def func(plugins: Dict[str, Annotated[Plugin, KeyedBy(cache=True)]]):
+            return plugins
+
+        plugins1 = func()
+        plugins2 = func()
+
+        self.assertIsNot(plugins1, plugins2)
+        self.assertEqual(0, container.pool_metrics()['PooledPlugin'].in_use)
+
+    def test_keyed_by(self):
+        self.assertEqual(KeyedBy('x'), KeyedBy('x'))
+        self.assertNotEqual(KeyedBy('x'), KeyedBy('x', cache=True))
+        self.assertEqual("KeyedBy('x', cache=False)", repr(KeyedBy('x')))
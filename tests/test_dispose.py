@@ -0,0 +1,198 @@
+import asyncio
+import time
+from unittest import TestCase
+from jacked import inject, injectable
+from jacked._container import Container
+from jacked._inject import inject_here
+
+
+class TestDispose(TestCase):
+    def test_close_in_reverse_dependency_order(self):
+        container = Container()
+        closed = []
+
+        @injectable(container=container, singleton=True)
+        class Db:
+            def close(self):
+                time.sleep(0.01)
+                closed.append('Db')
+
+        @injectable(container=container, singleton=True)
+        class Repository:
+            @inject(container=container)
+            def __init__(self, db: Db):
+                self.db = db
+
+            def close(self):
+                time.sleep(0.01)
+                closed.append('Repository')
+
+        @injectable(container=container, singleton=True)
+        class Service:
+            @inject(container=container)
+            def __init__(self, repository: Repository, db: Db):
+                pass
+
+            def __exit__(self, *args):
+                closed.append('Service')
+
+        inject_here(Service, container=container)
+        report = container.close()
+
+        self.assertEqual(['Service', 'Repository', 'Db'], closed)
+        self.assertEqual(3, len(report.closed))
+        self.assertEqual([], report.failed + report.pending)
+
+    def test_independent_instances_are_closed_concurrently(self):
+        container = Container()
+
+        class Slow:
+            def close(self):
+                time.sleep(0.2)
+
+        for i in range(4):
+            injectable(type('Slow{}'.format(i), (Slow,), {}),
+                       container=container, singleton=True)
+        for injectable_ in container.injectables:
+            inject_here(injectable_.subject, container=container)
+
+        start = time.monotonic()
+        report = container.close(slow=0.1)
+
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertEqual(4, len(report.closed))
+        self.assertEqual(4, len(report.slow))
+
+    def test_close_reports_failures_and_timeouts(self):
+        container = Container()
+
+        @injectable(container=container, singleton=True)
+        class Broken:
+            def close(self):
+                raise ValueError('broken')
+
+        @injectable(container=container, singleton=True)
+        class Stuck:
+            def close(self):
+                time.sleep(1)
+
+        @injectable(container=container, singleton=True)
+        class Plain:
+            pass
+
+        for subject in (Broken, Stuck, Plain):
+            inject_here(subject, container=container)
+        report = container.close(timeout=0.1)
+
+        self.assertEqual(['Broken'], [entry.name for entry in report.failed])
+        self.assertIsInstance(report.failed[0].error, ValueError)
+        self.assertEqual(['Stuck'], [entry.name for entry in report.pending])
+        self.assertEqual([], report.closed)
+
+    def test_closed_instances_are_recreated(self):
+        container = Container()
+
+        @injectable(container=container, singleton=True)
+        class Db:
+            def close(self):
+                pass
+
+        db = inject_here(Db, container=container)
+        container.close()
+
+        self.assertIsNot(db, inject_here(Db, container=container))
+        self.assertEqual(1, len(container.close().closed))
+
+    def test_idle_pooled_instances_are_closed_last(self):
+        container = Container()
+        closed = []
+
+        @injectable(container=container, lifetime='pool', pool_size=(2, 2))
+        class Connection:
+            def close(self):
+                closed.append('Connection')
+
+        @injectable(container=container, singleton=True)
+        class Cache:
+            def close(self):
+                time.sleep(0.01)
+                closed.append('Cache')
+
+        @inject(container=container)
+        def func(connection: Connection, cache: Cache):
+            pass
+
+        func()
+        container.close()
+
+        self.assertEqual(['Cache', 'Connection', 'Connection'], closed)
+
+    def test_thread_instances_of_the_current_thread_are_closed(self):
+        container = Container()
+        closed = []
+
+        @injectable(container=container, lifetime='thread')
+        class Session:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                closed.append(self)
+
+        @injectable(container=container, singleton=True)
+        class Cache:
+            def close(self):
+                time.sleep(0.01)
+                closed.append('Cache')
+
+        session = inject_here(Session, container=container)
+        inject_here(Cache, container=container)
+        report = container.close()
+
+        self.assertEqual([session, 'Cache'], closed)
+        self.assertEqual(['Session', 'Cache'],
+                         sorted((entry.name for entry in report.closed),
+                                reverse=True))
+        self.assertIsNot(session, inject_here(Session, container=container))
+
+    def test_aclose(self):
+        container = Container()
+        closed = []
+
+        @injectable(container=container, singleton=True)
+        class Client:
+            async def __aexit__(self, *args):
+                await asyncio.sleep(0.01)
+                closed.append('Client')
+
+        @injectable(container=container, singleton=True)
+        class Api:
+            @inject(container=container)
+            def __init__(self, client: Client):
+                pass
+
+            def close(self):
+                closed.append('Api')
+
+        inject_here(Api, container=container)
+        loop = asyncio.new_event_loop()
+        try:
+            report = loop.run_until_complete(container.aclose())
+        finally:
+            loop.close()
+
+        self.assertEqual(['Api', 'Client'], closed)
+        self.assertEqual(2, len(report.closed))
+
+    def test_close_requires_aclose_for_async_disposers(self):
+        container = Container()
+
+        @injectable(container=container, singleton=True)
+        class Client:
+            async def __aexit__(self, *args):
+                pass
+
+        inject_here(Client, container=container)
+        report = container.close()
+
+        self.assertEqual(['Client'], [entry.name for entry in report.failed])
@@ -0,0 +1,84 @@
+import inspect
+from typing import List
+from unittest import TestCase
+from jacked import bind, inject, injectable
+from jacked._container import Container
+from jacked._exceptions import InjectionError
+from test_resources.postponed import Engine, build, build_local
+
+
+CONTAINER = Container()
+
+
+@inject(container=CONTAINER)
+def get_wheel(wheel: 'Wheel') -> 'Wheel':
+    return wheel
+
+
+@inject(container=CONTAINER)
+def get_wheels(wheels: List['Wheel']):
+    return wheels
+
+
+@injectable(container=CONTAINER)
+class Wheel:
+    pass
+
+
+class TestForwardRefs(TestCase):
+    def test_quoted_hint(self):
+        self.assertIsInstance(get_wheel(), Wheel)
+
+    def test_quoted_hint_in_generic(self):
+        wheels = get_wheels()
+        self.assertEqual(1, len(wheels))
+        self.assertIsInstance(wheels[0], Wheel)
+
+    def test_postponed_annotations(self):
+        engine, spares, name = build()
+        self.assertIsInstance(engine, Engine)
+        self.assertIsInstance(spares[0], Engine)
+        self.assertIsNone(name)
+
+    def test_hints_are_evaluated_once(self):
+
+        @inject(container=CONTAINER)
+        def func(wheel: 'Wheel'):
+            return wheel
+
+        original = inspect.signature
+
+        def fail(*args, **kwargs):
+            raise AssertionError('The signature is inspected again.')
+
+        func()
+        inspect.signature = fail
+        try:
+            self.assertIsInstance(func(), Wheel)
+        finally:
+            inspect.signature = original
+
+    def test_unresolvable_hint(self):
+
+        @inject(container=CONTAINER)
+        def func(part: 'DoesNotExist'):  # noqa: F821
+            pass
+
+        with self.assertRaises(InjectionError):
+            func()
+
+    def test_unresolvable_hint_of_given_argument(self):
+        func, local_type = build_local()
+        local = local_type()
+
+        result = func(local)
+
+        self.assertEqual((local, 3), result[:2])
+        self.assertIsInstance(result[2], Engine)
+        self.assertEqual((local, 4, None), func(local, 4, None))
+        with self.assertRaises(InjectionError):
+            func()
+
+    def test_bind(self):
+        bound = bind(get_wheel.__wrapped__, container=CONTAINER)
+        self.assertIsInstance(bound(), Wheel)
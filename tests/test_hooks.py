@@ -0,0 +1,130 @@
+import cProfile
+import pstats
+import sys
+from unittest import TestCase
+from jacked import inject, injectable, Hook
+from jacked._container import Container
+from jacked._inject import inject_here
+
+
+class RecordingHook(Hook):
+    def __init__(self):
+        self.events = []
+
+    def on_resolve_start(self, hint):
+        self.events.append(('start', hint))
+
+    def on_candidate_matched(self, hint, injectable):
+        self.events.append(('matched', hint, injectable.name))
+
+    def on_construct(self, injectable, instance, duration):
+        self.events.append(('construct', injectable.name, duration >= 0))
+
+    def on_resolve_end(self, hint, injectable, duration, error):
+        self.events.append(('end', hint, injectable and injectable.name,
+                            duration >= 0) + ((error,) if error else ()))
+
+
+class Service:
+    pass
+
+
+class TestHooks(TestCase):
+    def test_hooks_are_called(self):
+        container = Container()
+        hook = RecordingHook()
+        container.add_hook(hook)
+
+        @injectable(container=container)
+        class ServiceImpl(Service):
+            pass
+
+        inject_here(Service, container=container)
+
+        self.assertEqual([
+            ('start', Service),
+            ('construct', 'ServiceImpl', True),
+            ('matched', Service, 'ServiceImpl'),
+            ('end', Service, 'ServiceImpl', True),
+        ], hook.events)
+
+    def test_end_is_called_on_error(self):
+        container = Container()
+        hook = RecordingHook()
+        container.add_hook(hook)
+        error = RuntimeError('broken')
+
+        @injectable(container=container)
+        class ServiceImpl(Service):
+            def __init__(self):
+                raise error
+
+        with self.assertRaises(RuntimeError):
+            inject_here(Service, container=container)
+
+        self.assertEqual([
+            ('start', Service),
+            ('end', Service, None, True, error),
+        ], hook.events)
+
+    def test_hooks_of_parent_are_called(self):
+        parent = Container()
+        child = Container(parent=parent)
+        hook = RecordingHook()
+        parent.add_hook(hook)
+
+        @inject(container=child)
+        def func(service: Service = None):
+            pass
+
+        func()
+
+        self.assertEqual([('start', Service), ('end', Service, None, True)],
+                         hook.events)
+
+    def test_remove_hook(self):
+        container = Container()
+        hook = RecordingHook()
+        container.add_hook(hook)
+        container.remove_hook(hook)
+
+        @injectable(container=container)
+        class ServiceImpl(Service):
+            pass
+
+        inject_here(Service, container=container)
+
+        self.assertEqual([], hook.events)
+        self.assertEqual((), container.hooks)
+
+    def test_wrapper_carries_name_of_decorated(self):
+
+        @inject
+        def some_function():
+            pass
+
+        @inject
+        async def some_coroutine_function():
+            pass
+
+        self.assertEqual('some_function', some_function.__code__.co_name)
+        self.assertEqual('some_coroutine_function',
+                         some_coroutine_function.__code__.co_name)
+        if sys.version_info >= (3, 11):
+            self.assertEqual(some_function.__qualname__,
+                             some_function.__code__.co_qualname)
+
+    def test_wrapper_in_profile(self):
+
+        @inject
+        def profiled_function():
+            pass
+
+        profile = cProfile.Profile()
+        profile.runcall(profiled_function)
+        stats = pstats.Stats(profile).stats
+        names = [name for (filename, _, name) in stats
+                 if filename.endswith('_inject.py')]
+
+        self.assertIn('profiled_function', names)
+        self.assertNotIn('<lambda>', names)
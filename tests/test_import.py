@@ -0,0 +1,57 @@
+import subprocess
+import sys
+from pathlib import Path
+from unittest import TestCase
+import jacked
+
+
+ROOT = str(Path(__file__).parent.parent)
+
+# Modules that are not needed for decorating and that are slow to import:
+NOT_IMPORTED_EAGERLY = (
+    'asyncio',
+    'glob',
+    'jacked._discover',
+    'jacked._dispose',
+    'jacked._hooks',
+    'jacked._snapshot',
+    'jacked.matchers._object',
+    'pathlib',
+)
+
+
+def _import_times() -> dict:
+    # Import jacked in a fresh interpreter and return the cumulative import
+    # times (in microseconds) per module.
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import jacked'],
+        cwd=ROOT, stderr=subprocess.PIPE, universal_newlines=True,
+        check=True).stderr
+    result = {}
+    for line in output.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, module = line.split('|')
+            if cumulative.strip().isdigit():
+                result[module.strip()] = int(cumulative)
+    return result
+
+
+class TestImport(TestCase):
+    def test_import_time(self):
+        import_times = _import_times()
+
+        self.assertIn('jacked', import_times)
+        for module in NOT_IMPORTED_EAGERLY:
+            self.assertNotIn(module, import_times)
+
+    def test_lazy_attributes(self):
+        from jacked._discover import discover
+        from jacked._hooks import Hook
+
+        self.assertIs(discover, jacked.discover)
+        self.assertIs(Hook, jacked.Hook)
+        self.assertIn('discover', dir(jacked))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            jacked.does_not_exist
@@ -127,8 +127,9 @@ class TestInject(TestCase):
 
     @inject()
     def test_injection_name(self, mouse: Mouse):
-        self.assertEqual('Elephant', mouse.__meta__.name)
-        self.assertEqual('enormous', mouse.__meta__.size)
+        self.assertEqual('Elephant', DEFAULT_CONTAINER.meta_of(mouse).name)
+        self.assertEqual('enormous', DEFAULT_CONTAINER.meta_of(mouse).size)
+        self.assertFalse(hasattr(Mouse, '__meta__'))
 
     @inject
     def test_simple_injection_without_parentheses(self, cat: Cat):
@@ -176,11 +177,12 @@ class TestInject(TestCase):
 
         @inject(container=CUSTOM_CONTAINER)
         def func1(chicken: Chicken):
-            self.assertEqual('Kip', chicken.__meta__['name'])
+            self.assertEqual('Kip', CUSTOM_CONTAINER.meta_of(chicken)['name'])
 
         @inject()
         def func2(chicken: Chicken):
-            self.assertEqual('Chicken', chicken.__meta__['name'])
+            self.assertEqual('Chicken',
+                             DEFAULT_CONTAINER.meta_of(chicken)['name'])
 
         func1()
         func2()
@@ -351,6 +353,18 @@ class TestInject(TestCase):
         except InjectionError as err:
             self.assertEqual('obj', err.subject.name)
 
+    def test_given_keyword_arguments_are_not_injected(self):
+
+        class NotInjectable:
+            pass
+
+        @inject()
+        def _func(obj: NotInjectable):
+            return obj
+
+        obj = NotInjectable()
+        self.assertIs(obj, _func(obj=obj))
+
     def test_inject_with_discovery(self):
 
         @inject()
@@ -0,0 +1,143 @@
+import threading
+from unittest import TestCase
+from jacked import injectable, injected
+from jacked._container import Container
+from jacked._exceptions import InjectionError, InvalidUsageError
+
+
+class TestInjected(TestCase):
+    def test_injected_on_first_access(self):
+        container = Container()
+        created = []
+
+        @injectable(container=container)
+        class Db:
+            def __init__(self):
+                created.append(self)
+
+        class Order:
+            db: Db = injected(container=container)
+
+        order = Order()
+        self.assertEqual([], created)
+        self.assertIsInstance(order.db, Db)
+        self.assertIs(order.db, order.db)
+        self.assertEqual(1, len(created))
+        self.assertIsNot(order.db, Order().db)
+
+    def test_injected_per_class(self):
+        container = Container()
+
+        @injectable(container=container)
+        class Db:
+            pass
+
+        class Order:
+            __slots__ = ()
+            db = injected(Db, container=container, per_class=True)
+
+        self.assertIs(Order().db, Order().db)
+
+    def test_injected_per_class_in_threads(self):
+        container = Container()
+        created = []
+        barrier = threading.Barrier(8)
+
+        @injectable(container=container)
+        class Db:
+            def __init__(self):
+                created.append(self)
+
+        class Order:
+            db: Db = injected(container=container, per_class=True)
+
+        def access():
+            barrier.wait(5)
+            return Order().db
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(created))
+
+    def test_injected_string_annotation(self):
+        container = Container()
+
+        class Order:
+            db: 'DbLater' = injected(container=container)
+
+        @injectable(container=container)
+        class DbLater:
+            pass
+
+        globals()['DbLater'] = DbLater
+        try:
+            self.assertIsInstance(Order().db, DbLater)
+        finally:
+            del globals()['DbLater']
+
+    def test_other_annotations_are_not_evaluated(self):
+        container = Container()
+
+        @injectable(container=container)
+        class Db:
+            pass
+
+        class Order:
+            db: Db = injected(container=container)
+            customer: 'Customer'  # noqa: F821
+
+        self.assertIsInstance(Order().db, Db)
+
+    def test_injected_unresolvable_annotation(self):
+        class Order:
+            db: 'Missing' = injected(container=Container())  # noqa: F821
+
+        with self.assertRaises(InjectionError):
+            Order().db
+
+    def test_injected_can_be_overwritten(self):
+        container = Container()
+
+        @injectable(container=container)
+        class Db:
+            pass
+
+        class Order:
+            db: Db = injected(container=container)
+
+        order = Order()
+        order.db = 42
+        self.assertEqual(42, order.db)
+
+    def test_class_access_returns_descriptor(self):
+        class Order:
+            db: int = injected()
+
+        self.assertEqual('injected(None)', repr(Order.db))
+
+    def test_injected_fails(self):
+        container = Container()
+
+        class Db:
+            pass
+
+        class Order:
+            __slots__ = ()
+            db: Db = injected(container=container)
+
+        class Invoice:
+            db = injected(container=container)
+
+        class Receipt:
+            db: Db = injected(container=container, per_class=True)
+
+        with self.assertRaises(InvalidUsageError):
+            Order().db
+        with self.assertRaises(InvalidUsageError):
+            Invoice().db
+        with self.assertRaises(InjectionError):
+            Receipt().db
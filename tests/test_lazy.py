@@ -0,0 +1,142 @@
+from typing import List
+from unittest import TestCase
+from jacked import inject, injectable, Lazy, Provider, Named
+from jacked._container import Container
+from jacked._exceptions import InjectionError
+from jacked._inject import inject_here
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+CONTAINER = Container()
+CREATED = []
+
+
+class Reporter:
+    def report(self, msg: str) -> str:
+        raise NotImplementedError
+
+
+@injectable(container=CONTAINER, name='mail', priority=1)
+class MailReporter(Reporter):
+    def __init__(self):
+        CREATED.append(self)
+
+    def report(self, msg: str) -> str:
+        return 'mail: ' + msg
+
+
+@injectable(container=CONTAINER, name='log')
+class LogReporter(Reporter):
+    def __init__(self):
+        CREATED.append(self)
+
+    def report(self, msg: str) -> str:
+        return 'log: ' + msg
+
+
+class TestLazy(TestCase):
+    def setUp(self):
+        CREATED.clear()
+
+    def test_lazy_is_created_on_first_access(self):
+
+        @inject(container=CONTAINER)
+        def func(reporter: Lazy[Reporter]):
+            self.assertEqual([], CREATED)
+            self.assertEqual('mail: x', reporter.report('x'))
+            self.assertEqual('mail: y', reporter.report('y'))
+            self.assertEqual(1, len(CREATED))
+            self.assertIsInstance(CREATED[0], MailReporter)
+
+        func()
+
+    def test_unused_lazy_is_never_created(self):
+
+        @inject(container=CONTAINER)
+        def func(reporter: Lazy[Reporter]):
+            pass
+
+        func()
+        self.assertEqual([], CREATED)
+
+    def test_lazy_with_qualifier(self):
+        lazy = inject_here(Lazy[Annotated[Reporter, Named('log')]],
+                           container=CONTAINER)
+
+        self.assertEqual('log: x', lazy.report('x'))
+
+    def test_lazy_list(self):
+
+        @inject(container=CONTAINER)
+        def func(reporters: List[Lazy[Reporter]]):
+            self.assertEqual(2, len(reporters))
+            self.assertEqual([], CREATED)
+
+        func()
+
+    def test_lazy_without_candidates(self):
+        with self.assertRaises(InjectionError):
+            inject_here(Lazy[int], container=CONTAINER)
+
+    def test_provider_resolves_on_every_call(self):
+
+        @inject(container=CONTAINER)
+        def func(provider: Provider[Reporter]):
+            self.assertEqual([], CREATED)
+            reporter1 = provider()
+            reporter2 = provider()
+            self.assertIsInstance(reporter1, MailReporter)
+            self.assertIsNot(reporter1, reporter2)
+
+        func()
+
+    def test_provider_is_not_matched_as_callable(self):
+        provider = inject_here(Provider[Reporter], container=CONTAINER)
+
+        self.assertIsInstance(provider, Provider)
+        self.assertIsInstance(provider(), MailReporter)
+
+    def test_repr(self):
+        lazy = inject_here(Lazy[Reporter], container=CONTAINER)
+
+        self.assertEqual('Lazy(<unresolved>)', repr(lazy))
+        lazy.report('x')
+        self.assertTrue(repr(lazy).startswith('Lazy(<'))
+
+    def test_deferred_pooled_and_scoped_instances(self):
+        container = Container()
+        events = []
+
+        @injectable(container=container, lifetime='pool', pool_size=(0, 2))
+        class Connection:
+            def ping(self):
+                return True
+
+        @injectable(container=container, lifetime='scoped')
+        class Lock:
+            def __enter__(self):
+                events.append('acquire')
+                return self
+
+            def __exit__(self, *args):
+                events.append('release')
+
+        @inject(container=container)
+        def func(connection: Lazy[Connection], lock: Provider[Lock]):
+            self.assertEqual([], events)
+            self.assertIsInstance(lock(), Lock)
+            self.assertTrue(connection.ping())  # Checks out a connection.
+            in_use = container.pool_metrics()['Connection'].in_use
+            return connection, lock, in_use
+
+        connection, lock, in_use = func()
+
+        self.assertEqual(1, in_use)
+        self.assertEqual(0, container.pool_metrics()['Connection'].in_use)
+        self.assertEqual(['acquire', 'release'], events)
+        with self.assertRaises(InjectionError):
+            lock()
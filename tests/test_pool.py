@@ -0,0 +1,233 @@
+import asyncio
+import threading
+from unittest import TestCase
+from jacked import inject, injectable
+from jacked._container import Container
+from jacked._exceptions import (
+    InjectionError,
+    InvalidUsageError,
+    PoolExhaustedError,
+)
+from jacked._inject import inject_here
+
+
+class TestPool(TestCase):
+    def test_instance_is_returned_after_call(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='pool', pool_size=(1, 2))
+        class Connection:
+            pass
+
+        seen = []
+
+        @inject(container=container)
+        def func(connection: Connection):
+            seen.append(connection)
+            metrics = container.pool_metrics()['Connection']
+            self.assertEqual(1, metrics.in_use)
+
+        func()
+        func()
+
+        self.assertIs(seen[0], seen[1])
+        metrics = container.pool_metrics()['Connection']
+        self.assertEqual(0, metrics.in_use)
+        self.assertEqual(1, metrics.size)
+        self.assertEqual(2, metrics.checkouts)
+
+    def test_nested_calls_use_different_instances(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='pool', pool_size=(0, 2))
+        class Parser:
+            pass
+
+        @inject(container=container)
+        def inner(parser: Parser):
+            return parser
+
+        @inject(container=container)
+        def outer(parser: Parser):
+            self.assertIsNot(parser, inner())
+            return parser
+
+        outer()
+        self.assertEqual(2, container.pool_metrics()['Parser'].peak_in_use)
+
+    def test_min_size_is_created_on_first_checkout(self):
+        container = Container()
+        created = []
+
+        @injectable(container=container, lifetime='pool', pool_size=(3, 5))
+        class Session:
+            def __init__(self):
+                created.append(self)
+
+        @inject(container=container)
+        def func(session: Session):
+            pass
+
+        self.assertEqual(0, len(created))
+        func()
+        self.assertEqual(3, len(created))
+        self.assertEqual(3, container.pool_metrics()['Session'].idle)
+
+    def test_instance_is_returned_on_error(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='pool', pool_size=(0, 1))
+        class Connection:
+            pass
+
+        @inject(container=container)
+        def func(connection: Connection):
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            func()
+        self.assertEqual(0, container.pool_metrics()['Connection'].in_use)
+
+    def test_instance_is_returned_after_coroutine(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='pool', pool_size=(0, 1))
+        class Connection:
+            pass
+
+        @inject(container=container)
+        async def func(connection: Connection):
+            await asyncio.sleep(0)
+            return container.pool_metrics()['Connection'].in_use
+
+        in_use = asyncio.new_event_loop().run_until_complete(func())
+
+        self.assertEqual(1, in_use)
+        self.assertEqual(0, container.pool_metrics()['Connection'].in_use)
+
+    def test_failing_fill_releases_its_slots(self):
+        container = Container()
+        attempts = []
+
+        @injectable(container=container, lifetime='pool', pool_size=(3, 3))
+        class Connection:
+            def __init__(self):
+                attempts.append(self)
+                if len(attempts) == 2:
+                    raise ConnectionError('refused')
+
+        @inject(container=container)
+        def func(connection: Connection):
+            return connection
+
+        with self.assertRaises(ConnectionError):
+            func()
+
+        metrics = container.pool_metrics()['Connection']
+        self.assertEqual(1, metrics.size)
+        self.assertEqual(0, metrics.in_use)
+
+        func()
+
+        metrics = container.pool_metrics()['Connection']
+        self.assertEqual(3, metrics.size)
+        self.assertEqual(0, metrics.in_use)
+
+    def test_checkout_blocks_until_checkin(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='pool', pool_size=(0, 1))
+        class Connection:
+            pass
+
+        in_call = threading.Event()
+        release = threading.Event()
+
+        @inject(container=container)
+        def slow(connection: Connection):
+            in_call.set()
+            release.wait(5)
+            return connection
+
+        @inject(container=container)
+        def fast(connection: Connection):
+            return connection
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(slow()))
+        thread.start()
+        in_call.wait(5)
+        threading.Timer(0.05, release.set).start()
+        results.append(fast())
+        thread.join()
+
+        self.assertIs(results[0], results[1])
+        metrics = container.pool_metrics()['Connection']
+        self.assertEqual(1, metrics.size)
+        self.assertEqual(1, metrics.waits)
+
+    def test_checkout_times_out(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='pool', pool_size=(0, 1),
+                    pool_timeout=0.01)
+        class Connection:
+            pass
+
+        @inject(container=container)
+        def inner(connection: Connection):
+            pass
+
+        @inject(container=container)
+        def outer(connection: Connection):
+            inner()
+
+        with self.assertRaises(PoolExhaustedError):
+            outer()
+        metrics = container.pool_metrics()['Connection']
+        self.assertEqual(1, metrics.timeouts)
+        self.assertEqual(0, metrics.in_use)
+
+    def test_unregister_closes_pool(self):
+        container = Container()
+        closed = []
+
+        @injectable(container=container, lifetime='pool', pool_size=(2, 2))
+        class Connection:
+            def close(self):
+                closed.append(self)
+
+        seen = []
+
+        @inject(container=container)
+        def func(connection: Connection):
+            seen.append(connection)
+            container.unregister(container.get_by_name('Connection'))
+            # The idle instance is closed at once:
+            self.assertEqual(1, len(closed))
+
+        func()
+
+        # The instance that was in use is closed when it is given back:
+        self.assertEqual(2, len(closed))
+        self.assertIn(seen[0], closed)
+
+    def test_inject_here_fails(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='pool')
+        class Connection:
+            pass
+
+        with self.assertRaises(InjectionError):
+            inject_here(Connection, container=container)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(InvalidUsageError):
+            injectable(lifetime='forever')
+        with self.assertRaises(InvalidUsageError):
+            injectable(singleton=True, lifetime='pool')
+        with self.assertRaises(InvalidUsageError):
+            injectable(lifetime='pool', pool_size=(2, 1))
+        with self.assertRaises(InvalidUsageError):
+            injectable(lifetime='pool', pool_size=(0, 0))
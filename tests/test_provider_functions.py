@@ -0,0 +1,173 @@
+from typing import Callable, List
+from unittest import TestCase
+from jacked import inject, injectable
+from jacked._container import Container
+from jacked._exceptions import InvalidUsageError
+from jacked._inject import inject_here, get_candidates
+from jacked.matchers._object import ObjectMatcher
+
+
+class Redis:
+    def __init__(self, url: str):
+        self.url = url
+
+
+class Settings:
+    url = 'redis://localhost'
+
+
+class TestProviderFunctions(TestCase):
+    def test_provider_by_return_annotation(self):
+        container = Container()
+        calls = []
+
+        @injectable(container=container, provides=True)
+        def create_redis() -> Redis:
+            calls.append(1)
+            return Redis('redis://somewhere')
+
+        redis1 = inject_here(Redis, container=container)
+        redis2 = inject_here(Redis, container=container)
+
+        self.assertEqual('redis://somewhere', redis1.url)
+        self.assertIsNot(redis1, redis2)
+        self.assertEqual(2, len(calls))
+
+    def test_provider_with_explicit_type(self):
+        container = Container()
+
+        @injectable(container=container, provides=Redis)
+        def create_redis():
+            return Redis('redis://somewhere')
+
+        self.assertIsInstance(inject_here(Redis, container=container), Redis)
+
+    def test_parameter_with_forward_reference(self):
+        container = Container()
+
+        # Only the return annotation is needed upon decoration:
+        @injectable(container=container, provides=True)
+        @inject(container=container)
+        def create_redis(settings: 'LaterSettings') -> Redis:  # noqa: F821
+            return Redis(settings.url)
+
+        @injectable(container=container)
+        class LaterSettings(Settings):
+            pass
+
+        globals()['LaterSettings'] = LaterSettings
+        try:
+            redis = inject_here(Redis, container=container)
+        finally:
+            del globals()['LaterSettings']
+
+        self.assertEqual('redis://localhost', redis.url)
+
+    def test_singleton_provider(self):
+        container = Container()
+        calls = []
+
+        @injectable(container=container, provides=True, singleton=True)
+        def create_redis() -> Redis:
+            calls.append(1)
+            return Redis('redis://somewhere')
+
+        @inject(container=container)
+        def func(redis1: Redis, redis2: Redis):
+            self.assertIs(redis1, redis2)
+
+        func()
+        func()
+        self.assertEqual(1, len(calls))
+
+    def test_provider_parameters_are_injected(self):
+        container = Container()
+
+        @injectable(container=container)
+        class LocalSettings(Settings):
+            pass
+
+        @injectable(container=container, provides=True)
+        def create_redis(settings: Settings) -> Redis:
+            return Redis(settings.url)
+
+        redis = inject_here(Redis, container=container)
+
+        self.assertEqual('redis://localhost', redis.url)
+
+    def test_provider_is_no_callable_injectable(self):
+        container = Container()
+
+        @injectable(container=container, provides=True)
+        def create_redis() -> Redis:
+            return Redis('redis://somewhere')
+
+        self.assertEqual([], get_candidates(Callable[[], Redis],
+                                            container=container))
+        self.assertEqual(1, len(get_candidates(Redis, container=container)))
+
+    def test_provider_of_subclass(self):
+        container = Container()
+
+        class SentinelRedis(Redis):
+            pass
+
+        @injectable(container=container, provides=True)
+        def create_redis() -> SentinelRedis:
+            return SentinelRedis('redis://sentinel')
+
+        @inject(container=container)
+        def func(redis: List[Redis]):
+            self.assertIsInstance(redis[0], SentinelRedis)
+
+        func()
+
+    def test_invalid_providers(self):
+        with self.assertRaises(InvalidUsageError):
+            @injectable(container=Container(), provides=True)
+            def create_redis():
+                pass
+
+        with self.assertRaises(InvalidUsageError):
+            @injectable(container=Container(), provides=True)
+            class C:
+                pass
+
+        with self.assertRaises(InvalidUsageError):
+            injectable(provides='Redis')
+
+    def test_providers_are_indexed_by_type(self):
+        container = Container()
+        checked = []
+
+        @injectable(container=container, provides=True)
+        def create_redis() -> Redis:
+            return Redis('redis://localhost')
+
+        @inject(container=container)
+        def func(redis: Redis):
+            return redis
+
+        func()
+        matcher = ObjectMatcher()
+        original = ObjectMatcher.is_candidate
+
+        def is_candidate(self, hint, injectable, container_):
+            checked.append(injectable)
+            return original(self, hint, injectable, container_)
+
+        ObjectMatcher.is_candidate = is_candidate
+        try:
+            self.assertIsInstance(func(), Redis)
+            self.assertEqual(1, len(checked))  # Only the match is checked.
+
+            @injectable(container=container)
+            class Other:
+                pass
+
+            checked.clear()
+            self.assertIsInstance(func(), Redis)
+            self.assertEqual(3, len(checked))  # Indexed again.
+        finally:
+            ObjectMatcher.is_candidate = original
+        self.assertTrue(matcher.is_indexed())
@@ -0,0 +1,90 @@
+from typing import List
+from unittest import TestCase
+from jacked import inject, injectable, Named
+from jacked._container import Container
+from jacked._exceptions import InjectionError
+from jacked._inject import inject_here, get_candidates
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+class Db:
+    pass
+
+
+CONTAINER = Container()
+
+
+@injectable(container=CONTAINER, name='primary', priority=1)
+class PrimaryDb(Db):
+    pass
+
+
+@injectable(container=CONTAINER, name='replica')
+class ReplicaDb(Db):
+    pass
+
+
+@injectable(container=CONTAINER, name='not_a_db')
+class NotADb:
+    pass
+
+
+class TestQualifiers(TestCase):
+    def test_named_inject(self):
+
+        @inject(container=CONTAINER)
+        def func(db: Annotated[Db, Named('replica')], default_db: Db):
+            self.assertIsInstance(db, ReplicaDb)
+            self.assertIsInstance(default_db, PrimaryDb)
+
+        func()
+
+    def test_named_inject_here(self):
+        db = inject_here(Annotated[Db, Named('replica')], container=CONTAINER)
+
+        self.assertIsInstance(db, ReplicaDb)
+
+    def test_named_get_candidates(self):
+        candidates = get_candidates(Annotated[Db, Named('primary')],
+                                    container=CONTAINER)
+
+        self.assertEqual(1, len(candidates))
+        self.assertIsInstance(candidates[0], PrimaryDb)
+
+    def test_named_in_list(self):
+
+        @inject(container=CONTAINER)
+        def func(dbs: List[Annotated[Db, Named('replica')]]):
+            self.assertEqual(1, len(dbs))
+            self.assertIsInstance(dbs[0], ReplicaDb)
+
+        func()
+
+    def test_named_in_child_container(self):
+        child = Container(parent=CONTAINER)
+
+        @injectable(container=child, name='replica')
+        class LocalDb(Db):
+            pass
+
+        db = inject_here(Annotated[Db, Named('replica')], container=child)
+        primary = inject_here(Annotated[Db, Named('primary')], container=child)
+
+        self.assertIsInstance(db, LocalDb)
+        self.assertIsInstance(primary, PrimaryDb)
+
+    def test_named_mismatch(self):
+        with self.assertRaises(InjectionError):
+            inject_here(Annotated[Db, Named('not_a_db')], container=CONTAINER)
+        with self.assertRaises(InjectionError):
+            inject_here(Annotated[Db, Named('unknown')], container=CONTAINER)
+
+    def test_named_equality(self):
+        self.assertEqual(Named('x'), Named('x'))
+        self.assertNotEqual(Named('x'), Named('y'))
+        self.assertEqual(hash(Named('x')), hash(Named('x')))
+        self.assertEqual("Named('x')", repr(Named('x')))
@@ -0,0 +1,213 @@
+import asyncio
+from typing import AsyncIterator, Iterator
+from unittest import TestCase
+from unittest.mock import patch
+from jacked import bind, inject, inject_here, injectable
+from jacked._container import Container
+from jacked._exceptions import InjectionError, InvalidUsageError
+
+
+class Connection:
+    pass
+
+
+class Transaction:
+    def __init__(self, connection: Connection):
+        self.connection = connection
+
+
+class TestScoped(TestCase):
+    def test_generator_provider(self):
+        container = Container()
+        events = []
+
+        @injectable(container=container, provides=True)
+        def connection() -> Iterator[Connection]:
+            events.append('open')
+            yield Connection()
+            events.append('close')
+
+        @inject(container=container)
+        def func(conn: Connection):
+            events.append('use')
+            return conn
+
+        self.assertIsInstance(func(), Connection)
+        self.assertEqual(['open', 'use', 'close'], events)
+        self.assertIsNot(func(), func())
+
+    def test_error_is_thrown_into_generator(self):
+        container = Container()
+        events = []
+
+        @injectable(container=container, provides=True)
+        def transaction() -> Iterator[Transaction]:
+            try:
+                yield Transaction(Connection())
+                events.append('commit')
+            except ValueError:
+                events.append('rollback')
+                raise
+
+        @inject(container=container)
+        def func(transaction: Transaction):
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            func()
+        self.assertEqual(['rollback'], events)
+
+    def test_dependencies_are_released_after_dependents(self):
+        container = Container()
+        events = []
+
+        @injectable(container=container, provides=True)
+        def connection() -> Iterator[Connection]:
+            yield Connection()
+            events.append('close connection')
+
+        @injectable(container=container, provides=True)
+        def transaction(connection: Connection) -> Iterator[Transaction]:
+            yield Transaction(connection)
+            events.append('end transaction')
+
+        @inject(container=container)
+        def func(transaction: Transaction):
+            self.assertIsInstance(transaction.connection, Connection)
+
+        func()
+        self.assertEqual(['end transaction', 'close connection'], events)
+
+    def test_context_manager_class(self):
+        container = Container()
+        events = []
+
+        @injectable(container=container, lifetime='scoped')
+        class Lock:
+            def __enter__(self):
+                events.append('acquire')
+                return self
+
+            def __exit__(self, exc_type, exc_val, exc_tb):
+                events.append('release')
+
+        @inject(container=container)
+        def func(lock: Lock):
+            events.append('use')
+
+        func()
+        self.assertEqual(['acquire', 'use', 'release'], events)
+
+    def test_resources_are_released_if_injection_fails(self):
+        container = Container()
+        events = []
+
+        class NotInjectable:
+            pass
+
+        @injectable(container=container, provides=True)
+        def connection() -> Iterator[Connection]:
+            yield Connection()
+            events.append('close')
+
+        @inject(container=container)
+        def func(conn: Connection, obj: NotInjectable):
+            pass
+
+        with self.assertRaises(InjectionError):
+            func()
+        self.assertEqual(['close'], events)
+
+    def test_async_generator_provider(self):
+        container = Container()
+        events = []
+
+        @injectable(container=container, provides=True)
+        async def connection() -> AsyncIterator[Connection]:
+            await asyncio.sleep(0)
+            events.append('open')
+            yield Connection()
+            events.append('close')
+
+        @injectable(container=container, lifetime='scoped')
+        class Session:
+            async def __aenter__(self):
+                events.append('enter')
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                events.append('exit')
+
+        @inject(container=container)
+        async def func(conn: Connection, session: Session):
+            events.append('use')
+            return conn, session
+
+        conn, session = asyncio.new_event_loop().run_until_complete(func())
+
+        self.assertIsInstance(conn, Connection)
+        self.assertIsInstance(session, Session)
+        self.assertEqual(['open', 'enter', 'use', 'exit', 'close'], events)
+
+    def test_sync_resources_in_coroutine_function(self):
+        container = Container()
+        events = []
+
+        @injectable(container=container, provides=True)
+        def connection() -> Iterator[Connection]:
+            yield Connection()
+            events.append('close')
+
+        @inject(container=container)
+        async def func(conn: Connection):
+            return conn
+
+        # AsyncExitStack (Python3.7+) is not needed for sync resources:
+        with patch('jacked._scope._create_async_stack',
+                   side_effect=ImportError):
+            conn = asyncio.new_event_loop().run_until_complete(func())
+
+        self.assertIsInstance(conn, Connection)
+        self.assertEqual(['close'], events)
+
+    def test_injection_outside_of_a_call_fails(self):
+        container = Container()
+
+        @injectable(container=container, provides=True)
+        def connection() -> Iterator[Connection]:
+            yield Connection()
+
+        @injectable(container=container, provides=True)
+        async def transaction() -> AsyncIterator[Transaction]:
+            yield Transaction(Connection())
+
+        @inject(container=container)
+        def func(transaction: Transaction):
+            pass
+
+        with self.assertRaises(InjectionError):
+            inject_here(Connection, container=container)
+        with self.assertRaises(InjectionError):
+            func()
+
+        def use(conn: Connection):
+            pass
+
+        with self.assertRaises(InvalidUsageError):
+            bind(use, container=container)
+
+    def test_invalid_usage(self):
+        with self.assertRaises(InvalidUsageError):
+            @injectable(lifetime='scoped')
+            class NotAContextManager:
+                pass
+
+        with self.assertRaises(InvalidUsageError):
+            @injectable(provides=True, singleton=True)
+            def connection() -> Iterator[Connection]:
+                yield Connection()
+
+        with self.assertRaises(InvalidUsageError):
+            @injectable(provides=True)
+            def untyped_connection() -> Iterator:
+                yield Connection()
@@ -0,0 +1,84 @@
+from unittest import TestCase
+from jacked import injectable
+from jacked._container import Container
+from jacked._inject import inject_here
+
+
+class Base:
+    pass
+
+
+class Mixin:
+    pass
+
+
+class TestSingletons(TestCase):
+    def test_one_instance_for_all_hints(self):
+        container = Container()
+        created = []
+
+        @injectable(container=container, singleton=True)
+        class Service(Base, Mixin):
+            def __init__(self):
+                created.append(self)
+
+        service = inject_here(Service, container=container)
+
+        self.assertIs(service, inject_here(Base, container=container))
+        self.assertIs(service, inject_here(Mixin, container=container))
+        self.assertEqual(1, len(created))
+
+    def test_one_instance_for_all_hints_of_provider(self):
+        container = Container()
+        calls = []
+
+        class Service(Base, Mixin):
+            pass
+
+        @injectable(container=container, singleton=True, provides=True)
+        def provide() -> Service:
+            calls.append(None)
+            return Service()
+
+        service = inject_here(Service, container=container)
+
+        self.assertIs(service, inject_here(Base, container=container))
+        self.assertIs(service, inject_here(Mixin, container=container))
+        self.assertEqual(1, len(calls))
+
+    def test_overlay_shares_instance_for_all_hints(self):
+        container = Container()
+
+        @injectable(container=container, singleton=True)
+        class Service(Base, Mixin):
+            pass
+
+        overlay = Container(parent=container)
+
+        self.assertIs(inject_here(Base, container=container),
+                      inject_here(Mixin, container=overlay))
+
+    def test_set_instance_overrides_hint(self):
+        container = Container()
+
+        @injectable(container=container, singleton=True)
+        class Service(Base, Mixin):
+            pass
+
+        instance = Service()
+        container.set_instance(Base, instance)
+
+        self.assertIs(instance, inject_here(Base, container=container))
+        self.assertIsNot(instance, inject_here(Mixin, container=container))
+
+    def test_replaced_injectable_gets_new_instance(self):
+        container = Container()
+
+        @injectable(container=container, singleton=True)
+        class Service(Base, Mixin):
+            pass
+
+        service = inject_here(Base, container=container)
+        container.replace(container.get_by_name('Service'))
+
+        self.assertIsNot(service, inject_here(Mixin, container=container))
@@ -0,0 +1,100 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+from jacked import injectable
+from jacked._container import Container
+from jacked._exceptions import InvalidUsageError
+from jacked._inject import inject_here
+
+
+CONTAINER = Container()
+
+
+class Greeter:
+    def greet(self) -> str:
+        raise NotImplementedError
+
+
+@injectable(container=CONTAINER, priority=1, meta={'lang': 'en'})
+class EnglishGreeter(Greeter):
+    def greet(self) -> str:
+        return 'hello'
+
+
+@injectable(container=CONTAINER, singleton=True)
+class DutchGreeter(Greeter):
+    def greet(self) -> str:
+        return 'hallo'
+
+
+class Greeting(str):
+    pass
+
+
+@injectable(container=CONTAINER, provides=True)
+def provide_greeting(greeter: Greeter) -> Greeting:
+    return Greeting(greeter.greet())
+
+
+def _init_worker(snapshot):
+    global WORKER_CONTAINER
+    WORKER_CONTAINER = Container()
+    WORKER_CONTAINER.load_snapshot(snapshot)
+
+
+def _greet() -> str:
+    return inject_here(Greeting, container=WORKER_CONTAINER)
+
+
+class TestSnapshot(TestCase):
+    def test_pickled_snapshot_can_be_loaded(self):
+        snapshot = pickle.loads(pickle.dumps(CONTAINER.snapshot()))
+        container = Container()
+        container.load_snapshot(snapshot)
+
+        self.assertEqual(['EnglishGreeter', 'DutchGreeter',
+                          'provide_greeting'],
+                         [i.name for i in container.injectables])
+        self.assertEqual('en', container.get_by_name('EnglishGreeter')
+                         .meta.lang)
+        self.assertEqual('hello', inject_here(Greeting, container=container))
+        self.assertIs(inject_here(DutchGreeter, container=container),
+                      inject_here(DutchGreeter, container=container))
+        self.assertEqual([__name__], snapshot.modules)
+
+    def test_load_snapshot_replaces_registry(self):
+        container = Container()
+
+        @injectable(container=container)
+        class Other:
+            pass
+
+        container.load_snapshot(CONTAINER.snapshot())
+
+        self.assertIsNone(container.get_by_name('Other'))
+        self.assertEqual(3, len(container.injectables))
+
+    def test_snapshot_of_overlay(self):
+        overlay = Container(parent=CONTAINER)
+        overlay.register(CONTAINER.get_by_name('DutchGreeter'))
+
+        self.assertEqual(3, len(overlay.snapshot()))
+
+    def test_load_snapshot_in_spawned_worker(self):
+        snapshot = CONTAINER.snapshot()
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(1, mp_context=context,
+                                 initializer=_init_worker,
+                                 initargs=(snapshot,)) as executor:
+            self.assertEqual('hello', executor.submit(_greet).result(30))
+
+    def test_snapshot_of_local_subject_fails(self):
+        container = Container()
+
+        @injectable(container=container)
+        class Local:
+            pass
+
+        with self.assertRaises(InvalidUsageError):
+            container.snapshot()
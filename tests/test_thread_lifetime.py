@@ -0,0 +1,99 @@
+import gc
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from jacked import inject, injectable
+from jacked._container import Container
+from jacked._inject import inject_here
+
+
+class TestThreadLifetime(TestCase):
+    def test_one_instance_per_thread(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='thread')
+        class Connection:
+            pass
+
+        main1 = inject_here(Connection, container=container)
+        main2 = inject_here(Connection, container=container)
+        other = []
+        thread = threading.Thread(target=lambda: other.append(
+            inject_here(Connection, container=container)))
+        thread.start()
+        thread.join()
+
+        self.assertIs(main1, main2)
+        self.assertIsNot(main1, other[0])
+
+    def test_instance_is_released_when_thread_ends(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='thread')
+        class Connection:
+            pass
+
+        refs = []
+        thread = threading.Thread(target=lambda: refs.append(weakref.ref(
+            inject_here(Connection, container=container))))
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        self.assertIsNone(refs[0]())
+
+    def test_thread_pool_reaches_steady_state(self):
+        container = Container()
+        created = []
+
+        @injectable(container=container, lifetime='thread')
+        class Connection:
+            def __init__(self):
+                created.append(self)
+                self.thread = threading.get_ident()
+
+        @inject(container=container)
+        def handle(request: int, connection: Connection):
+            # An instance never crosses threads:
+            self.assertEqual(threading.get_ident(), connection.thread)
+            return request
+
+        barrier = threading.Barrier(4)
+
+        def warm_up(request: int):
+            barrier.wait(5)  # Make sure that all 4 threads get started.
+            return handle(request)
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(warm_up, range(4)))
+            self.assertEqual(4, len(created))
+            list(executor.map(handle, range(1000)))
+
+        self.assertEqual(4, len(created))
+
+    def test_overlay_shares_instances_of_owner(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='thread')
+        class Connection:
+            pass
+
+        overlay = Container(parent=container)
+
+        self.assertIs(inject_here(Connection, container=container),
+                      inject_here(Connection, container=overlay))
+
+    def test_unregister_drops_instances(self):
+        container = Container()
+
+        @injectable(container=container, lifetime='thread')
+        class Connection:
+            pass
+
+        connection = inject_here(Connection, container=container)
+        injectable_ = container.get_by_name('Connection')
+        container.replace(injectable_)
+
+        self.assertIsNot(connection,
+                         inject_here(Connection, container=container))
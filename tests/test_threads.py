@@ -0,0 +1,106 @@
+import threading
+from typing import List
+from unittest import TestCase
+from jacked import inject, injectable
+from jacked._container import Container
+from jacked._inject import inject_here
+from jacked._injectable import Injectable
+
+
+NUMBER_OF_THREADS = 8
+ITERATIONS = 200
+
+
+class TestThreads(TestCase):
+    def _run_threads(self, target):
+        # Run target in all threads at once and raise the first error.
+        barrier = threading.Barrier(NUMBER_OF_THREADS)
+        errors = []
+
+        def run(index):
+            try:
+                barrier.wait(5)
+                target(index)
+            except BaseException as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=run, args=(i,))
+                   for i in range(NUMBER_OF_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    def test_singleton_is_created_once(self):
+        container = Container()
+        created = []
+
+        @injectable(container=container, singleton=True)
+        class Db:
+            def __init__(self):
+                created.append(self)
+                threading.Event().wait(0.01)  # Widen the race window.
+
+        instances = []
+        self._run_threads(
+            lambda _: instances.append(inject_here(Db, container=container)))
+
+        self.assertEqual(1, len(created))
+        self.assertEqual(1, len({id(instance) for instance in instances}))
+
+    def test_no_lost_registrations(self):
+        container = Container()
+
+        def register(index):
+            for i in range(ITERATIONS):
+                name = 'Impl{}_{}'.format(index, i)
+                container.register(Injectable(
+                    subject=type(name, (), {}), priority=i % 7,
+                    singleton=False, meta={'name': name}))
+
+        self._run_threads(register)
+
+        injectables = container.injectables
+        self.assertEqual(NUMBER_OF_THREADS * ITERATIONS, len(injectables))
+        priorities = [injectable.priority for injectable in injectables]
+        self.assertEqual(sorted(priorities, reverse=True), priorities)
+
+    def test_mixed_workload(self):
+        container = Container()
+
+        class Animal:
+            pass
+
+        @injectable(container=container, singleton=True)
+        class Cat(Animal):
+            pass
+
+        @injectable(container=container)
+        class Dog(Animal):
+            pass
+
+        @inject(container=container)
+        def get_animals(animals: List[Animal], cat: Cat):
+            return animals, cat
+
+        cats = set()
+
+        def work(index):
+            for i in range(ITERATIONS):
+                animals, cat = get_animals()
+                self.assertGreaterEqual(len(animals), 2)
+                cats.add(id(cat))
+                cats.add(id(inject_here(Cat, container=container)))
+                if i % 20 == 0:
+                    name = 'Animal{}_{}'.format(index, i)
+                    container.register(Injectable(
+                        subject=type(name, (Animal,), {}), priority=0,
+                        singleton=False, meta={'name': name}))
+
+        self._run_threads(work)
+
+        self.assertEqual(1, len(cats))
+        self.assertEqual(2 + NUMBER_OF_THREADS * ITERATIONS // 20,
+                         len(inject_here(List[Animal], container=container)))
@@ -0,0 +1,205 @@
+import os
+import py_compile
+import shutil
+import sys
+import tempfile
+import uuid
+from importlib.util import cache_from_source
+from pathlib import Path
+from unittest import TestCase
+from jacked import inject, injectable
+from jacked._container import Container
+from jacked._discover import watch
+from jacked._inject import inject_here
+
+
+CONTAINER = Container()
+OVERLAY = Container(parent=CONTAINER)
+DEPENDENT = Container()
+
+PLUGIN = '''from jacked import injectable
+from tests.test_watch import {container}, Greeter
+
+
+@injectable(container={container}, singleton=True)
+class {name}(Greeter):
+    def greet(self):
+        return {greeting!r}
+'''
+
+
+class Greeter:
+    def greet(self):
+        raise NotImplementedError
+
+
+@injectable(container=CONTAINER, singleton=True)
+class DefaultGreeter(Greeter):
+    def greet(self):
+        return 'default'
+
+
+@injectable(container=DEPENDENT, singleton=True)
+class Consumer:
+    @inject(container=DEPENDENT)
+    def __init__(self, greeter: Greeter):
+        self.greeter = greeter
+
+
+class TestWatch(TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.names = []
+
+    def tearDown(self):
+        for name in self.names:
+            sys.modules.pop(name, None)
+            for container in (CONTAINER, DEPENDENT):
+                injectable_ = container.get_by_name(name.title())
+                if injectable_:
+                    container.unregister(injectable_)
+        shutil.rmtree(str(self.directory))
+
+    def _write(
+            self,
+            greeting: str,
+            name: str = None,
+            container: str = 'CONTAINER') -> str:
+        name = name or 'plugin_{}'.format(uuid.uuid4().hex)
+        if name not in self.names:
+            self.names.append(name)
+        path = self.directory.joinpath(name + '.py')
+        path.write_text(PLUGIN.format(name=name.title(), greeting=greeting,
+                                      container=container))
+        # Make sure that the change is noticed on coarse file systems:
+        mtime = path.stat().st_mtime_ns + len(greeting) * 10 ** 9
+        os.utime(str(path), ns=(mtime, mtime))
+        return name
+
+    def _greet(self, name: str) -> str:
+        subject = CONTAINER.get_by_name(name.title()).subject
+        return inject_here(subject, container=CONTAINER).greet()
+
+    def test_changed_module_is_reloaded(self):
+        name = self._write('hello')
+        other = self._write('hi')
+        watcher = watch(str(self.directory), container=CONTAINER,
+                        interval=None)
+        default = inject_here(DefaultGreeter, container=CONTAINER)
+        other_instance = inject_here(
+            CONTAINER.get_by_name(other.title()).subject, container=CONTAINER)
+        self.assertEqual('hello', self._greet(name))
+
+        self._write('good day', name)
+        reloaded = watcher.poll()
+
+        self.assertEqual([name], [module.__name__ for module in reloaded])
+        self.assertEqual('good day', self._greet(name))
+        # Singletons of other modules are kept:
+        self.assertIs(default, inject_here(DefaultGreeter,
+                                           container=CONTAINER))
+        self.assertIs(other_instance, inject_here(
+            CONTAINER.get_by_name(other.title()).subject, container=CONTAINER))
+        self.assertEqual([], watcher.poll())
+
+    def test_new_and_deleted_modules(self):
+        watcher = watch(str(self.directory), container=CONTAINER,
+                        interval=None)
+        name = self._write('hello')
+
+        self.assertEqual([name], [m.__name__ for m in watcher.poll()])
+        self.assertEqual('hello', self._greet(name))
+
+        self.directory.joinpath(name + '.py').unlink()
+        watcher.poll()
+
+        self.assertIsNone(CONTAINER.get_by_name(name.title()))
+        self.assertEqual([], watcher.modules)
+
+    def test_broken_module_keeps_old_injectables(self):
+        name = self._write('hello')
+        watcher = watch(str(self.directory), container=CONTAINER,
+                        interval=None)
+        path = self.directory.joinpath(name + '.py')
+        path.write_text('def broken(:')
+        os.utime(str(path), ns=(0, 0))
+
+        with self.assertRaises(SyntaxError):
+            watcher.poll()
+
+        self.assertEqual('hello', self._greet(name))
+        self.assertEqual([], watcher.poll())
+
+    def test_injectable_stays_registered_while_reloading(self):
+        name = self._write('hello')
+        watcher = watch(str(self.directory), container=CONTAINER,
+                        interval=None)
+        old = CONTAINER.get_by_name(name.title())
+        path = self.directory.joinpath(name + '.py')
+        extra = '\nSEEN = CONTAINER.get_by_name({!r})\n'.format(name.title())
+        path.write_text(path.read_text() + extra)
+        os.utime(str(path), ns=(0, 0))
+
+        module, = watcher.poll()
+
+        self.assertIs(old, module.SEEN)
+        self.assertIsNot(old, CONTAINER.get_by_name(name.title()))
+        self.assertEqual('hello', self._greet(name))
+
+    def test_cached_bytecode_is_kept(self):
+        name = self._write('hello')
+        watcher = watch(str(self.directory), container=CONTAINER,
+                        interval=None)
+        path = str(self.directory.joinpath(name + '.py'))
+        cached = cache_from_source(path)
+
+        self._write('good day', name)
+        py_compile.compile(path, cfile=cached)
+        watcher.poll()
+
+        self.assertTrue(os.path.exists(cached))
+        self.assertEqual('good day', self._greet(name))
+
+    def test_overlay_leaves_parent_injectables(self):
+        name = self._write('hello')
+        watcher = watch(str(self.directory), container=OVERLAY,
+                        interval=None)
+        parent_injectable = CONTAINER.get_by_name(name.title())
+        path = self.directory.joinpath(name + '.py')
+        path.write_text('def broken(:')
+        os.utime(str(path), ns=(0, 0))
+
+        with self.assertRaises(SyntaxError):
+            watcher.poll()
+
+        self.assertEqual([], OVERLAY.registered_in(name))
+        self.assertEqual([parent_injectable], CONTAINER.registered_in(name))
+        self.assertIs(CONTAINER, OVERLAY.owner_of(parent_injectable))
+
+    def test_dependent_singletons_are_renewed(self):
+        name = self._write('hello', container='DEPENDENT')
+        watcher = watch(str(self.directory), container=DEPENDENT,
+                        interval=None)
+        consumer = inject_here(Consumer, container=DEPENDENT)
+        self.assertEqual('hello', consumer.greeter.greet())
+
+        self._write('good day', name, container='DEPENDENT')
+        watcher.poll()
+        renewed = inject_here(Consumer, container=DEPENDENT)
+
+        self.assertIsNot(consumer, renewed)
+        self.assertEqual('good day', renewed.greeter.greet())
+
+    def test_background_polling(self):
+        name = self._write('hello')
+        watcher = watch(str(self.directory), container=CONTAINER,
+                        interval=0.01)
+        try:
+            self._write('good day', name)
+            for _ in range(500):
+                if self._greet(name) == 'good day':
+                    break
+                watcher._stopped.wait(0.01)
+            self.assertEqual('good day', self._greet(name))
+        finally:
+            watcher.stop()
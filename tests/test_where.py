@@ -0,0 +1,157 @@
+from typing import List
+from unittest import TestCase
+from jacked import (
+    get_candidates,
+    inject,
+    inject_here,
+    inject_many,
+    injectable,
+    Named,
+    Where,
+)
+from jacked._container import Container
+from jacked._exceptions import InjectionError
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+class Db:
+    pass
+
+
+def _create_container(created: list) -> Container:
+    # Return a container with databases that record their construction.
+    container = Container()
+    for name, region, priority in (('eu1', 'eu', 1), ('us1', 'us', 2),
+                                   ('eu2', 'eu', 3)):
+        init = created.append
+        type_ = type(name, (Db,), {'__init__': lambda self: init(self)})
+        injectable(container=container, name=name, priority=priority,
+                   meta={'region': region, 'tier': priority // 2})(type_)
+    return container
+
+
+class TestWhere(TestCase):
+    def test_get_candidates_where(self):
+        created = []
+        container = _create_container(created)
+
+        dbs = get_candidates(Db, container=container, where={'region': 'eu'})
+
+        self.assertEqual(['eu2', 'eu1'], [type(db).__name__ for db in dbs])
+        self.assertEqual(2, len(created))
+
+    def test_inject_here_builds_only_the_chosen_one(self):
+        created = []
+        container = _create_container(created)
+
+        db = inject_here(Db, container=container,
+                         where={'region': 'eu', 'tier': 0})
+
+        self.assertEqual('eu1', type(db).__name__)
+        self.assertEqual(1, len(created))
+
+    def test_no_match(self):
+        container = _create_container([])
+
+        self.assertEqual([], get_candidates(Db, container=container,
+                                            where={'region': 'asia'}))
+        self.assertEqual([], get_candidates(Db, container=container,
+                                            where={'colour': 'red'}))
+        with self.assertRaises(InjectionError):
+            inject_here(Db, container=container, where={'region': 'asia'})
+
+    def test_annotated_qualifier(self):
+        container = _create_container([])
+
+        @inject(container=container)
+        def func(db: Annotated[Db, Where(region='us')],
+                 dbs: List[Annotated[Db, Where({'region': 'eu'})]]):
+            return db, dbs
+
+        db, dbs = func()
+
+        self.assertEqual('us1', type(db).__name__)
+        self.assertEqual(['eu2', 'eu1'], [type(db).__name__ for db in dbs])
+
+    def test_combined_with_named(self):
+        container = _create_container([])
+
+        hint = Annotated[Db, Named('eu1'), Where(region='eu')]
+        self.assertEqual('eu1', type(inject_here(hint,
+                                                 container=container))
+                         .__name__)
+        hint = Annotated[Db, Named('eu1'), Where(region='us')]
+        with self.assertRaises(InjectionError):
+            inject_here(hint, container=container)
+
+    def test_inject_many(self):
+        container = _create_container([])
+
+        eu, us = inject_many([Annotated[Db, Where(region='eu')],
+                              Annotated[Db, Where(region='us')]],
+                             container=container)
+
+        self.assertEqual('eu2', type(eu).__name__)
+        self.assertEqual('us1', type(us).__name__)
+
+    def test_index_follows_registrations(self):
+        container = _create_container([])
+
+        @injectable(container=container, name='eu0', priority=2,
+                    meta={'region': 'eu'})
+        class Db0(Db):
+            pass
+
+        self.assertEqual(['eu2', 'eu0', 'eu1'], [
+            injectable.name for injectable
+            in container.select({'region': 'eu'})])
+
+        container.unregister(container.get_by_name('eu2'))
+
+        self.assertEqual(['eu0', 'eu1'], [
+            injectable.name for injectable
+            in container.select({'region': 'eu'})])
+
+    def test_overlay(self):
+        parent = _create_container([])
+        overlay = Container(parent)
+
+        @injectable(container=overlay, name='eu1', priority=5,
+                    meta={'region': 'us'})
+        class Db1(Db):
+            pass
+
+        self.assertEqual(['eu2'], [injectable.name for injectable
+                                   in overlay.select({'region': 'eu'})])
+        self.assertEqual(['eu1', 'us1'], [
+            injectable.name for injectable
+            in overlay.select({'region': 'us'})])
+
+    def test_unhashable_meta_value(self):
+        container = Container()
+
+        @injectable(container=container, meta={'tags': ['a', 'b']})
+        class Tagged(Db):
+            pass
+
+        db = inject_here(Db, container=container, where={'tags': ['a', 'b']})
+
+        self.assertIsInstance(db, Tagged)
+
+    def test_unhashable_annotated_qualifier(self):
+        container = Container()
+
+        @injectable(container=container, meta={'tags': ['a', 'b']})
+        class Tagged(Db):
+            pass
+
+        @inject(container=container)
+        def func(db: Annotated[Db, Where(tags=['a', 'b'])]):
+            return db
+
+        self.assertIsInstance(func(), Tagged)
+        self.assertEqual(hash(Where(tags=['a'])), hash(Where(tags=['b'])))